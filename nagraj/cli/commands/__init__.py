@@ -1,5 +1,27 @@
 """Commands package for nagraj CLI."""
 
+from nagraj.cli.commands.add import add
+from nagraj.cli.commands.bench import bench
+from nagraj.cli.commands.cache import cache
+from nagraj.cli.commands.doctor import doctor
+from nagraj.cli.commands.gen import gen
+from nagraj.cli.commands.generate import generate
 from nagraj.cli.commands.init import init
+from nagraj.cli.commands.lint import lint
+from nagraj.cli.commands.sync import sync
+from nagraj.cli.commands.validate import validate
+from nagraj.cli.commands.watch import watch
 
-__all__ = ["init"]
+__all__ = [
+    "add",
+    "bench",
+    "cache",
+    "doctor",
+    "gen",
+    "generate",
+    "init",
+    "lint",
+    "sync",
+    "validate",
+    "watch",
+]
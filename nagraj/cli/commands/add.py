@@ -0,0 +1,82 @@
+"""Commands to add domains and bounded contexts to an existing project."""
+
+from pathlib import Path
+from typing import Tuple
+
+import click
+
+project_dir_option = click.option(
+    "--project-dir",
+    default=".",
+    help="Root directory of the generated project (default: current directory)",
+    type=click.Path(file_okay=False, dir_okay=True, path_type=Path),
+)
+
+
+@click.group()
+def add() -> None:
+    """Add domains and bounded contexts to an existing project."""
+    pass
+
+
+@add.command("domain")
+@click.argument("name")
+@click.option(
+    "--context",
+    "contexts",
+    multiple=True,
+    help="Bounded context to create inside the domain (repeatable)",
+)
+@project_dir_option
+def add_domain(name: str, contexts: Tuple[str, ...], project_dir: Path) -> None:
+    """Add a domain named NAME to the project."""
+    from rich.console import Console
+
+    from nagraj.core import scaffold
+    from nagraj.core.logging import logger_service
+
+    console = Console()
+    logger = logger_service.get_logger()
+
+    try:
+        logger.info("Adding domain", domain=name, project_dir=str(project_dir))
+        created = scaffold.add_domain(project_dir, name, contexts)
+    except Exception as e:
+        logger.error("Failed to add domain", error=str(e), domain=name)
+        raise click.ClickException(f"Failed to add domain: {str(e)}")
+
+    for path in created:
+        console.print(f"  [green]created[/] {path}")
+    console.print(f"✨ Added domain {name}")
+
+
+@add.command("context")
+@click.argument("domain")
+@click.argument("name")
+@project_dir_option
+def add_context(domain: str, name: str, project_dir: Path) -> None:
+    """Add a bounded context named NAME to DOMAIN."""
+    from rich.console import Console
+
+    from nagraj.core import scaffold
+    from nagraj.core.logging import logger_service
+
+    console = Console()
+    logger = logger_service.get_logger()
+
+    try:
+        logger.info(
+            "Adding bounded context",
+            domain=domain,
+            context=name,
+            project_dir=str(project_dir),
+        )
+        created = scaffold.add_bounded_context(project_dir, domain, name)
+    except Exception as e:
+        logger.error(
+            "Failed to add bounded context", error=str(e), domain=domain, context=name
+        )
+        raise click.ClickException(f"Failed to add bounded context: {str(e)}")
+
+    console.print(f"  [green]created[/] {created}")
+    console.print(f"✨ Added bounded context {name} to {domain}")
@@ -0,0 +1,152 @@
+"""Commands to benchmark project generation against stored baselines."""
+
+import json
+from pathlib import Path
+from typing import Optional, Tuple
+
+import click
+
+
+@click.group()
+def bench() -> None:
+    """Benchmark project generation and compare against baselines."""
+
+
+@bench.command()
+@click.option(
+    "--output",
+    default=None,
+    help="Write the report to this JSON file, e.g. to store it as a baseline",
+    type=click.Path(file_okay=True, dir_okay=False, path_type=Path),
+)
+@click.option(
+    "--rounds",
+    type=click.IntRange(min=1),
+    default=5,
+    help="Timed rounds per metric (default: 5)",
+)
+@click.option(
+    "--size",
+    "sizes",
+    type=click.IntRange(min=1),
+    multiple=True,
+    help="Bounded contexts of a synthetic project for validate_structure "
+    "(default: 10, 100 and 1000)",
+)
+@click.option(
+    "--select",
+    multiple=True,
+    help="Only run metrics whose name contains this text, may be repeated",
+)
+def run(
+    output: Optional[Path],
+    rounds: int,
+    sizes: Tuple[int, ...],
+    select: Tuple[str, ...],
+) -> None:
+    """Time project generation and print the median of each metric."""
+    from rich.console import Console
+    from rich.table import Table
+
+    from nagraj.core.benchmark import VALIDATE_SIZES, run_benchmarks
+    from nagraj.core.logging import logger_service
+
+    console = Console()
+    logger = logger_service.get_logger()
+
+    try:
+        with console.status("Running benchmarks") as status:
+            report = run_benchmarks(
+                rounds=rounds,
+                sizes=sizes or VALIDATE_SIZES,
+                select=select,
+                progress=lambda name: status.update(f"Running {name}"),
+            )
+    except Exception as e:
+        logger.error("Failed to run benchmarks", error=str(e))
+        raise click.ClickException(f"Failed to run benchmarks: {str(e)}")
+
+    table = Table()
+    table.add_column("metric", no_wrap=True)
+    for column in ("median", "min", "max"):
+        table.add_column(column, justify="right")
+    for name, metric in report["metrics"].items():
+        table.add_row(
+            name,
+            _format_seconds(metric["median"]),
+            _format_seconds(metric["min"]),
+            _format_seconds(metric["max"]),
+        )
+    console.print(table)
+
+    if output is not None:
+        output.write_text(json.dumps(report, indent=2) + "\n")
+        console.print(f"📊 Benchmark report: {output}")
+
+
+@bench.command()
+@click.argument(
+    "baseline",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False, path_type=Path),
+)
+@click.argument(
+    "current",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False, path_type=Path),
+)
+@click.option(
+    "--threshold",
+    type=click.FloatRange(min=0),
+    default=0.25,
+    help="Relative slowdown of a median that counts as a regression (default: 0.25)",
+)
+def compare(baseline: Path, current: Path, threshold: float) -> None:
+    """Compare a benchmark report against a baseline.
+
+    Fails when the median of any metric present in both reports grew by
+    more than the threshold.
+    """
+    from rich.console import Console
+    from rich.table import Table
+
+    from nagraj.core.benchmark import compare_reports
+
+    try:
+        comparisons = compare_reports(
+            json.loads(baseline.read_text()),
+            json.loads(current.read_text()),
+            threshold,
+        )
+    except (ValueError, KeyError) as e:
+        raise click.ClickException(f"Failed to compare benchmarks: {str(e)}")
+
+    table = Table("metric", "baseline", "current", "change")
+    for comparison in comparisons:
+        change = comparison.change
+        if change is None:
+            label = "[dim]n/a[/]"
+        else:
+            style = "red" if comparison.regressed else "green"
+            label = f"[{style}]{change:+.1%}[/]"
+        table.add_row(
+            comparison.name,
+            _format_seconds(comparison.baseline),
+            _format_seconds(comparison.current),
+            label,
+        )
+    Console().print(table)
+
+    regressed = [comparison.name for comparison in comparisons if comparison.regressed]
+    if regressed:
+        raise click.ClickException(
+            f"{len(regressed)} metric(s) regressed by more than {threshold:.0%}: "
+            + ", ".join(regressed)
+        )
+
+
+def _format_seconds(value: Optional[float]) -> str:
+    """Format a duration in seconds for display."""
+    if value is None:
+        return "-"
+    if value < 1:
+        return f"{value * 1000:.2f} ms"
+    return f"{value:.3f} s"
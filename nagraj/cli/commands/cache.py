@@ -0,0 +1,29 @@
+"""Commands to manage the nagraj template cache."""
+
+import click
+
+
+@click.group()
+def cache() -> None:
+    """Manage the compiled template, parsed configuration and audit caches."""
+
+
+@cache.command()
+def clear() -> None:
+    """Remove all compiled templates, parsed configurations and audit results."""
+    from rich.console import Console
+
+    from nagraj.config.loader import get_parse_cache
+    from nagraj.config.settings import get_settings
+    from nagraj.core.cache import TemplateBytecodeCache
+    from nagraj.core.doctor import get_fact_cache
+    from nagraj.core.logging import logger_service
+
+    settings = get_settings()
+    logger_service.get_logger().debug(
+        "Clearing template cache", cache_dir=str(settings.cache_dir)
+    )
+    TemplateBytecodeCache(settings.cache_dir, settings.cache_max_size).clear()
+    get_parse_cache().clear()
+    get_fact_cache().clear()
+    Console().print(f"🧹 Cleared template cache at {settings.cache_dir}")
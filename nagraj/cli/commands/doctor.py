@@ -0,0 +1,103 @@
+"""Command to audit a generated project for performance problems."""
+
+import json
+from dataclasses import asdict
+from pathlib import Path
+from typing import Optional
+
+import click
+
+
+@click.command()
+@click.option(
+    "--project-dir",
+    default=".",
+    help="Root directory of the generated project (default: current directory)",
+    type=click.Path(file_okay=False, dir_okay=True, path_type=Path),
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["text", "json"]),
+    default="text",
+    help="Output format (default: text)",
+)
+@click.option(
+    "--strict",
+    is_flag=True,
+    default=False,
+    help="Also exit with status 1 on warnings",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of worker processes for large projects (default: number of CPUs)",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Analyze every file again instead of reusing cached results",
+)
+@click.pass_context
+def doctor(
+    ctx: click.Context,
+    project_dir: Path,
+    output_format: str,
+    strict: bool,
+    workers: Optional[int],
+    no_cache: bool,
+) -> None:
+    """Find performance problems in the Python code of a project.
+
+    Reports blocking I/O and password hashing inside async functions,
+    dependencies constructed on every request and rows selected before they
+    are written, each with its location and severity. Exits with status 1
+    when errors, or with --strict any findings, are reported.
+    """
+    from rich.console import Console
+    from rich.markup import escape
+
+    from nagraj.core.doctor import ERROR, diagnose_project
+    from nagraj.core.logging import logger_service
+
+    console = Console()
+    logger = logger_service.get_logger()
+
+    try:
+        logger.debug("Auditing project", project_dir=str(project_dir))
+        report = diagnose_project(
+            project_dir, max_workers=workers, use_cache=not no_cache
+        )
+    except Exception as e:
+        logger.error(
+            "Failed to audit project", error=str(e), project_dir=str(project_dir)
+        )
+        raise click.ClickException(f"Failed to audit project: {str(e)}")
+
+    failed = bool(report.findings if strict else report.errors)
+    if output_format == "json":
+        output = {
+            "project_dir": str(project_dir),
+            "files": report.files,
+            "cached": report.cached,
+            "passed": not failed,
+            "findings": [asdict(finding) for finding in report.findings],
+        }
+        click.echo(json.dumps(output))
+    else:
+        for finding in report.findings:
+            style = "red" if finding.severity == ERROR else "yellow"
+            console.print(
+                f"  [{style}]{finding.severity:<7}[/] {escape(str(finding))} "
+                f"[dim]({finding.rule})[/]"
+            )
+        errors = len(report.errors)
+        warnings = len(report.findings) - errors
+        summary = (
+            f"{errors} error(s) and {warnings} warning(s) in {report.files} file(s)"
+        )
+        console.print(f"{'❌' if failed else '✅'} {summary}")
+    if failed:
+        ctx.exit(1)
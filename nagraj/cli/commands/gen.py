@@ -0,0 +1,67 @@
+"""Commands to generate code of an existing project from its models."""
+
+from pathlib import Path
+
+import click
+
+
+@click.group()
+def gen() -> None:
+    """Generate code of an existing project from its models."""
+    pass
+
+
+@gen.command("mappers")
+@click.option(
+    "--project-dir",
+    default=".",
+    help="Root directory of the generated project (default: current directory)",
+    type=click.Path(file_okay=False, dir_okay=True, path_type=Path),
+)
+@click.option(
+    "--check",
+    is_flag=True,
+    default=False,
+    help="Only report out of date mappers and exit with status 1 if any",
+)
+@click.pass_context
+def gen_mappers(ctx: click.Context, project_dir: Path, check: bool) -> None:
+    """Generate the mappers between aggregates and their ORM models.
+
+    Every aggregate with an ORM model of the same name gets a module of
+    straight-line conversion functions in infrastructure/mappers of its
+    bounded context. Run it again after changing a model.
+    """
+    from rich.console import Console
+
+    from nagraj.core.logging import logger_service
+    from nagraj.core.mappers import generate_mappers
+
+    console = Console()
+    logger = logger_service.get_logger()
+
+    try:
+        logger.info("Generating mappers", project_dir=str(project_dir), check=check)
+        mappers = generate_mappers(project_dir, check=check)
+    except Exception as e:
+        logger.error(
+            "Failed to generate mappers", error=str(e), project_dir=str(project_dir)
+        )
+        raise click.ClickException(f"Failed to generate mappers: {str(e)}")
+
+    label = "outdated" if check else "updated"
+    for mapper in mappers:
+        if mapper.changed:
+            console.print(f"  [yellow]{label}[/] {mapper.path}")
+        else:
+            console.print(f"  [dim]unchanged[/] {mapper.path}")
+    changed = sum(mapper.changed for mapper in mappers)
+    if not mappers:
+        console.print("No aggregates with an ORM model found")
+    elif check and changed:
+        console.print(f"❌ {changed} of {len(mappers)} mapper(s) are out of date")
+        ctx.exit(1)
+    elif check:
+        console.print(f"✅ All {len(mappers)} mapper(s) are up to date")
+    else:
+        console.print(f"✨ Updated {changed} of {len(mappers)} mapper(s)")
@@ -0,0 +1,62 @@
+"""Command to generate domains and bounded contexts from a system spec."""
+
+from pathlib import Path
+from typing import Optional
+
+import click
+
+
+@click.command()
+@click.option(
+    "--spec",
+    "spec_path",
+    required=True,
+    help="YAML file describing the domains and bounded contexts of the system",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False, path_type=Path),
+)
+@click.option(
+    "--project-dir",
+    default=".",
+    help="Root directory of the generated project (default: current directory)",
+    type=click.Path(file_okay=False, dir_okay=True, path_type=Path),
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of worker processes (default: number of CPUs)",
+)
+def generate(spec_path: Path, project_dir: Path, workers: Optional[int]) -> None:
+    """Generate every domain and bounded context described in a spec.
+
+    Bounded contexts are generated in dependency order, one level of the
+    dependency graph at a time, with each level rendered in parallel.
+    Contexts that already exist in the project are skipped.
+    """
+    from rich.console import Console
+
+    from nagraj.core.generate import generate_from_spec
+    from nagraj.core.logging import logger_service
+
+    console = Console()
+    logger = logger_service.get_logger()
+
+    try:
+        logger.info(
+            "Generating from spec",
+            spec=str(spec_path),
+            project_dir=str(project_dir),
+        )
+        result = generate_from_spec(spec_path, project_dir, max_workers=workers)
+    except Exception as e:
+        logger.error("Failed to generate from spec", error=str(e), spec=str(spec_path))
+        raise click.ClickException(f"Failed to generate from spec: {str(e)}")
+
+    for index, level in enumerate(result.levels):
+        console.print(f"  [green]level {index}[/] {len(level)} bounded context(s)")
+    for node in result.skipped:
+        console.print(f"  [yellow]skipped[/] {node}")
+    console.print(
+        f"✨ Generated {len(result.domains)} domain(s) and "
+        f"{len(result.contexts)} bounded context(s) in {len(result.levels)} level(s)"
+    )
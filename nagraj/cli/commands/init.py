@@ -1,17 +1,18 @@
 """Command to initialize a new project using nagraj templates."""
 
+import os
 import subprocess
+import uuid
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 import click
-from cookiecutter.main import cookiecutter
-from rich.console import Console
 
-from nagraj.core.logging import logger_service
+if TYPE_CHECKING:
+    from nagraj.core.template import TemplateEngine
 
-console = Console()
-logger = logger_service.get_logger()
+TEMPLATE_NAME = "nagraj-full-project-template"
 
 
 def get_git_config_value(key: str) -> Optional[str]:
@@ -32,10 +33,78 @@ def get_git_config_value(key: str) -> Optional[str]:
         )
         return result.stdout.strip()
     except subprocess.CalledProcessError:
-        logger.debug(f"Failed to get git config value for {key}")
+        from nagraj.core.logging import logger_service
+
+        logger_service.get_logger().debug(f"Failed to get git config value for {key}")
         return None
 
 
+@lru_cache(maxsize=None)
+def resolve_git_config_value(key: str) -> Optional[str]:
+    """Resolve a value from git global config without spawning git.
+
+    The global config files are parsed in-process; the ``git`` subprocess is
+    only used when parsing fails. Results are cached for the life of the
+    process.
+
+    Args:
+        key: The git config key to retrieve
+
+    Returns:
+        The config value if found, None otherwise
+    """
+    from nagraj.core.git_config import (
+        GitConfigError,
+        normalize_key,
+        read_global_git_config,
+    )
+    from nagraj.core.profiling import profile_span
+
+    with profile_span(f"git config {key}", "git"):
+        try:
+            return read_global_git_config().get(normalize_key(key))
+        except GitConfigError:
+            return get_git_config_value(key)
+
+
+def write_project_archive(
+    engine: "TemplateEngine",
+    output_archive: str,
+    archive_format: Optional[str],
+    context: Dict[str, Any],
+) -> None:
+    """Render the project template into an archive file or stdout.
+
+    Args:
+        engine: Template engine to render with
+        output_archive: Archive path, or '-' for stdout
+        archive_format: Archive format, inferred from the path if not given
+        context: Template variables
+    """
+    from nagraj.core.archive import archive_format_for
+
+    if output_archive == "-":
+        stdout = click.get_binary_stream("stdout")
+        engine.generate_archive(TEMPLATE_NAME, stdout, context, archive_format or "zip")
+        stdout.flush()
+        return
+
+    archive_format = archive_format or archive_format_for(output_archive)
+    path = Path(output_archive)
+    if path.exists():
+        raise FileExistsError(f"File already exists: {output_archive}")
+    # Written beside the target and renamed once complete, so that a failed
+    # render leaves no truncated archive behind
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+    try:
+        with open(tmp_path, "xb") as output:
+            engine.generate_archive(TEMPLATE_NAME, output, context, archive_format)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 @click.command()
 @click.option(
     "--project-name",
@@ -50,12 +119,12 @@ def get_git_config_value(key: str) -> Optional[str]:
 )
 @click.option(
     "--project-author-name",
-    default=lambda: get_git_config_value("user.name") or "Noname",
+    default=lambda: resolve_git_config_value("user.name") or "Noname",
     help="Project author name (default: git global user.name or 'Noname')",
 )
 @click.option(
     "--project-author-email",
-    default=lambda: get_git_config_value("user.email") or "noemail@example.com",
+    default=lambda: resolve_git_config_value("user.email") or "noemail@example.com",
     help="Project author email (default: git global user.email or 'noemail@example.com')",
 )
 @click.option(
@@ -73,6 +142,38 @@ def get_git_config_value(key: str) -> Optional[str]:
     default="0.1.0",
     help="Initial version of the project (default: 0.1.0)",
 )
+@click.option(
+    "--runtime-profile",
+    type=click.Choice(["standard", "lean"]),
+    default="standard",
+    help="Implementation of the domain base classes: standard validates every "
+    "assignment, lean skips validation on trusted paths (default: standard)",
+)
+@click.option(
+    "--output-archive",
+    default=None,
+    help="Write the project into a .zip or .tar.gz archive instead of a "
+    "directory, '-' writes to stdout",
+)
+@click.option(
+    "--archive-format",
+    type=click.Choice(["zip", "tar.gz"]),
+    default=None,
+    help="Archive format (default: inferred from --output-archive, zip for stdout)",
+)
+@click.option(
+    "--fsync",
+    type=click.Choice(["none", "end", "per-file"]),
+    default=None,
+    help="How the project is flushed to disk before it is moved into place "
+    "(default: the fsync_policy setting, none)",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Compile templates without using the persistent template cache",
+)
 def init(
     project_name: str,
     project_root_dir: Path,
@@ -81,13 +182,43 @@ def init(
     project_description: str,
     python_version: str,
     version: str,
+    runtime_profile: str,
+    output_archive: Optional[str],
+    archive_format: Optional[str],
+    fsync: Optional[str],
+    no_cache: bool,
 ) -> None:
     """Initialize a new Python project using nagraj templates.
 
     This command creates a new Python project using the nagraj-full-project-template.
     It sets up the basic project structure following best practices and includes
     all necessary configuration files.
+
+    The project is written into a staging directory and renamed into place
+    once complete, so an interrupted run leaves no partial project behind.
+
+    With --runtime-profile lean the domain base classes use slotted value
+    objects, entities that do not validate assignments and domain events
+    without Python validators, with the same public API as the standard ones.
+
+    With --output-archive the project is rendered in memory and streamed into
+    an archive without writing the project directory to disk.
     """
+    from nagraj.core.profiling import profile_span
+
+    # Heavy dependencies are imported here so that other commands and
+    # `nagraj --help` do not pay for them at startup.
+    with profile_span("imports", "import"):
+        from rich.console import Console
+
+        from nagraj.config.settings import get_settings
+        from nagraj.core.logging import logger_service
+        from nagraj.core.template import TemplateEngine, template_engine
+
+    # Keep stdout clean when the archive is streamed to it
+    console = Console(stderr=output_archive == "-")
+    logger = logger_service.get_logger()
+
     try:
         logger.info(
             "Initializing new project",
@@ -96,34 +227,45 @@ def init(
             author=project_author_name,
         )
 
-        # Get the absolute path to the template directory
-        template_dir = (
-            Path(__file__).parent.parent.parent
-            / "templates"
-            / "nagraj-full-project-template"
-        )
+        engine = TemplateEngine(use_cache=False) if no_cache else template_engine
 
-        # Ensure the template directory exists
-        if not template_dir.exists():
+        # Ensure the template exists, either packed or in the template directory
+        if not engine.has_template(TEMPLATE_NAME):
+            template_dir = get_settings().template_path / TEMPLATE_NAME
             logger.error(f"Template directory not found: {template_dir}")
             raise click.ClickException(f"Template directory not found: {template_dir}")
 
-        logger.debug("Using template directory", template_dir=str(template_dir))
-
-        # Create the project using cookiecutter
+        # Create the project using the template engine
         logger.info("Generating project from template")
-        cookiecutter(
-            str(template_dir),
-            output_dir=str(project_root_dir),
-            no_input=True,
-            extra_context={
-                "project_name": project_name,
-                "author_name": project_author_name,
-                "author_email": project_author_email,
-                "project_description": project_description,
-                "python_version": python_version,
-                "version": version,
-            },
+        context = {
+            "project_name": project_name,
+            "author_name": project_author_name,
+            "author_email": project_author_email,
+            "project_description": project_description,
+            "python_version": python_version,
+            "version": version,
+            "runtime_profile": runtime_profile,
+        }
+
+        if output_archive is not None:
+            write_project_archive(engine, output_archive, archive_format, context)
+            logger.success(
+                "Project archive created successfully",
+                project_name=project_name,
+                location=output_archive,
+            )
+            console.print(
+                f"✨ Successfully created project [bold green]{project_name}[/]"
+            )
+            if output_archive != "-":
+                console.print(f"📦 Project archive: {output_archive}")
+            return
+
+        engine.generate_project(
+            TEMPLATE_NAME,
+            output_dir=project_root_dir,
+            context=context,
+            fsync=fsync,
         )
 
         logger.success(
@@ -0,0 +1,61 @@
+"""Command to check the names of a system spec."""
+
+import json
+from dataclasses import asdict
+from pathlib import Path
+
+import click
+
+
+@click.command()
+@click.argument(
+    "spec_path",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False, path_type=Path),
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["text", "json"]),
+    default="text",
+    help="Output format (default: text)",
+)
+@click.pass_context
+def lint(ctx: click.Context, spec_path: Path, output_format: str) -> None:
+    """Check every domain, context, entity and event name of a spec.
+
+    All violations are reported at once. Exits with status 1 when any name
+    breaks the naming rules.
+    """
+    from rich.console import Console
+    from rich.markup import escape
+
+    from nagraj.config.lint import lint_spec
+    from nagraj.config.loader import load_yaml
+    from nagraj.core.logging import logger_service
+
+    console = Console()
+    logger = logger_service.get_logger()
+
+    try:
+        logger.debug("Linting spec", spec=str(spec_path))
+        violations = lint_spec(load_yaml(spec_path))
+    except Exception as e:
+        logger.error("Failed to lint spec", error=str(e), spec=str(spec_path))
+        raise click.ClickException(f"Failed to lint spec: {str(e)}")
+
+    if output_format == "json":
+        report = {
+            "spec": str(spec_path),
+            "valid": not violations,
+            "violations": [asdict(violation) for violation in violations],
+        }
+        click.echo(json.dumps(report))
+    else:
+        for violation in violations:
+            console.print(f"  [red]✗[/] {escape(str(violation))}")
+        if violations:
+            console.print(f"❌ Found {len(violations)} naming violation(s)")
+        else:
+            console.print("✅ All names follow the naming rules")
+    if violations:
+        ctx.exit(1)
@@ -0,0 +1,108 @@
+"""Command to apply template and config changes to an existing project."""
+
+from pathlib import Path
+from typing import Dict, Tuple
+
+import click
+
+
+def parse_overrides(values: Tuple[str, ...]) -> Dict[str, str]:
+    """Parse ``KEY=VALUE`` pairs into a dictionary.
+
+    Args:
+        values: The raw ``--set`` option values
+
+    Returns:
+        The parsed template variable overrides
+    """
+    overrides: Dict[str, str] = {}
+    for value in values:
+        key, separator, item = value.partition("=")
+        if not separator or not key:
+            raise click.BadParameter(
+                f"Expected KEY=VALUE, got {value!r}", param_hint="--set"
+            )
+        overrides[key.strip()] = item
+    return overrides
+
+
+@click.command()
+@click.option(
+    "--project-dir",
+    default=".",
+    help="Root directory of the generated project (default: current directory)",
+    type=click.Path(file_okay=False, dir_okay=True, path_type=Path),
+)
+@click.option(
+    "--set",
+    "overrides",
+    multiple=True,
+    metavar="KEY=VALUE",
+    help="Change a template variable, e.g. --set version=0.2.0",
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    default=False,
+    help="Overwrite files that were modified since they were generated, "
+    "except .nagraj.yaml",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    default=False,
+    help="Show what would change without writing any files",
+)
+def sync(
+    project_dir: Path, overrides: Tuple[str, ...], force: bool, dry_run: bool
+) -> None:
+    """Re-render a project and update only files whose output changed.
+
+    The rendered output is compared against the hashes recorded in the
+    project's manifest. Unchanged files are left untouched, so their
+    modification times and any tool caches depending on them are preserved.
+    """
+    context = parse_overrides(overrides)
+
+    from rich.console import Console
+
+    from nagraj.core.logging import logger_service
+    from nagraj.core.sync import sync_project
+
+    console = Console()
+    logger = logger_service.get_logger()
+
+    try:
+        logger.info("Synchronizing project", project_dir=str(project_dir))
+        result = sync_project(
+            project_dir, overrides=context, force=force, dry_run=dry_run
+        )
+    except Exception as e:
+        logger.error(
+            "Failed to synchronize project",
+            error=str(e),
+            project_dir=str(project_dir),
+        )
+        raise click.ClickException(f"Failed to synchronize project: {str(e)}")
+
+    for label, paths, style in (
+        ("created", result.created, "green"),
+        ("updated", result.updated, "yellow"),
+        ("removed", result.removed, "red"),
+    ):
+        for path in paths:
+            console.print(f"  [{style}]{label:<8}[/] {path}")
+
+    prefix = "Would change" if dry_run else "Changed"
+    changed = len(result.created) + len(result.updated) + len(result.removed)
+    console.print(
+        f"🔄 {prefix} {changed} file(s), {result.unchanged} file(s) unchanged"
+    )
+
+    if result.conflicts:
+        for path in result.conflicts:
+            console.print(f"  [bold red]conflict[/] {path}")
+        raise click.ClickException(
+            f"{len(result.conflicts)} file(s) were modified since they were "
+            "generated; re-run with --force to overwrite them"
+        )
@@ -0,0 +1,87 @@
+"""Command to validate a project's structure."""
+
+import json
+from pathlib import Path
+
+import click
+
+
+@click.command()
+@click.option(
+    "--project-dir",
+    default=".",
+    help="Root directory of the generated project (default: current directory)",
+    type=click.Path(file_okay=False, dir_okay=True, path_type=Path),
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["text", "json"]),
+    default="text",
+    help="Output format, json prints one report object per line (default: text)",
+)
+@click.option(
+    "--watch",
+    is_flag=True,
+    default=False,
+    help="Keep validating and report whenever the result changes",
+)
+@click.option(
+    "--interval",
+    type=click.FloatRange(min=0.1),
+    default=1.0,
+    help="Seconds between validations in watch mode (default: 1.0)",
+)
+@click.pass_context
+def validate(
+    ctx: click.Context,
+    project_dir: Path,
+    output_format: str,
+    watch: bool,
+    interval: float,
+) -> None:
+    """Validate the project structure against its .nagraj.yaml.
+
+    Exits with status 1 when structure errors are found, so it can run as a
+    pre-commit hook.
+    """
+    from rich.console import Console
+
+    from nagraj.core.logging import logger_service
+    from nagraj.core.validate import ValidationReport, validate_project, watch_project
+
+    console = Console()
+    logger = logger_service.get_logger()
+
+    def show(report: ValidationReport) -> None:
+        if output_format == "json":
+            click.echo(json.dumps(report.to_dict()))
+            return
+        for error in report.errors:
+            console.print(f"  [red]✗[/] {error}")
+        if report.valid:
+            console.print("✅ Project structure is valid")
+        else:
+            console.print(f"❌ Found {len(report.errors)} structure error(s)")
+
+    if watch:
+        try:
+            watch_project(project_dir, show, interval=interval)
+        except KeyboardInterrupt:
+            pass
+        return
+
+    try:
+        logger.debug("Validating project structure", project_dir=str(project_dir))
+        report = validate_project(project_dir)
+    except Exception as e:
+        logger.error(
+            "Failed to validate project",
+            error=str(e),
+            project_dir=str(project_dir),
+        )
+        raise click.ClickException(f"Failed to validate project: {str(e)}")
+
+    show(report)
+    if not report.valid:
+        ctx.exit(1)
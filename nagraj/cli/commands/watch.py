@@ -0,0 +1,96 @@
+"""Command to keep a project up to date while its inputs are edited."""
+
+from pathlib import Path
+
+import click
+
+
+@click.command()
+@click.option(
+    "--project-dir",
+    default=".",
+    help="Root directory of the generated project (default: current directory)",
+    type=click.Path(file_okay=False, dir_okay=True, path_type=Path),
+)
+@click.option(
+    "--debounce",
+    type=click.FloatRange(min=0),
+    default=0.2,
+    help="Seconds without changes before re-rendering (default: 0.2)",
+)
+@click.option(
+    "--poll",
+    is_flag=True,
+    default=False,
+    help="Poll for changes instead of using inotify, e.g. on network filesystems",
+)
+@click.option(
+    "--interval",
+    type=click.FloatRange(min=0.1),
+    default=1.0,
+    help="Seconds between polls (default: 1.0)",
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    default=False,
+    help="Overwrite files that were modified since they were generated",
+)
+def watch(
+    project_dir: Path, debounce: float, poll: bool, interval: float, force: bool
+) -> None:
+    """Re-render a project whenever .nagraj.yaml or its templates change.
+
+    New domains and bounded contexts in .nagraj.yaml are generated, changes
+    of the project section re-render the files using them, and edits of the
+    template directory re-render the files rendered from the changed
+    templates. Stop with Ctrl+C.
+    """
+    from rich.console import Console
+
+    from nagraj.core.logging import logger_service
+    from nagraj.core.watch import WatchResult, WatchSession, run_watch
+    from nagraj.core.watcher import PollingWatcher, create_watcher
+
+    console = Console()
+    logger = logger_service.get_logger()
+
+    try:
+        session = WatchSession(project_dir, force=force)
+    except Exception as e:
+        logger.error(
+            "Failed to watch project", error=str(e), project_dir=str(project_dir)
+        )
+        raise click.ClickException(f"Failed to watch project: {str(e)}")
+
+    def show(result: WatchResult) -> None:
+        if result.error is not None:
+            console.print(f"  [red]error[/]    {result.error}")
+            return
+        for path in result.scaffolded:
+            console.print(f"  [green]{'scaffold':<8}[/] {path}")
+        for label, paths, style in (
+            ("created", result.sync.created, "green"),
+            ("updated", result.sync.updated, "yellow"),
+            ("removed", result.sync.removed, "red"),
+            ("conflict", result.sync.conflicts, "bold red"),
+        ):
+            for path in paths:
+                console.print(f"  [{style}]{label:<8}[/] {path}")
+        changed = (
+            len(result.scaffolded)
+            + len(result.sync.created)
+            + len(result.sync.updated)
+            + len(result.sync.removed)
+        )
+        console.print(f"🔄 Changed {changed} path(s)")
+
+    watcher = create_watcher(polling=poll, interval=interval)
+    mode = "polling" if isinstance(watcher, PollingWatcher) else "inotify"
+    console.print(f"👀 Watching {session.config_path} ({mode}), press Ctrl+C to stop")
+    if session.template_dir is not None:
+        console.print(f"👀 Watching templates in {session.template_dir}")
+    try:
+        run_watch(session, watcher, show, debounce=debounce)
+    except KeyboardInterrupt:
+        pass
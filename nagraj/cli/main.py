@@ -1,22 +1,135 @@
 """Main CLI entry point."""
 
+from pathlib import Path
+from typing import Optional
+
 import click
-from rich.console import Console
 
-from nagraj.cli.commands import init
+from nagraj.cli.commands import (
+    add,
+    bench,
+    cache,
+    doctor,
+    gen,
+    generate,
+    init,
+    lint,
+    sync,
+    validate,
+    watch,
+)
+
+
+def report_profile(
+    top: int, output: Optional[Path], profile_format: Optional[str]
+) -> None:
+    """Print the slowest profiled spans and optionally dump the profile.
+
+    Args:
+        top: Number of spans to print
+        output: JSON file to write the profile to
+        profile_format: Either 'chrome' or 'speedscope', inferred from the
+            output file name if not given
+    """
+    from rich.console import Console
+    from rich.table import Table
+
+    from nagraj.core.profiling import stop_profiling
 
-console = Console()
+    profiler = stop_profiling()
+    if profiler is None:
+        return
+
+    total = sum(root.duration for root in profiler.roots if root.thread == 0)
+    table = Table(title=f"Slowest {top} of {profiler.name} ({total * 1000:.1f} ms)")
+    table.add_column("span", no_wrap=True)
+    table.add_column("category")
+    table.add_column("self", justify="right")
+    table.add_column("total", justify="right")
+    for span in profiler.top(top):
+        # Keep the end of long file paths, which names the file
+        name = span.name if len(span.name) <= 60 else f"…{span.name[-59:]}"
+        table.add_row(
+            name,
+            span.category,
+            f"{span.self_time * 1000:.2f} ms",
+            f"{span.duration * 1000:.2f} ms",
+        )
+    # stderr, so that output streamed to stdout stays intact
+    console = Console(stderr=True)
+    console.print(table)
+
+    if output is not None:
+        if profile_format is None:
+            is_speedscope = output.name.endswith(".speedscope.json")
+            profile_format = "speedscope" if is_speedscope else "chrome"
+        profiler.dump(output, profile_format)
+        console.print(f"⏱️  Profile ({profile_format}): {output}")
 
 
 @click.group()
 @click.version_option()
-def cli() -> None:
+@click.option(
+    "--profile",
+    is_flag=True,
+    default=False,
+    help="Time every phase and rendered file and print the slowest at exit",
+)
+@click.option(
+    "--profile-top",
+    type=click.IntRange(min=1),
+    default=20,
+    help="Number of slowest items to print (default: 20)",
+)
+@click.option(
+    "--profile-output",
+    default=None,
+    help="Write the profile to a JSON file, implies --profile",
+    type=click.Path(file_okay=True, dir_okay=False, path_type=Path),
+)
+@click.option(
+    "--profile-format",
+    type=click.Choice(["chrome", "speedscope"]),
+    default=None,
+    help="Format of --profile-output (default: speedscope for *.speedscope.json, "
+    "otherwise chrome trace)",
+)
+@click.pass_context
+def cli(
+    ctx: click.Context,
+    profile: bool,
+    profile_top: int,
+    profile_output: Optional[Path],
+    profile_format: Optional[str],
+) -> None:
     """Nagraj - A CLI tool for generating DDD/CQRS microservices applications."""
-    pass
+    if not (profile or profile_output):
+        return
+
+    from nagraj.core.profiling import start_profiling
+
+    name = f"nagraj {ctx.invoked_subcommand}".strip()
+    profiler = start_profiling(name)
+    # Resources are released in reverse order: the command span is closed
+    # before the report is printed
+    ctx.call_on_close(
+        lambda: report_profile(profile_top, profile_output, profile_format)
+    )
+    ctx.with_resource(profiler.span(name, "command"))
 
 
 # Register commands
+cli.add_command(add)
+cli.add_command(bench)
+cli.add_command(cache)
+cli.add_command(doctor)
+cli.add_command(gen)
+cli.add_command(generate)
 cli.add_command(init)
+cli.add_command(lint)
+cli.add_command(sync)
+cli.add_command(validate)
+cli.add_command(watch)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,181 @@
+"""Naming rules of domains, bounded contexts, entities and events.
+
+Every rule is a precompiled pattern. A name is first matched against a
+single pattern accepting exactly the valid names, so the common case costs
+one regex match; the individual rules only run to explain a rejected name.
+:func:`lint_spec` checks every name of a spec in one pass and reports all
+violations with their locations.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Iterator, List, Optional, Sequence, Tuple
+
+NAME_KINDS = ("domain", "context", "entity", "event")
+
+# A letter or digit, ``\w`` matches exactly the characters str.isalnum()
+# accepts plus the underscore
+_ALNUM = r"[^\W_]"
+# A part of a name, separated by dashes or underscores, that ends in a
+# single "s", allowing words like "address"
+_PLURAL = r"(?<!s)s(?=[-_]|\Z)"
+
+
+class NameRules:
+    """Compiled checks of one kind of name.
+
+    Args:
+        valid: Pattern matching exactly the valid names.
+        empty: Message for an empty name.
+        rules: Patterns finding a violation with their messages, in the
+            order they are reported.
+    """
+
+    def __init__(
+        self, valid: str, empty: str, rules: Sequence[Tuple[str, str]]
+    ) -> None:
+        self._valid = re.compile(valid)
+        self._empty = empty
+        self._rules = [(re.compile(pattern), message) for pattern, message in rules]
+
+    def check(self, name: str) -> Optional[str]:
+        """Return the message of the first rule a name violates, if any."""
+        if self._valid.fullmatch(name):
+            return None
+        if not name:
+            return self._empty
+        for pattern, message in self._rules:
+            if pattern.search(name):
+                return message
+        return None
+
+
+def _identifier_rules(label: str) -> NameRules:
+    """Build the rules of domain, bounded context and entity names."""
+    return NameRules(
+        valid=rf"(?!.*(?:--|__))(?!.*{_PLURAL}){_ALNUM}(?:[\w-]*{_ALNUM})?",
+        empty=f"{label} name cannot be empty",
+        rules=(
+            (
+                r"[^\w-]",
+                f"{label} name can only contain letters, numbers, dashes, "
+                "and underscores",
+            ),
+            (
+                r"--|__",
+                f"{label} name cannot contain consecutive dashes or underscores",
+            ),
+            (
+                r"\A[-_]|[-_]\Z",
+                f"{label} name cannot start or end with a dash or underscore",
+            ),
+            (_PLURAL, f"{label} name parts should be singular"),
+        ),
+    )
+
+
+DOMAIN_RULES = _identifier_rules("Domain")
+CONTEXT_RULES = _identifier_rules("Context")
+ENTITY_RULES = _identifier_rules("Entity")
+EVENT_RULES = NameRules(
+    valid=rf"(?!.*--){_ALNUM}(?:(?:{_ALNUM}|-)*{_ALNUM})?(?:(?<=ed)|(?<=en)|(?<=t))",
+    empty="Event name cannot be empty",
+    rules=(
+        (r" ", "Event name cannot contain spaces"),
+        (r"--", "Event name cannot contain consecutive dashes"),
+        (r"\A-|-\Z", "Event name cannot start or end with a dash"),
+        (r"[^\w-]|_", "Event name can only contain letters, numbers, and dashes"),
+        (
+            r"(?<!ed)(?<!en)(?<!t)\Z",
+            "Event name must be in past tense (e.g., created, written, sent)",
+        ),
+    ),
+)
+
+_RULES = {
+    "domain": DOMAIN_RULES,
+    "context": CONTEXT_RULES,
+    "entity": ENTITY_RULES,
+    "event": EVENT_RULES,
+}
+
+
+@dataclass(frozen=True)
+class LintViolation:
+    """A name that breaks a naming rule."""
+
+    location: str
+    kind: str
+    name: str
+    message: str
+
+    def __str__(self) -> str:
+        return f"{self.location}: {self.message}"
+
+
+class LintError(ValueError):
+    """Raised when names of a spec or configuration break the naming rules."""
+
+    def __init__(self, violations: Sequence[LintViolation]) -> None:
+        self.violations = list(violations)
+        super().__init__(
+            f"Found {len(self.violations)} naming violation(s):\n"
+            + "\n".join(f"  {violation}" for violation in self.violations)
+        )
+
+
+def lint_spec(data: Any, kinds: Sequence[str] = NAME_KINDS) -> List[LintViolation]:
+    """Check every name of a parsed spec or ``.nagraj.yaml``.
+
+    Domains are read from ``domains``, bounded contexts from each domain's
+    ``bounded_contexts``, and entities and events from each context's
+    ``entities`` and ``events``, each given as a mapping keyed by name or
+    as a list of names or of mappings with a ``name``.
+
+    Args:
+        data: The parsed YAML document.
+        kinds: Kinds of names to check, from :data:`NAME_KINDS`.
+
+    Returns:
+        Every violation, in document order.
+    """
+    checks = {kind: _RULES[kind].check for kind in kinds}
+    violations: List[LintViolation] = []
+
+    def check(kind: str, location: str, name: str) -> None:
+        if kind in checks:
+            message = checks[kind](name)
+            if message is not None:
+                violations.append(LintViolation(location, kind, name, message))
+
+    if not isinstance(data, dict):
+        return violations
+    for domain_location, domain_name, domain in _entries(
+        "domains", data.get("domains")
+    ):
+        check("domain", domain_location, domain_name)
+        if not isinstance(domain, dict):
+            continue
+        for context_location, context_name, context in _entries(
+            f"{domain_location}.bounded_contexts", domain.get("bounded_contexts")
+        ):
+            check("context", context_location, context_name)
+            if not isinstance(context, dict):
+                continue
+            for kind, key in (("entity", "entities"), ("event", "events")):
+                for location, name, _ in _entries(
+                    f"{context_location}.{key}", context.get(key)
+                ):
+                    check(kind, location, name)
+    return violations
+
+
+def _entries(location: str, value: Any) -> Iterator[Tuple[str, str, Any]]:
+    """Yield the location, name and value of each entry of a list or mapping."""
+    if isinstance(value, dict):
+        for name, item in value.items():
+            yield f"{location}.{name}", str(name), item
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            name = item.get("name", "") if isinstance(item, dict) else item
+            yield f"{location}[{index}]", str(name), item
@@ -0,0 +1,142 @@
+"""Fast, cached parsing of YAML configuration files.
+
+Parsing uses libyaml's C loader and dumper when PyYAML was built with
+them, and falls back to the pure Python ones otherwise. The parsed data of
+each file is pickled into the cache directory together with the file's
+modification time and size, so loading an unchanged file again skips YAML
+parsing entirely.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Optional, Tuple, Union
+
+import yaml
+
+from nagraj import __version__
+
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+PARSE_CACHE_DIR = "yaml"
+PARSE_CACHE_SUFFIX = ".yaml.pickle"
+
+# Modification time in nanoseconds and size in bytes of a file
+FileStamp = Tuple[int, int]
+
+_MISSING = object()
+
+
+def parse_yaml(text: str) -> Any:
+    """Parse YAML text with the fastest available safe loader."""
+    return yaml.load(text, Loader=SafeLoader)
+
+
+def dump_yaml(data: Any, **kwargs: Any) -> str:
+    """Dump data to YAML text with the fastest available safe dumper."""
+    text: str = yaml.dump(data, Dumper=SafeDumper, **kwargs)
+    return text
+
+
+def file_stamp(path: Union[str, Path]) -> FileStamp:
+    """Return the modification time and size identifying a file's contents."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+class ParseCache:
+    """Parsed YAML files pickled by path, modification time and size.
+
+    Each file has a single entry, which is replaced when the file changes.
+    Unreadable or outdated entries are treated as missing.
+    """
+
+    def __init__(self, directory: Union[str, Path]) -> None:
+        self.directory = Path(directory)
+
+    def load(
+        self,
+        path: Union[str, Path],
+        text: Optional[str] = None,
+        stamp: Optional[FileStamp] = None,
+    ) -> Any:
+        """Return the parsed contents of a YAML file.
+
+        Args:
+            path: The YAML file.
+            text: The file contents if already read, parsed on a cache miss.
+            stamp: The :func:`file_stamp` taken before ``text`` was read.
+
+        Raises:
+            OSError: If the file cannot be read.
+            yaml.YAMLError: If the file is not valid YAML.
+        """
+        path = os.path.abspath(path)
+        if stamp is None:
+            stamp = file_stamp(path)
+        entry = self._get_path(path)
+        data = self._read(entry, path, stamp)
+        if data is _MISSING:
+            if text is None:
+                text = Path(path).read_text()
+            data = parse_yaml(text)
+            self._write(entry, path, stamp, data)
+        return data
+
+    def clear(self) -> None:
+        """Remove every cached file."""
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if entry.name.endswith(PARSE_CACHE_SUFFIX):
+                        Path(entry.path).unlink(missing_ok=True)
+        except FileNotFoundError:
+            pass
+
+    def _read(self, entry: Path, path: str, stamp: FileStamp) -> Any:
+        """Read the data of a cache entry if it matches the file."""
+        try:
+            with entry.open("rb") as f:
+                header, data = pickle.load(f)
+        except FileNotFoundError:
+            return _MISSING
+        except Exception:
+            # Corrupt or written by an incompatible version
+            return _MISSING
+        if header != (__version__, path, stamp):
+            return _MISSING
+        return data
+
+    def _write(self, entry: Path, path: str, stamp: FileStamp, data: Any) -> None:
+        """Write a cache entry, ignoring errors since caching is optional."""
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(((__version__, path, stamp), data), f)
+            os.replace(tmp_name, entry)
+        except (OSError, pickle.PicklingError):
+            Path(tmp_name).unlink(missing_ok=True)
+
+    def _get_path(self, path: str) -> Path:
+        """Return the cache entry path for a file."""
+        key = hashlib.sha256(path.encode()).hexdigest()
+        return self.directory / f"{key}{PARSE_CACHE_SUFFIX}"
+
+
+def get_parse_cache() -> ParseCache:
+    """Return the parse cache in the configured cache directory."""
+    from nagraj.config.settings import get_settings
+
+    return ParseCache(get_settings().cache_dir / PARSE_CACHE_DIR)
+
+
+def load_yaml(path: Union[str, Path]) -> Any:
+    """Load a YAML file through the parse cache."""
+    return get_parse_cache().load(path)
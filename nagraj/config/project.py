@@ -0,0 +1,331 @@
+"""Reading and in-place editing of a project's ``.nagraj.yaml``."""
+
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Union, cast
+
+import yaml
+
+from nagraj.config.lint import LintError, lint_spec
+from nagraj.config.loader import file_stamp, get_parse_cache, load_yaml, parse_yaml
+from nagraj.config.schema import NagrajProjectConfig
+
+PROJECT_CONFIG_FILE = ".nagraj.yaml"
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S UTC"
+
+# Layers listed for every bounded context in a generated .nagraj.yaml
+CONTEXT_LAYERS = ["aggregates", "entities", "value_objects", "repositories", "services"]
+
+
+def format_timestamp(value: datetime) -> str:
+    """Format a timestamp the way generated projects store it."""
+    return value.astimezone(UTC).strftime(TIMESTAMP_FORMAT)
+
+
+def parse_timestamp(value: Any) -> datetime:
+    """Parse a timestamp stored in ``.nagraj.yaml``."""
+    if isinstance(value, datetime):
+        return value if value.tzinfo else value.replace(tzinfo=UTC)
+    try:
+        return datetime.strptime(str(value), TIMESTAMP_FORMAT).replace(tzinfo=UTC)
+    except ValueError:
+        return datetime.fromisoformat(str(value))
+
+
+def _named_entries(location: str, value: Any) -> Dict[str, Dict[str, Any]]:
+    """Key the entries of a spec collection by name.
+
+    Entries are given as a mapping keyed by name, or as a list of names or
+    of mappings with a ``name``, like :func:`~nagraj.config.lint.lint_spec`
+    accepts them.
+
+    Raises:
+        ValueError: If an entry is not a mapping or has no unique name.
+    """
+    if not value:
+        return {}
+    if isinstance(value, dict):
+        items = list(value.items())
+    elif isinstance(value, list):
+        items = [
+            (item.get("name"), item) if isinstance(item, dict) else (item, None)
+            for item in value
+        ]
+    else:
+        raise ValueError(f"{location} must be a mapping or a list")
+    entries: Dict[str, Dict[str, Any]] = {}
+    for name, item in items:
+        if not isinstance(name, str) or not name:
+            raise ValueError(f"Entry of {location} without a name: {item!r}")
+        if name in entries:
+            raise ValueError(f"Duplicate entry {name!r} in {location}")
+        if item is not None and not isinstance(item, dict):
+            raise ValueError(f"{location}.{name} must be a mapping")
+        entries[name] = dict(item or {})
+    return entries
+
+
+def _context_lines(context_names: Iterable[str]) -> List[str]:
+    """Return the ``.nagraj.yaml`` lines describing bounded contexts."""
+    lines: List[str] = []
+    for context_name in context_names:
+        lines.append(f"{context_name}:")
+        lines.extend(f"  {layer}: []" for layer in CONTEXT_LAYERS)
+    return lines
+
+
+def load_project_spec(path: Union[str, Path]) -> NagrajProjectConfig:
+    """Load a system specification into a project configuration.
+
+    Domain and bounded context names default to their mapping keys, and
+    missing timestamps default to the current time.
+
+    Raises:
+        FileNotFoundError: If the spec file does not exist.
+        LintError: If any domain, context, entity or event name breaks the
+            naming rules, listing every violation.
+        ValueError: If the spec is not a mapping or fails validation.
+    """
+    path = Path(path)
+    if not path.is_file():
+        raise FileNotFoundError(f"Spec file not found: {path}")
+    data = load_yaml(path)
+    if not isinstance(data, dict):
+        raise ValueError(f"Spec file {path} must contain a mapping")
+    violations = lint_spec(data)
+    if violations:
+        raise LintError(violations)
+
+    now = datetime.now(UTC)
+    domains = {}
+    for name, domain in _named_entries("domains", data.get("domains")).items():
+        contexts = {
+            context: {"name": context, **context_data}
+            for context, context_data in _named_entries(
+                f"domains.{name}.bounded_contexts", domain.get("bounded_contexts")
+            ).items()
+        }
+        domains[name] = {**domain, "name": name, "bounded_contexts": contexts}
+    return NagrajProjectConfig.model_validate(
+        {
+            **data,
+            "created_at": parse_timestamp(data.get("created_at") or now),
+            "updated_at": parse_timestamp(data.get("updated_at") or now),
+            "name": data.get("name") or path.stem,
+            "domains": domains,
+        }
+    )
+
+
+class ProjectConfigFile:
+    """A project's ``.nagraj.yaml`` that can be edited without reformatting it.
+
+    Edits are applied as text insertions located through the YAML node tree,
+    so comments, key order and formatting elsewhere in the file are kept.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        # Stamped before reading, so that a concurrent edit invalidates the
+        # parse cache entry instead of being hidden by it
+        self._stamp = file_stamp(self.path)
+        self.text = self._loaded_text = self.path.read_text()
+
+    @classmethod
+    def find(cls, project_dir: Union[str, Path]) -> "ProjectConfigFile":
+        """Open the ``.nagraj.yaml`` of a project directory.
+
+        Raises:
+            FileNotFoundError: If the project has no ``.nagraj.yaml``.
+        """
+        path = Path(project_dir) / PROJECT_CONFIG_FILE
+        if not path.is_file():
+            raise FileNotFoundError(f"No {PROJECT_CONFIG_FILE} found in {project_dir}")
+        return cls(path)
+
+    def to_config(self) -> NagrajProjectConfig:
+        """Build a project configuration from the file contents.
+
+        Unedited contents are parsed through the parse cache.
+
+        Raises:
+            LintError: If any domain name breaks the naming rules.
+        """
+        if self.text is self._loaded_text:
+            data = get_parse_cache().load(self.path, self.text, self._stamp)
+        else:
+            data = parse_yaml(self.text)
+        data = data or {}
+        violations = lint_spec(data, kinds=("domain",))
+        if violations:
+            raise LintError(violations)
+        project = data.get("project") or {}
+        domains = {}
+        for name, domain in (data.get("domains") or {}).items():
+            contexts = (domain or {}).get("bounded_contexts") or {}
+            domains[name] = {
+                "name": name,
+                "bounded_contexts": {
+                    context: {"name": context} for context in contexts
+                },
+            }
+        now = datetime.now(UTC)
+        return NagrajProjectConfig.model_validate(
+            {
+                "version": str(data.get("version", "1.0")),
+                "created_at": parse_timestamp(data.get("created_at") or now),
+                "updated_at": parse_timestamp(data.get("updated_at") or now),
+                "name": project.get("name") or self.path.parent.name,
+                "description": project.get("description"),
+                "author": project.get("author"),
+                "domains": domains,
+            }
+        )
+
+    def add_domain(self, domain_name: str, context_names: Iterable[str] = ()) -> None:
+        """Add a domain entry, with optional bounded contexts, under ``domains``."""
+        self.add_domains({domain_name: context_names})
+
+    def add_domains(self, domains: Mapping[str, Iterable[str]]) -> None:
+        """Add several domain entries, with their bounded contexts, in a single edit.
+
+        Args:
+            domains: Bounded context names keyed by the name of each new domain.
+        """
+        root = self._compose()
+        if self._get_key(root, "domains") is None:
+            if self.text and not self.text.endswith("\n"):
+                self.text += "\n"
+            self.text += "domains:\n"
+            root = self._compose()
+        assert root is not None
+        lines: List[str] = []
+        for domain_name, context_names in domains.items():
+            contexts = [f"    {line}" for line in _context_lines(context_names)]
+            lines.append(f"{domain_name}:")
+            if contexts:
+                lines += ["  bounded_contexts:", *contexts]
+            else:
+                lines.append("  bounded_contexts: {}")
+        if lines:
+            self._insert_entry(root, "domains", lines)
+
+    def add_bounded_context(self, domain_name: str, context_name: str) -> None:
+        """Add a bounded context entry under a domain's ``bounded_contexts``."""
+        self.add_bounded_contexts(domain_name, [context_name])
+
+    def add_bounded_contexts(
+        self, domain_name: str, context_names: Iterable[str]
+    ) -> None:
+        """Add several bounded context entries to a domain in a single edit."""
+        domains = self._get_value(self._compose(), "domains")
+        if domains is None or self._get_key(domains, domain_name) is None:
+            raise ValueError(f"Domain {domain_name} does not exist in {self.path}")
+        domain = self._get_value(domains, domain_name)
+        if self._get_key(domain, "bounded_contexts") is None:
+            self._insert_entry(domains, domain_name, ["bounded_contexts: {}"])
+            domains = self._get_value(self._compose(), "domains")
+            domain = self._get_value(domains, domain_name)
+        assert domain is not None
+        self._insert_entry(domain, "bounded_contexts", _context_lines(context_names))
+
+    def set_updated_at(self, value: datetime) -> None:
+        """Replace the ``updated_at`` timestamp."""
+        node = self._get_value(self._compose(), "updated_at")
+        if isinstance(node, yaml.ScalarNode):
+            self._replace(
+                node.start_mark.index,
+                node.end_mark.index,
+                f'"{format_timestamp(value)}"',
+            )
+
+    def save(self) -> None:
+        """Write the edited file back to disk."""
+        self.path.write_text(self.text)
+
+    def _compose(self) -> Optional[yaml.Node]:
+        """Parse the current text into a YAML node tree."""
+        # The pure Python loader, since libyaml marks count bytes rather than
+        # characters and the edits index into the text
+        node: Optional[yaml.Node] = yaml.compose(self.text, Loader=yaml.SafeLoader)
+        return node
+
+    @staticmethod
+    def _get_key(node: Optional[yaml.Node], key: str) -> Optional[yaml.Node]:
+        """Return the key node for ``key`` of a mapping node."""
+        if isinstance(node, yaml.MappingNode):
+            for key_node, _ in node.value:
+                if key_node.value == key:
+                    return cast(yaml.Node, key_node)
+        return None
+
+    @staticmethod
+    def _get_value(node: Optional[yaml.Node], key: str) -> Optional[yaml.Node]:
+        """Return the value node for ``key`` of a mapping node."""
+        if isinstance(node, yaml.MappingNode):
+            for key_node, value_node in node.value:
+                if key_node.value == key:
+                    return cast(yaml.Node, value_node)
+        return None
+
+    def _insert_entry(self, parent: yaml.Node, key: str, lines: List[str]) -> None:
+        """Insert a block of lines as a new entry of the mapping under ``key``.
+
+        Args:
+            parent: Mapping node holding the target mapping.
+            key: Key of the target mapping inside ``parent``.
+            lines: Entry lines, indented relative to the entry itself.
+        """
+        key_node = self._get_key(parent, key)
+        target = self._get_value(parent, key)
+        if key_node is None or target is None:
+            raise ValueError(f"Missing {key!r} in {self.path}")
+
+        if (
+            isinstance(target, yaml.MappingNode)
+            and target.value
+            and not target.flow_style
+        ):
+            # Append after the last entry of a block mapping
+            indent = target.value[0][0].start_mark.column
+            position = self._end_index(target)
+            block = "".join(f"{' ' * indent}{line}\n" for line in lines)
+            if self.text[position - 1 : position] == "\n":
+                self._replace(position, position, block)
+            else:
+                self._replace(position, position, "\n" + block.rstrip("\n"))
+            return
+
+        is_empty = (isinstance(target, yaml.MappingNode) and not target.value) or (
+            isinstance(target, yaml.ScalarNode) and target.tag.endswith(":null")
+        )
+        if not is_empty:
+            raise ValueError(f"Cannot add an entry to {key!r} in {self.path}")
+
+        # Replace an empty value (`key:` or `key: {}`) with a block mapping
+        indent = key_node.start_mark.column + 2
+        start = key_node.end_mark.index
+        end = self.text.find("\n", start)
+        end = len(self.text) if end == -1 else end
+        block = "".join(f"\n{' ' * indent}{line}" for line in lines)
+        self._replace(start, end, ":" + block)
+
+    @staticmethod
+    def _end_index(node: yaml.Node) -> int:
+        """Return the text index right after the last value inside a node.
+
+        Block collections end at the start of the following token, so the
+        last leaf value is used instead.
+        """
+        while (
+            isinstance(node, (yaml.MappingNode, yaml.SequenceNode))
+            and node.value
+            and not node.flow_style
+        ):
+            last = node.value[-1]
+            node = last[1] if isinstance(node, yaml.MappingNode) else last
+        return int(node.end_mark.index)
+
+    def _replace(self, start: int, end: int, value: str) -> None:
+        """Replace a span of the text."""
+        self.text = self.text[:start] + value + self.text[end:]
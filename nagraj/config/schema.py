@@ -1,13 +1,17 @@
 """Schema definitions for nagraj project configuration."""
 
+import os
 from datetime import UTC, datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import yaml
 from pydantic import BaseModel, Field
 
+from nagraj.config.lint import DOMAIN_RULES, ENTITY_RULES, EVENT_RULES
+from nagraj.config.loader import SafeDumper
+
 
 class DomainType(str, Enum):
     """Type of domain in DDD architecture."""
@@ -28,7 +32,9 @@ def setup_yaml_representers() -> None:
         """Represent DomainType enum as a string."""
         return dumper.represent_str(str(data))
 
-    yaml.add_representer(DomainType, represent_domain_type, Dumper=yaml.SafeDumper)
+    # The libyaml dumper keeps its own representers
+    for dumper in {yaml.SafeDumper, SafeDumper}:
+        yaml.add_representer(DomainType, represent_domain_type, Dumper=dumper)
 
 
 def validate_entity_name(name: str) -> tuple[bool, str]:
@@ -40,39 +46,8 @@ def validate_entity_name(name: str) -> tuple[bool, str]:
     Returns:
         A tuple of (is_valid, error_message).
     """
-    if not name:
-        return False, "Entity name cannot be empty"
-
-    # Check for invalid characters
-    if any(c for c in name if not c.isalnum() and c not in "-_"):
-        return (
-            False,
-            "Entity name can only contain letters, numbers, dashes, and underscores",
-        )
-
-    # Check for spaces
-    if " " in name:
-        return False, "Entity name cannot contain spaces"
-
-    # Check for consecutive dashes or underscores
-    if "--" in name or "__" in name:
-        return False, "Entity name cannot contain consecutive dashes or underscores"
-
-    # Check for starting/ending with dash or underscore
-    if name.startswith(("-", "_")) or name.endswith(("-", "_")):
-        return False, "Entity name cannot start or end with a dash or underscore"
-
-    # Check for plural form
-    parts = name.split("-")
-    for part in parts:
-        subparts = part.split("_")
-        for subpart in subparts:
-            if subpart.endswith("s") and not subpart.endswith(
-                "ss"
-            ):  # Allow words like 'address'
-                return False, "Entity name parts should be singular"
-
-    return True, ""
+    error = ENTITY_RULES.check(name)
+    return error is None, error or ""
 
 
 def validate_event_name(name: str) -> tuple[bool, str]:
@@ -90,27 +65,8 @@ def validate_event_name(name: str) -> tuple[bool, str]:
     Returns:
         A tuple of (is_valid, error_message).
     """
-    if not name:
-        return False, "Event name cannot be empty"
-
-    if " " in name:
-        return False, "Event name cannot contain spaces"
-
-    if "--" in name:
-        return False, "Event name cannot contain consecutive dashes"
-
-    if name.startswith("-") or name.endswith("-"):
-        return False, "Event name cannot start or end with a dash"
-
-    # Check for valid characters (letters, numbers, single dashes)
-    if not all(c.isalnum() or c == "-" for c in name):
-        return False, "Event name can only contain letters, numbers, and dashes"
-
-    # Verify past tense (this is a simple check, you might want to enhance it)
-    if not any(name.endswith(suffix) for suffix in ["ed", "en", "t"]):
-        return False, "Event name must be in past tense (e.g., created, written, sent)"
-
-    return True, ""
+    error = EVENT_RULES.check(name)
+    return error is None, error or ""
 
 
 class BoundedContextConfig(BaseModel):
@@ -141,39 +97,8 @@ class DomainConfig(BaseModel):
         Returns:
             A tuple of (is_valid, error_message).
         """
-        if not name:
-            return False, "Domain name cannot be empty"
-
-        # Check for invalid characters
-        if any(c for c in name if not c.isalnum() and c not in "-_"):
-            return (
-                False,
-                "Domain name can only contain letters, numbers, dashes, and underscores",
-            )
-
-        # Check for spaces
-        if " " in name:
-            return False, "Domain name cannot contain spaces"
-
-        # Check for consecutive dashes or underscores
-        if "--" in name or "__" in name:
-            return False, "Domain name cannot contain consecutive dashes or underscores"
-
-        # Check for starting/ending with dash or underscore
-        if name.startswith(("-", "_")) or name.endswith(("-", "_")):
-            return False, "Domain name cannot start or end with a dash or underscore"
-
-        # Check for plural form
-        parts = name.split("-")
-        for part in parts:
-            subparts = part.split("_")
-            for subpart in subparts:
-                if subpart.endswith("s") and not subpart.endswith(
-                    "ss"
-                ):  # Allow words like 'address'
-                    return False, "Domain name parts should be singular"
-
-        return True, ""
+        error = DOMAIN_RULES.check(name)
+        return error is None, error or ""
 
     @property
     def pascal_case_name(self) -> str:
@@ -267,6 +192,11 @@ class NagrajProjectConfig(BaseModel):
     def validate_structure(self, project_path: str) -> List[str]:
         """Validate project structure against DDD standards.
 
+        The expected paths are listed first and the project is then walked
+        once with ``os.scandir``, descending only into directories on the
+        way to an expected path, so the cost does not grow with one stat
+        call per expected path.
+
         Args:
             project_path: Path to the project root directory.
 
@@ -287,97 +217,158 @@ class NagrajProjectConfig(BaseModel):
             "src/shared/base",
             "src/domains",
         ]
-        for dir_path in required_dirs:
-            if not (root / dir_path).is_dir():
-                errors.append(f"Missing required directory: {dir_path}")
-
-        # Check base classes
         base_files = {
             "base_entity.py": "entity",
             "base_value_object.py": "value_object",
             "base_aggregate_root.py": "aggregate_root",
             "base_domain_event.py": "domain_event",
         }
+        wanted = set(required_dirs)
+        wanted.update(f"src/shared/base/{file_name}" for file_name in base_files)
+        for domain_name, domain_config in self.domains.items():
+            domain_path = f"src/domains/{domain_name}"
+            wanted.add(domain_path)
+            for context_name, context_config in domain_config.bounded_contexts.items():
+                context_path = f"{domain_path}/{context_name}"
+                wanted.add(context_path)
+                wanted.update(
+                    f"{context_path}/{dir_path}"
+                    for dir_path in self._context_dirs(context_config)
+                )
+        dirs, files = _scan_paths(root, wanted)
+
+        for dir_path in required_dirs:
+            if dir_path not in dirs:
+                errors.append(f"Missing required directory: {dir_path}")
+
+        # Check base classes
         for file_name, class_type in base_files.items():
-            base_file = root / "src" / "shared" / "base" / file_name
-            if not base_file.is_file():
+            if f"src/shared/base/{file_name}" not in files:
                 errors.append(f"Missing required file: {file_name}")
             elif class_type in self.base_classes:
                 # TODO: Add content validation to ensure base class matches configuration
                 pass
 
         # Validate domains
-        domains_dir = root / "src" / "domains"
-        if domains_dir.is_dir():
+        if "src/domains" in dirs:
             # Check configured domains exist
             for domain_name, domain_config in self.domains.items():
-                domain_path = domains_dir / domain_name
-                if not domain_path.is_dir():
+                if f"src/domains/{domain_name}" not in dirs:
                     errors.append(f"Missing required directory: domains/{domain_name}")
                 else:
                     # Validate domain structure
-                    errors.extend(
-                        self._validate_domain_structure(domain_path, domain_config)
-                    )
+                    errors.extend(self._validate_domain_structure(dirs, domain_config))
 
         return errors
 
     def _validate_domain_structure(
-        self, domain_path: Path, domain_config: DomainConfig
+        self, dirs: Set[str], domain_config: DomainConfig
     ) -> List[str]:
         """Validate the structure of a domain directory.
 
         Args:
-            domain_path: Path to the domain directory.
+            dirs: Existing directories, relative to the project root.
             domain_config: Configuration for the domain.
 
         Returns:
             List of validation errors.
         """
         errors: List[str] = []
+        domain_path = f"src/domains/{domain_config.name}"
 
         # Check bounded contexts
         for context_name, context_config in domain_config.bounded_contexts.items():
-            context_path = domain_path / context_name
-            if not context_path.is_dir():
+            context_path = f"{domain_path}/{context_name}"
+            if context_path not in dirs:
                 errors.append(
                     f"Missing required directory: domains/{domain_config.name}/{context_name}"
                 )
-            else:
-                # Check bounded context structure
-                required_dirs = [
-                    "domain/entities",
-                    "domain/value_objects",
-                    "application/commands",
-                    "application/queries",
-                ]
+                continue
 
-                # Add interface directories if has_api is True
-                if context_config.has_api:
-                    required_dirs.extend(
-                        [
-                            "interfaces/fastapi/routes",
-                            "interfaces/fastapi/controllers",
-                            "interfaces/fastapi/schemas",
-                        ]
+            # Check bounded context structure
+            for dir_path in self._context_dirs(context_config):
+                if f"{context_path}/{dir_path}" not in dirs:
+                    errors.append(
+                        f"Missing required directory: domains/{domain_config.name}/{context_name}/{dir_path}"
                     )
 
-                # Add infrastructure directories if has_persistence is True
-                if context_config.has_persistence:
-                    required_dirs.extend(
-                        [
-                            "infrastructure/repositories",
-                            "infrastructure/migrations",
-                        ]
-                    )
+        return errors
 
-                for dir_path in required_dirs:
-                    if not (context_path / dir_path).is_dir():
-                        errors.append(
-                            f"Missing required directory: domains/{domain_config.name}/{context_name}/{dir_path}"
-                        )
+    @staticmethod
+    def _context_dirs(context_config: BoundedContextConfig) -> List[str]:
+        """Return the directories a bounded context must contain."""
+        required_dirs = [
+            "domain/entities",
+            "domain/value_objects",
+            "application/commands",
+            "application/queries",
+        ]
 
-        return errors
+        # Add interface directories if has_api is True
+        if context_config.has_api:
+            required_dirs.extend(
+                [
+                    "interfaces/fastapi/routes",
+                    "interfaces/fastapi/controllers",
+                    "interfaces/fastapi/schemas",
+                ]
+            )
+
+        # Add infrastructure directories if has_persistence is True
+        if context_config.has_persistence:
+            required_dirs.extend(
+                [
+                    "infrastructure/repositories",
+                    "infrastructure/migrations",
+                ]
+            )
+        return required_dirs
+
+
+def _scan_paths(root: Path, wanted: Set[str]) -> Tuple[Set[str], Set[str]]:
+    """Find which of the wanted paths exist with a single directory walk.
+
+    Only directories leading to a wanted path are listed. Entry types come
+    from ``os.scandir`` and, like ``Path.is_dir``, follow symlinks.
+
+    Args:
+        root: Directory the wanted paths are relative to.
+        wanted: POSIX paths relative to ``root``.
+
+    Returns:
+        A tuple of (existing wanted directories, existing wanted files).
+    """
+    ancestors = {""}
+    for path in wanted:
+        while "/" in path:
+            path = path.rpartition("/")[0]
+            if path in ancestors:
+                break
+            ancestors.add(path)
+
+    dirs: Set[str] = set()
+    files: Set[str] = set()
+    pending = [("", str(root))]
+    while pending:
+        directory, os_path = pending.pop()
+        prefix = f"{directory}/" if directory else ""
+        try:
+            with os.scandir(os_path) as entries:
+                for entry in entries:
+                    path = prefix + entry.name
+                    if path in ancestors:
+                        if entry.is_dir():
+                            pending.append((path, entry.path))
+                            if path in wanted:
+                                dirs.add(path)
+                    elif path in wanted:
+                        if entry.is_dir():
+                            dirs.add(path)
+                        elif entry.is_file():
+                            files.add(path)
+        except OSError:
+            continue
+    return dirs, files
 
 
 # Set up YAML representers
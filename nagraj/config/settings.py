@@ -1,10 +1,13 @@
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Literal, Optional
 
-import yaml
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from nagraj.config.loader import parse_yaml
+from nagraj.core.profiling import profile_span
+
 
 class BaseClassConfig(BaseModel):
     """Configuration for base classes used in the project."""
@@ -57,6 +60,10 @@ class Settings(BaseSettings):
         default=Path.home() / ".config" / "nagraj" / "config.yaml"
     )
     template_path: Path = Field(default=Path(__file__).parent.parent / "templates")
+    cache_dir: Path = Field(default=Path.home() / ".config" / "nagraj" / "cache")
+    cache_max_size: int = 64 * 1024 * 1024
+    # How generated projects are flushed to disk: none, end or per-file
+    fsync_policy: Literal["none", "end", "per-file"] = "none"
     base_classes: BaseClassConfig = Field(default_factory=BaseClassConfig)
 
     @classmethod
@@ -70,7 +77,7 @@ class Settings(BaseSettings):
         if settings.config_path.exists():
             try:
                 with settings.config_path.open("r") as f:
-                    yaml_config = yaml.safe_load(f)
+                    yaml_config = parse_yaml(f.read())
                 if yaml_config:
                     # Update settings from YAML
                     if "base_classes" in yaml_config:
@@ -83,12 +90,28 @@ class Settings(BaseSettings):
                     f"Warning: Failed to load config from {settings.config_path}: {e}"
                 )
 
-        # Ensure template path exists
+        # Ensure template path exists, unless the packed template bundle is
+        # shipped and no template path was configured
         if not settings.template_path.exists():
-            raise ValueError(f"Template path does not exist: {settings.template_path}")
+            from nagraj.core.bundle import load_bundle
+
+            if "template_path" in settings.model_fields_set or load_bundle() is None:
+                raise ValueError(
+                    f"Template path does not exist: {settings.template_path}"
+                )
 
         return settings
 
 
-# Global settings instance
-settings = Settings.load()
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """Return the global settings, loading them on first use."""
+    with profile_span("load settings", "settings"):
+        return Settings.load()
+
+
+def __getattr__(name: str) -> Settings:
+    """Resolve the global ``settings`` instance lazily on first access."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,105 @@
+"""Streaming of rendered projects into zip and tar.gz archives."""
+
+import io
+import stat
+import tarfile
+import time
+import zipfile
+from typing import BinaryIO, Iterable, NamedTuple, Optional
+
+ARCHIVE_FORMATS = ("zip", "tar.gz")
+
+_SUFFIXES = {".zip": "zip", ".tar.gz": "tar.gz", ".tgz": "tar.gz"}
+
+
+class ArchiveMember(NamedTuple):
+    """A file or directory to store in an archive.
+
+    Directories have no content and a name ending in ``/``.
+    """
+
+    name: str
+    content: Optional[bytes]
+    mode: int
+
+
+def archive_format_for(filename: str) -> str:
+    """Infer the archive format from a file name.
+
+    Raises:
+        ValueError: If the suffix is not a supported archive format.
+    """
+    for suffix, archive_format in _SUFFIXES.items():
+        if filename.endswith(suffix):
+            return archive_format
+    raise ValueError(
+        f"Cannot infer archive format of {filename}, "
+        f"expected one of: {', '.join(_SUFFIXES)}"
+    )
+
+
+def write_archive(
+    output: BinaryIO,
+    archive_format: str,
+    members: Iterable[ArchiveMember],
+    mtime: Optional[float] = None,
+) -> None:
+    """Stream archive members into a binary file object.
+
+    The output does not need to be seekable, so archives can be written
+    straight to a pipe such as stdout.
+
+    Args:
+        output: Binary stream to write the archive to.
+        archive_format: One of :data:`ARCHIVE_FORMATS`.
+        members: Files and directories to store, parents first.
+        mtime: Modification time of every member, defaults to now.
+
+    Raises:
+        ValueError: If the archive format is not supported.
+    """
+    mtime = time.time() if mtime is None else mtime
+    if archive_format == "zip":
+        _write_zip(output, members, mtime)
+    elif archive_format == "tar.gz":
+        _write_tar(output, members, mtime)
+    else:
+        raise ValueError(
+            f"Unsupported archive format {archive_format}, "
+            f"expected one of: {', '.join(ARCHIVE_FORMATS)}"
+        )
+
+
+def _write_zip(
+    output: BinaryIO, members: Iterable[ArchiveMember], mtime: float
+) -> None:
+    """Write members as a deflated zip archive."""
+    date_time = time.localtime(mtime)[:6]
+    with zipfile.ZipFile(output, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for member in members:
+            info = zipfile.ZipInfo(member.name, date_time=date_time)
+            info.create_system = 3  # Unix, so that permissions are kept
+            if member.content is None:
+                info.external_attr = ((stat.S_IFDIR | member.mode) << 16) | 0x10
+                archive.writestr(info, b"")
+            else:
+                info.external_attr = (stat.S_IFREG | member.mode) << 16
+                info.compress_type = zipfile.ZIP_DEFLATED
+                archive.writestr(info, member.content)
+
+
+def _write_tar(
+    output: BinaryIO, members: Iterable[ArchiveMember], mtime: float
+) -> None:
+    """Write members as a gzip-compressed tar stream."""
+    with tarfile.open(fileobj=output, mode="w|gz") as archive:
+        for member in members:
+            info = tarfile.TarInfo(member.name.rstrip("/"))
+            info.mode = member.mode
+            info.mtime = int(mtime)
+            if member.content is None:
+                info.type = tarfile.DIRTYPE
+                archive.addfile(info)
+            else:
+                info.size = len(member.content)
+                archive.addfile(info, io.BytesIO(member.content))
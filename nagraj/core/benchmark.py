@@ -0,0 +1,324 @@
+"""Benchmarks of project generation with JSON baselines.
+
+A run times a fixed set of metrics and returns a report that can be saved
+as a baseline. Comparing a later report against the baseline flags every
+metric whose median grew by more than a threshold, so that slowdowns of a
+nagraj upgrade show up before they reach a scaffolding pipeline.
+"""
+
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from nagraj import __version__
+from nagraj.config.loader import dump_yaml, parse_yaml
+from nagraj.config.project import format_timestamp
+from nagraj.config.schema import BoundedContextConfig, DomainConfig, NagrajProjectConfig
+from nagraj.core.scaffold import CONTEXT_TEMPLATE, DOMAIN_TEMPLATE
+
+REPORT_FORMAT = 1
+DEFAULT_ROUNDS = 5
+DEFAULT_THRESHOLD = 0.25
+VALIDATE_SIZES = (10, 100, 1000)
+
+BENCH_CONTEXT = {
+    "project_name": "bench_app",
+    "author_name": "Bench Author",
+    "author_email": "bench@example.com",
+}
+
+# Directories validate_structure expects in a bounded context with an API
+# and persistence
+CONTEXT_DIRS = (
+    "domain/entities",
+    "domain/value_objects",
+    "application/commands",
+    "application/queries",
+    "interfaces/fastapi/routes",
+    "interfaces/fastapi/controllers",
+    "interfaces/fastapi/schemas",
+    "infrastructure/repositories",
+    "infrastructure/migrations",
+)
+
+BASE_FILES = (
+    "base_entity.py",
+    "base_value_object.py",
+    "base_aggregate_root.py",
+    "base_domain_event.py",
+)
+
+
+@dataclass
+class Comparison:
+    """A metric of a report compared against its baseline."""
+
+    name: str
+    baseline: Optional[float]
+    current: Optional[float]
+    threshold: float
+
+    @property
+    def change(self) -> Optional[float]:
+        """Relative change of the median, ``0.1`` meaning 10% slower."""
+        if not self.baseline or self.current is None:
+            return None
+        return self.current / self.baseline - 1
+
+    @property
+    def regressed(self) -> bool:
+        """Whether the metric slowed down past the threshold."""
+        change = self.change
+        return change is not None and change > self.threshold
+
+
+def run_benchmarks(
+    rounds: int = DEFAULT_ROUNDS,
+    sizes: Sequence[int] = VALIDATE_SIZES,
+    select: Sequence[str] = (),
+    progress: Optional[Callable[[str], None]] = None,
+) -> Dict[str, Any]:
+    """Time every benchmark and return a report.
+
+    Args:
+        rounds: Timed rounds per metric, the median is reported.
+        sizes: Numbers of bounded contexts of the synthetic projects used
+            to time ``validate_structure``.
+        select: Only run metrics whose name contains one of these texts.
+        progress: Called with the name of each metric before it runs.
+
+    Returns:
+        A JSON-serializable report with the timings of each metric in
+        seconds.
+    """
+    metrics: Dict[str, Dict[str, Any]] = {}
+    with tempfile.TemporaryDirectory(prefix="nagraj-bench-") as tmp:
+        for name, setup in _benchmarks(Path(tmp), sizes):
+            if select and not any(text in name for text in select):
+                continue
+            if progress is not None:
+                progress(name)
+            metrics[name] = _time(setup(), rounds)
+
+    return {
+        "format": REPORT_FORMAT,
+        "nagraj_version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created_at": format_timestamp(datetime.now(UTC)),
+        "rounds": rounds,
+        "metrics": metrics,
+    }
+
+
+def compare_reports(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[Comparison]:
+    """Compare the median of every metric of two reports.
+
+    Metrics present in only one report are listed without a change and
+    never count as regressions.
+
+    Raises:
+        ValueError: If a report has an unsupported format.
+    """
+    for report in (baseline, current):
+        if report.get("format") != REPORT_FORMAT:
+            raise ValueError("Unsupported benchmark report format")
+    before = baseline["metrics"]
+    after = current["metrics"]
+    return [
+        Comparison(
+            name=name,
+            baseline=before[name]["median"] if name in before else None,
+            current=after[name]["median"] if name in after else None,
+            threshold=threshold,
+        )
+        for name in sorted(set(before) | set(after))
+    ]
+
+
+def build_synthetic_project(
+    root: Path, contexts: int, contexts_per_domain: int = 10
+) -> NagrajProjectConfig:
+    """Create a project tree that passes ``validate_structure``.
+
+    Args:
+        root: Directory to create the project in.
+        contexts: Total number of bounded contexts.
+        contexts_per_domain: Bounded contexts per domain.
+
+    Returns:
+        The configuration describing the created tree.
+    """
+    now = datetime.now(UTC)
+    config = NagrajProjectConfig(name=root.name, created_at=now, updated_at=now)
+    base_dir = root / "src" / "shared" / "base"
+    base_dir.mkdir(parents=True)
+    for file_name in BASE_FILES:
+        (base_dir / file_name).touch()
+
+    domains_dir = root / "src" / "domains"
+    for index in range(contexts):
+        domain_name = f"domain{index // contexts_per_domain}"
+        if domain_name not in config.domains:
+            config.domains[domain_name] = DomainConfig(name=domain_name)
+        context_name = f"context{index}"
+        config.domains[domain_name].add_bounded_context(
+            BoundedContextConfig(name=context_name)
+        )
+        for directory in CONTEXT_DIRS:
+            (domains_dir / domain_name / context_name / directory).mkdir(parents=True)
+    return config
+
+
+def _time(run: Callable[[], Any], rounds: int) -> Dict[str, Any]:
+    """Time a callable after one warm-up call."""
+    run()
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    return {
+        "median": statistics.median(timings),
+        "min": min(timings),
+        "max": max(timings),
+        "rounds": rounds,
+    }
+
+
+def _benchmarks(
+    tmp: Path, sizes: Iterable[int]
+) -> Iterable[Tuple[str, Callable[[], Callable[[], Any]]]]:
+    """Yield the name and setup of each benchmark.
+
+    A setup prepares its inputs when called and returns the callable to
+    time, so that skipped benchmarks cost nothing.
+    """
+    yield "init.cold", partial(_init_run, tmp / "init-cold", warm=False)
+    yield "init.warm", partial(_init_run, tmp / "init-warm", warm=True)
+    for template_name in (
+        "nagraj-full-project-template",
+        DOMAIN_TEMPLATE,
+        CONTEXT_TEMPLATE,
+    ):
+        yield (
+            f"render_template.{template_name}",
+            partial(_render_run, template_name),
+        )
+
+    yield "config.yaml_round_trip", partial(_yaml_run, tmp / "yaml")
+    for size in sizes:
+        yield (
+            f"validate_structure.{size}",
+            partial(_validate_run, tmp / f"validate-{size}", size),
+        )
+
+
+def _init_run(tmp: Path, warm: bool) -> Callable[[], Any]:
+    """Run ``nagraj init`` in a fresh interpreter.
+
+    Cold runs start from an empty template cache, warm runs share one.
+    """
+    tmp.mkdir()
+    env = dict(
+        os.environ,
+        NAGRAJ_CACHE_DIR=str(tmp / "cache"),
+        NAGRAJ_CONFIG_PATH=str(tmp / "config" / "config.yaml"),
+    )
+    runs = iter(range(sys.maxsize))
+
+    def run() -> None:
+        index = next(runs)
+        if not warm:
+            env["NAGRAJ_CACHE_DIR"] = str(tmp / f"cache-{index}")
+        subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "nagraj",
+                "init",
+                "--project-name",
+                BENCH_CONTEXT["project_name"],
+                "--project-root-dir",
+                str(tmp / f"run-{index}"),
+                "--project-author-name",
+                BENCH_CONTEXT["author_name"],
+                "--project-author-email",
+                BENCH_CONTEXT["author_email"],
+            ],
+            check=True,
+            capture_output=True,
+            env=env,
+        )
+
+    return run
+
+
+def _render_run(template_name: str) -> Callable[[], Any]:
+    """Render every file of a template as ``render_template`` does.
+
+    The engine environment is overlaid with the loader of the template, which
+    also finds the shared templates its files include.
+    """
+    from nagraj.core.template import TemplateEngine
+
+    engine = TemplateEngine(use_cache=False)
+    source = engine.get_template_source(template_name)
+    context = engine.build_context(source, BENCH_CONTEXT)
+    env = engine.jinja_env.overlay(loader=source.get_loader())
+    names = []
+    pending = [source.find_project_root()]
+    while pending:
+        directory = pending.pop()
+        for name, is_dir in source.list_dir(directory):
+            path = f"{directory}/{name}"
+            if is_dir:
+                pending.append(path)
+                continue
+            try:
+                source.read_text(path)
+            except UnicodeDecodeError:
+                continue  # Binary files are copied, not rendered
+            names.append(path)
+
+    def run() -> None:
+        for name in names:
+            env.get_template(name).render(**context)
+
+    return run
+
+
+def _yaml_run(tmp: Path) -> Callable[[], Any]:
+    """Dump a 100 context configuration to YAML and validate it back."""
+    config = build_synthetic_project(tmp, 100)
+
+    def run() -> NagrajProjectConfig:
+        text = dump_yaml(config.model_dump(), sort_keys=False)
+        return NagrajProjectConfig.model_validate(parse_yaml(text))
+
+    return run
+
+
+def _validate_run(tmp: Path, size: int) -> Callable[[], Any]:
+    """Validate a synthetic project of the given number of contexts."""
+    config = build_synthetic_project(tmp, size)
+
+    def run() -> None:
+        errors = config.validate_structure(str(tmp))
+        if errors:
+            raise RuntimeError(f"Synthetic project is invalid: {errors[0]}")
+
+    return run
@@ -0,0 +1,311 @@
+"""Templates packed into a single indexed archive with precompiled Jinja2 code.
+
+The bundle is a zip archive holding every template file, an index of file
+modes, directories and template digests, and the compiled Jinja2 bytecode of
+each template keyed like the persistent template cache. It is read through
+``importlib.resources`` so it also works from wheels and zipapps.
+
+Build it before packaging with ``python -m nagraj.core.bundle``: wheels leave
+out the template directory, so a wheel built without the bundle holds no
+templates.
+"""
+
+import io
+import json
+import os
+import stat
+import tempfile
+import zipfile
+from functools import lru_cache
+from importlib import resources
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
+
+from cookiecutter.environment import StrictEnvironment
+from jinja2 import BaseLoader, BytecodeCache, Environment, TemplateNotFound
+from jinja2.bccache import Bucket
+from jinja2.exceptions import TemplateSyntaxError
+
+from nagraj import __version__
+from nagraj.core.cache import template_cache_key
+from nagraj.core.sources import SHARED_TEMPLATES_DIR, DirectoryTemplateSource
+
+BUNDLE_FILE = "templates.bundle"
+BUNDLE_FORMAT = 1
+INDEX_NAME = "index.json"
+
+# Directories never packed into a bundle
+IGNORED_DIRS = {"__pycache__"}
+
+
+class TemplateBundle:
+    """Read-only view of a packed template bundle held in memory."""
+
+    def __init__(self, data: bytes, name: str = BUNDLE_FILE) -> None:
+        self.name = name
+        self._archive = zipfile.ZipFile(io.BytesIO(data))
+        index = json.loads(self._archive.read(INDEX_NAME))
+        if index.get("format") != BUNDLE_FORMAT:
+            raise ValueError(f"Unsupported template bundle format in {name}")
+        self.nagraj_version: str = index["nagraj_version"]
+        self.digests: Dict[str, str] = index.get("digests", {})
+        self._modes: Dict[str, int] = index["files"]
+        self._bytecode: Set[str] = set(index["bytecode"])
+
+        self._children: Dict[str, List[Tuple[str, bool]]] = {}
+        for path in index["directories"]:
+            self._children.setdefault(path, [])
+            self._add_child(path, True)
+        for path in self._modes:
+            self._add_child(path, False)
+        for entries in self._children.values():
+            entries.sort()
+
+    def __str__(self) -> str:
+        return self.name
+
+    @classmethod
+    def from_path(cls, path: Union[str, Path]) -> "TemplateBundle":
+        """Load a bundle from a file."""
+        return cls(Path(path).read_bytes(), name=str(path))
+
+    def is_current(self, template_path: Path) -> bool:
+        """Whether the bundle holds the templates of a directory unchanged.
+
+        Compares the digest of every template, see
+        :meth:`~nagraj.core.sources.TemplateSource.digest`.
+        """
+        names = sorted(
+            entry.name
+            for entry in template_path.iterdir()
+            if entry.is_dir() and entry.name not in IGNORED_DIRS
+        )
+        return names == sorted(self.digests) and all(
+            DirectoryTemplateSource(name, template_path / name).digest()
+            == self.digests[name]
+            for name in names
+        )
+
+    @property
+    def templates(self) -> List[str]:
+        """Names of the templates in the bundle."""
+        return [name for name, is_dir in self._children.get("", []) if is_dir]
+
+    def read(self, path: str) -> bytes:
+        """Return the contents of a packed file.
+
+        Raises:
+            FileNotFoundError: If the file is not in the bundle.
+        """
+        if path not in self._modes:
+            raise FileNotFoundError(f"{path} not found in {self.name}")
+        return self._archive.read(f"files/{path}")
+
+    def get_mode(self, path: str) -> int:
+        """Return the permission bits of a packed file."""
+        if path not in self._modes:
+            raise FileNotFoundError(f"{path} not found in {self.name}")
+        return self._modes[path]
+
+    def list_dir(self, path: str) -> List[Tuple[str, bool]]:
+        """List a packed directory as (name, is_dir) pairs sorted by name."""
+        if path not in self._children:
+            raise FileNotFoundError(f"{path} not found in {self.name}")
+        return self._children[path]
+
+    def get_bytecode(self, key: str) -> Optional[bytes]:
+        """Return the precompiled bytecode stored for a cache key."""
+        if key not in self._bytecode:
+            return None
+        return self._archive.read(f"bytecode/{key}")
+
+    def _add_child(self, path: str, is_dir: bool) -> None:
+        """Register a path with its parent directory."""
+        parent, _, name = path.rpartition("/")
+        self._children.setdefault(parent, []).append((name, is_dir))
+
+
+class BundleLoader(BaseLoader):
+    """Jinja2 loader reading template sources from a bundle."""
+
+    def __init__(self, bundle: TemplateBundle, prefix: str = "") -> None:
+        self.bundle = bundle
+        self.prefix = prefix
+
+    def get_source(
+        self, environment: Environment, template: str
+    ) -> Tuple[str, Optional[str], Callable[[], bool]]:
+        """Return the source of a template, which never goes out of date."""
+        try:
+            data = self.bundle.read(self.prefix + template)
+        except FileNotFoundError:
+            raise TemplateNotFound(template)
+        return data.decode("utf-8"), None, lambda: True
+
+
+class BundleBytecodeCache(BytecodeCache):
+    """Bytecode cache serving the precompiled code of a bundle.
+
+    Templates that were not precompiled, or whose bytecode does not match the
+    running Python, fall back to another cache when one is given.
+    """
+
+    def __init__(
+        self, bundle: TemplateBundle, fallback: Optional[BytecodeCache] = None
+    ) -> None:
+        self.bundle = bundle
+        self.fallback = fallback
+
+    def get_bucket(
+        self,
+        environment: Environment,
+        name: str,
+        filename: Optional[str],
+        source: str,
+    ) -> Bucket:
+        """Return the cache bucket for a template source."""
+        key = template_cache_key(environment, name, source)
+        bucket = Bucket(environment, key, self.get_source_checksum(source))
+        self.load_bytecode(bucket)
+        return bucket
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        """Load precompiled bytecode, falling back to the other cache."""
+        data = self.bundle.get_bytecode(bucket.key)
+        if data is not None:
+            # Resets the bucket if it was compiled for another Python
+            bucket.bytecode_from_string(data)
+            if bucket.code is not None:
+                return
+        if self.fallback is not None:
+            self.fallback.load_bytecode(bucket)
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        """Store bytecode compiled at runtime in the fallback cache."""
+        if self.fallback is not None:
+            self.fallback.dump_bytecode(bucket)
+
+
+@lru_cache(maxsize=None)
+def load_bundle() -> Optional[TemplateBundle]:
+    """Load the bundle shipped inside the nagraj package, if it was built.
+
+    A bundle packed by another nagraj version, or from templates that
+    were edited since, is ignored in favour of the template directory.
+    """
+    package = resources.files("nagraj")
+    resource = package.joinpath(BUNDLE_FILE)
+    if not resource.is_file():
+        return None
+    bundle = TemplateBundle(resource.read_bytes(), name=str(resource))
+    if bundle.nagraj_version != __version__:
+        return None
+    # Wheels leave out the template directory, so only checkouts and
+    # editable installs compare digests
+    template_path = package.joinpath("templates")
+    if isinstance(template_path, Path) and template_path.is_dir():
+        if not bundle.is_current(template_path):
+            return None
+    return bundle
+
+
+def pack_templates(template_path: Path, output: Path) -> Path:
+    """Pack every template of a directory into a bundle file.
+
+    Files are stored with their permission bits; every file below a
+    template's project directory is also compiled the way project
+    generation compiles it, and its bytecode stored under the same key the
+    template cache would use.
+
+    Args:
+        template_path: Directory holding one directory per template.
+        output: Path of the bundle file to write.
+
+    Returns:
+        The path of the written bundle.
+    """
+    checksum = BytecodeCache().get_source_checksum
+    index: Dict[str, object] = {"format": BUNDLE_FORMAT, "nagraj_version": __version__}
+    modes: Dict[str, int] = {}
+    directories: List[str] = []
+    bytecode: List[str] = []
+    digests: Dict[str, str] = {}
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=output.parent, suffix=".tmp")
+    try:
+        with (
+            os.fdopen(fd, "wb") as f,
+            zipfile.ZipFile(f, "w", compression=zipfile.ZIP_DEFLATED) as archive,
+        ):
+            for template_dir in sorted(template_path.iterdir()):
+                if not template_dir.is_dir() or template_dir.name in IGNORED_DIRS:
+                    continue
+                # Same environment options as TemplateEngine.plan_project
+                env = StrictEnvironment(
+                    context={"cookiecutter": {}}, keep_trailing_newline=True
+                )
+                directories.append(template_dir.name)
+                digests[template_dir.name] = DirectoryTemplateSource(
+                    template_dir.name, template_dir
+                ).digest()
+                for root, dirs, files in os.walk(template_dir):
+                    dirs[:] = sorted(d for d in dirs if d not in IGNORED_DIRS)
+                    relative = Path(root).relative_to(template_dir).as_posix()
+                    prefix = "" if relative == "." else f"{relative}/"
+                    for name in dirs:
+                        directories.append(f"{template_dir.name}/{prefix}{name}")
+                    for name in sorted(files):
+                        path = f"{template_dir.name}/{prefix}{name}"
+                        data = (Path(root) / name).read_bytes()
+                        archive.writestr(f"files/{path}", data)
+                        modes[path] = stat.S_IMODE(os.stat(Path(root) / name).st_mode)
+                        if not prefix:
+                            continue  # cookiecutter.json and friends are not rendered
+                        # Shared templates are loaded by their path inside it
+                        loaded = f"{prefix}{name}".removeprefix(
+                            f"{SHARED_TEMPLATES_DIR}/"
+                        )
+                        key, code = _compile(env, loaded, data, checksum)
+                        if code is not None:
+                            archive.writestr(f"bytecode/{key}", code)
+                            bytecode.append(key)
+
+            index.update(
+                files=modes, directories=directories, bytecode=bytecode, digests=digests
+            )
+            archive.writestr(INDEX_NAME, json.dumps(index, indent=1, sort_keys=True))
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, output)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return output
+
+
+def _compile(
+    env: Environment, name: str, data: bytes, checksum: Callable[[str], str]
+) -> Tuple[str, Optional[bytes]]:
+    """Compile a template file into cache bucket bytes.
+
+    Returns:
+        A tuple of (cache key, bytecode), the bytecode is None for binary
+        files and files that are not valid templates.
+    """
+    try:
+        source = data.decode("utf-8")
+    except UnicodeDecodeError:
+        return "", None
+    key = template_cache_key(env, name, source)
+    try:
+        code = env.compile(source, name)
+    except TemplateSyntaxError:
+        return key, None
+    bucket = Bucket(env, key, checksum(source))
+    bucket.code = code
+    return key, bucket.bytecode_to_string()
+
+
+if __name__ == "__main__":
+    package_dir = Path(__file__).resolve().parent.parent
+    print(pack_templates(package_dir / "templates", package_dir / BUNDLE_FILE))
@@ -0,0 +1,137 @@
+"""Persistent cache for compiled templates."""
+
+import hashlib
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from jinja2 import BytecodeCache, Environment
+from jinja2.bccache import Bucket
+
+from nagraj import __version__
+
+CACHE_SUFFIX = ".jinja.cache"
+
+
+def template_cache_key(environment: Environment, name: str, source: str) -> str:
+    """Build a cache key from the nagraj version, environment and source."""
+    options = (
+        environment.trim_blocks,
+        environment.lstrip_blocks,
+        environment.keep_trailing_newline,
+        environment.newline_sequence,
+        sorted(environment.extensions),
+    )
+    digest = hashlib.sha256()
+    for part in (__version__, repr(options), name, source):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class TemplateBytecodeCache(BytecodeCache):
+    """Size-bounded on-disk cache of compiled Jinja2 templates.
+
+    Entries are keyed by nagraj version, environment options, template name
+    and template source, so an edited template or an upgraded nagraj never
+    picks up stale bytecode. Once the cache grows beyond ``max_size`` bytes
+    the least recently used entries are evicted.
+    """
+
+    def __init__(self, directory: Path, max_size: int) -> None:
+        self.directory = Path(directory)
+        self.max_size = max_size
+        self._size: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def get_bucket(
+        self,
+        environment: Environment,
+        name: str,
+        filename: Optional[str],
+        source: str,
+    ) -> Bucket:
+        """Return the cache bucket for a template source."""
+        key = template_cache_key(environment, name, source)
+        bucket = Bucket(environment, key, self.get_source_checksum(source))
+        self.load_bytecode(bucket)
+        return bucket
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        """Load compiled bytecode for a bucket if it has been cached."""
+        path = self._get_path(bucket.key)
+        try:
+            with path.open("rb") as f:
+                bucket.load_bytecode(f)
+            # Mark the entry as recently used for eviction
+            os.utime(path)
+        except OSError:
+            bucket.reset()
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        """Atomically write the compiled bytecode of a bucket to disk."""
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                bucket.write_bytecode(f)
+                size = f.tell()
+            os.replace(tmp_name, self._get_path(bucket.key))
+        except OSError:
+            Path(tmp_name).unlink(missing_ok=True)
+            return
+        self._track(size)
+
+    def clear(self) -> None:
+        """Remove every cached template."""
+        with self._lock:
+            for path, _, _ in self._entries():
+                path.unlink(missing_ok=True)
+            self._size = 0
+
+    def _track(self, size: int) -> None:
+        """Account for a new entry and evict old entries when over budget."""
+        with self._lock:
+            if self._size is None:
+                self._size = sum(entry_size for _, _, entry_size in self._entries())
+            else:
+                self._size += size
+            if self._size > self.max_size:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Evict least recently used entries down to three quarters of the budget."""
+        target = self.max_size * 3 // 4
+        entries = sorted(self._entries(), key=lambda entry: entry[1])
+        size = sum(entry_size for _, _, entry_size in entries)
+        for path, _, entry_size in entries:
+            if size <= target:
+                break
+            path.unlink(missing_ok=True)
+            size -= entry_size
+        self._size = size
+
+    def _entries(self) -> List[Tuple[Path, float, int]]:
+        """List cache entries as (path, mtime, size) tuples."""
+        entries: List[Tuple[Path, float, int]] = []
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if entry.name.endswith(CACHE_SUFFIX):
+                        try:
+                            stat = entry.stat()
+                        except OSError:
+                            continue
+                        entries.append((Path(entry.path), stat.st_mtime, stat.st_size))
+        except FileNotFoundError:
+            pass
+        return entries
+
+    def _get_path(self, key: str) -> Path:
+        """Return the file path for a cache key."""
+        return self.directory / f"{key}{CACHE_SUFFIX}"
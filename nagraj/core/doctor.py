@@ -0,0 +1,571 @@
+"""Static performance audit of a generated project.
+
+Every Python file of the project is parsed with :mod:`ast` into a small set
+of facts: findings local to the file, the functions used as FastAPI
+dependencies and the calls made by every function. Files are analyzed in
+worker processes and their facts are pickled by content hash, so only
+edited files are parsed again. Findings that need the whole project, such
+as a dependency constructed per request in one module and injected in
+another, are derived from the combined facts.
+
+Checked patterns:
+
+- ``blocking-io-in-async``: ``open()``, ``Path.read_text()`` and similar
+  blocking calls inside ``async def``.
+- ``cpu-bound-in-async``: password hashing called from ``async def``,
+  directly or through the functions and constructors that hash.
+- ``per-request-dependency``: a dependency passed to ``Depends`` that
+  constructs objects on every request instead of once.
+- ``select-before-write``: a function that selects a row and then adds it
+  to the session, costing a round trip per write.
+"""
+
+import ast
+import hashlib
+import os
+import pickle
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
+
+from nagraj import __version__
+
+DOCTOR_CACHE_DIR = "doctor"
+DOCTOR_CACHE_SUFFIX = ".doctor.pickle"
+# Bumped whenever the facts extracted from a file change
+ANALYSIS_VERSION = 1
+
+ERROR = "error"
+WARNING = "warning"
+
+RULES = {
+    "blocking-io-in-async": ERROR,
+    "cpu-bound-in-async": ERROR,
+    "per-request-dependency": WARNING,
+    "select-before-write": WARNING,
+    "syntax-error": ERROR,
+}
+
+IGNORED_DIRS = {"__pycache__", "node_modules", "tests", "venv"}
+
+# Fewer files than this are analyzed in-process: parsing takes below a
+# millisecond per file, less than starting a process pool
+PARALLEL_THRESHOLD = 500
+
+BLOCKING_METHODS = {"read_bytes", "read_text", "write_bytes", "write_text"}
+HASHING_MODULES = {"argon2", "bcrypt", "passlib"}
+# Methods of password hashers, only hashing in modules importing one
+HASHER_METHODS = {"hash", "verify"}
+HASHING_FUNCTIONS = {"checkpw", "hashpw", "pbkdf2_hmac", "scrypt"}
+CACHE_DECORATORS = {"cache", "lru_cache"}
+SESSION_WRITES = {"add", "merge"}
+
+
+@dataclass(frozen=True)
+class Finding:
+    """A performance problem found at a location of the project."""
+
+    path: str
+    line: int
+    column: int
+    rule: str
+    severity: str
+    message: str
+
+    def __str__(self) -> str:
+        return f"{self.path}:{self.line}:{self.column}: {self.message}"
+
+
+@dataclass(frozen=True)
+class Provider:
+    """A module-level function that may be used as a dependency."""
+
+    line: int
+    column: int
+    builds: Tuple[str, ...]
+    cached: bool
+
+
+@dataclass
+class FileFacts:
+    """What the audit needs to know about one source file."""
+
+    # Findings without a path, which is not part of the cached facts
+    findings: List[Finding] = field(default_factory=list)
+    # Names passed to ``Depends``
+    depends: Set[str] = field(default_factory=set)
+    providers: Dict[str, Provider] = field(default_factory=dict)
+    # Names called by every function, see :func:`_call_name`
+    calls: Dict[str, Set[str]] = field(default_factory=dict)
+    # Functions that hash passwords themselves
+    hashing: Set[str] = field(default_factory=set)
+    # Calls made directly inside ``async def``: name, function, line, column
+    async_calls: List[Tuple[str, str, int, int]] = field(default_factory=list)
+
+
+@dataclass
+class DoctorReport:
+    """Outcome of auditing a project."""
+
+    files: int = 0
+    cached: int = 0
+    findings: List[Finding] = field(default_factory=list)
+
+    @property
+    def errors(self) -> List[Finding]:
+        """Findings of error severity."""
+        return [finding for finding in self.findings if finding.severity == ERROR]
+
+
+class FactCache:
+    """Facts of analyzed files pickled by the hash of their contents.
+
+    Unreadable or outdated entries are treated as missing.
+    """
+
+    def __init__(self, directory: Union[str, Path]) -> None:
+        self.directory = Path(directory)
+
+    def get(self, digest: str) -> Optional[FileFacts]:
+        """Return the facts of a file with the given content hash."""
+        try:
+            with self._get_path(digest).open("rb") as f:
+                header, facts = pickle.load(f)
+        except Exception:
+            # Missing, corrupt or written by an incompatible version
+            return None
+        if header != (__version__, ANALYSIS_VERSION):
+            return None
+        return facts if isinstance(facts, FileFacts) else None
+
+    def put(self, digest: str, facts: FileFacts) -> None:
+        """Store facts, ignoring errors since caching is optional."""
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(((__version__, ANALYSIS_VERSION), facts), f)
+            os.replace(tmp_name, self._get_path(digest))
+        except (OSError, pickle.PicklingError):
+            Path(tmp_name).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Remove every cached file."""
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if entry.name.endswith(DOCTOR_CACHE_SUFFIX):
+                        Path(entry.path).unlink(missing_ok=True)
+        except FileNotFoundError:
+            pass
+
+    def _get_path(self, digest: str) -> Path:
+        """Return the cache entry path for a content hash."""
+        return self.directory / f"{digest}{DOCTOR_CACHE_SUFFIX}"
+
+
+def get_fact_cache() -> FactCache:
+    """Return the fact cache in the configured cache directory."""
+    from nagraj.config.settings import get_settings
+
+    return FactCache(get_settings().cache_dir / DOCTOR_CACHE_DIR)
+
+
+def diagnose_project(
+    project_dir: Union[str, Path],
+    max_workers: Optional[int] = None,
+    use_cache: bool = True,
+) -> DoctorReport:
+    """Audit the Python files of a project for performance problems.
+
+    Hidden directories and those in :data:`IGNORED_DIRS` are skipped.
+
+    Args:
+        project_dir: Root directory of the project.
+        max_workers: Number of worker processes, 1 analyzes in-process.
+        use_cache: Read and write the facts of files from the cache.
+
+    Returns:
+        The findings, ordered by path and line.
+
+    Raises:
+        FileNotFoundError: If the project directory does not exist.
+    """
+    project_dir = Path(project_dir)
+    if not project_dir.is_dir():
+        raise FileNotFoundError(f"Project directory not found: {project_dir}")
+    cache = get_fact_cache() if use_cache else None
+
+    report = DoctorReport()
+    facts: Dict[str, FileFacts] = {}
+    misses: List[Tuple[str, str, bytes]] = []
+    for path in iter_sources(project_dir):
+        name = path.relative_to(project_dir).as_posix()
+        source = path.read_bytes()
+        digest = hashlib.sha256(source).hexdigest()
+        cached = cache.get(digest) if cache is not None else None
+        if cached is None:
+            misses.append((name, digest, source))
+        else:
+            facts[name] = cached
+            report.cached += 1
+        report.files += 1
+
+    names = [name for name, _, _ in misses]
+    sources = [source for _, _, source in misses]
+    if max_workers == 1 or len(misses) < PARALLEL_THRESHOLD:
+        analyzed = list(map(analyze_source, sources, names))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            analyzed = list(executor.map(analyze_source, sources, names, chunksize=8))
+    for (name, digest, _), file_facts in zip(misses, analyzed):
+        facts[name] = file_facts
+        if cache is not None:
+            cache.put(digest, file_facts)
+
+    report.findings = _combine(facts)
+    return report
+
+
+def iter_sources(project_dir: Path) -> Iterator[Path]:
+    """Yield the Python files of a project in a stable order."""
+    for directory, dirnames, filenames in os.walk(project_dir):
+        dirnames[:] = sorted(
+            name
+            for name in dirnames
+            if not name.startswith(".") and name not in IGNORED_DIRS
+        )
+        for filename in sorted(filenames):
+            if filename.endswith(".py"):
+                yield Path(directory) / filename
+
+
+def analyze_source(source: bytes, filename: str) -> FileFacts:
+    """Extract the facts of one source file.
+
+    Findings that need no other file are reported directly, with an empty
+    path that is filled in when the facts are combined.
+    """
+    facts = FileFacts()
+    try:
+        module = ast.parse(source, filename=filename)
+    except SyntaxError as e:
+        facts.findings.append(
+            _finding(e.lineno or 1, (e.offset or 1) - 1, "syntax-error", str(e.msg))
+        )
+        return facts
+
+    imports_hasher = any(
+        alias.name.split(".")[0] in HASHING_MODULES
+        for node in ast.walk(module)
+        if isinstance(node, ast.Import)
+        for alias in node.names
+    ) or any(
+        (node.module or "").split(".")[0] in HASHING_MODULES
+        for node in ast.walk(module)
+        if isinstance(node, ast.ImportFrom)
+    )
+
+    for node in ast.walk(module):
+        if (
+            isinstance(node, ast.Call)
+            and _call_name(node) == "Depends"
+            and node.args
+            and isinstance(node.args[0], ast.Name)
+        ):
+            facts.depends.add(node.args[0].id)
+
+    for statement in module.body:
+        if isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            facts.providers[statement.name] = Provider(
+                statement.lineno,
+                statement.col_offset,
+                tuple(_constructed(statement)),
+                any(
+                    _decorator_name(decorator) in CACHE_DECORATORS
+                    for decorator in statement.decorator_list
+                ),
+            )
+
+    for owner, function in _functions(module):
+        keys = _function_keys(owner, function)
+        body = list(_walk_body(function))
+        calls = [node for node in body if isinstance(node, ast.Call)]
+        called = {name for name in map(_call_name, calls) if name is not None}
+        hashes = [call for call in calls if _is_hashing(call, imports_hasher)]
+        for key in keys:
+            facts.calls.setdefault(key, set()).update(called)
+            if hashes:
+                facts.hashing.add(key)
+
+        if isinstance(function, ast.AsyncFunctionDef):
+            _check_async(facts, function, calls, hashes)
+        _check_select_before_write(facts, function, calls)
+    return facts
+
+
+def _check_async(
+    facts: FileFacts,
+    function: ast.AsyncFunctionDef,
+    calls: List[ast.Call],
+    hashes: List[ast.Call],
+) -> None:
+    """Report blocking calls of a coroutine and record the others."""
+    awaited = {
+        id(node.value)
+        for node in _walk_body(function)
+        if isinstance(node, ast.Await) and isinstance(node.value, ast.Call)
+    }
+    for call in calls:
+        name = _call_name(call)
+        if id(call) in awaited or name is None:
+            continue
+        if _is_blocking(call):
+            facts.findings.append(
+                _finding(
+                    call.lineno,
+                    call.col_offset,
+                    "blocking-io-in-async",
+                    f"{ast.unparse(call.func)}() blocks the event loop in async "
+                    f"function {function.name}; use asyncio.to_thread or async I/O",
+                )
+            )
+        elif call in hashes:
+            facts.findings.append(
+                _finding(
+                    call.lineno,
+                    call.col_offset,
+                    "cpu-bound-in-async",
+                    f"{ast.unparse(call.func)}() hashes a password on the event "
+                    f"loop in async function {function.name}; use asyncio.to_thread",
+                )
+            )
+        else:
+            facts.async_calls.append(
+                (name, function.name, call.lineno, call.col_offset)
+            )
+
+
+def _check_select_before_write(
+    facts: FileFacts,
+    function: Union[ast.FunctionDef, ast.AsyncFunctionDef],
+    calls: List[ast.Call],
+) -> None:
+    """Report a select followed by a write of the same function."""
+    selects = [call for call in calls if _call_name(call) == "select"]
+    writes = [
+        call
+        for call in calls
+        if isinstance(call.func, ast.Attribute)
+        and call.func.attr in SESSION_WRITES
+        and "session" in ast.unparse(call.func.value).lower()
+    ]
+    if not (selects and writes):
+        return
+    select = min(selects, key=lambda call: (call.lineno, call.col_offset))
+    if any(write.lineno > select.lineno for write in writes):
+        facts.findings.append(
+            _finding(
+                select.lineno,
+                select.col_offset,
+                "select-before-write",
+                f"{function.name} selects the row before writing it, one extra "
+                f"round trip per write; use a single INSERT ... ON CONFLICT "
+                f"DO UPDATE",
+            )
+        )
+
+
+def _combine(facts: Dict[str, FileFacts]) -> List[Finding]:
+    """Derive the findings of a whole project from the facts of its files."""
+    findings: List[Finding] = []
+    depends: Set[str] = set()
+    calls: Dict[str, Set[str]] = {}
+    hashing: Set[str] = set()
+    for file_facts in facts.values():
+        depends |= file_facts.depends
+        hashing |= file_facts.hashing
+        for key, called in file_facts.calls.items():
+            calls.setdefault(key, set()).update(called)
+
+    # Functions hashing passwords, directly or through the functions they call
+    changed = True
+    while changed:
+        changed = False
+        for key, called in calls.items():
+            if key not in hashing and not called.isdisjoint(hashing):
+                hashing.add(key)
+                changed = True
+
+    for path, file_facts in facts.items():
+        for finding in file_facts.findings:
+            findings.append(
+                Finding(
+                    path,
+                    finding.line,
+                    finding.column,
+                    finding.rule,
+                    finding.severity,
+                    finding.message,
+                )
+            )
+        for name, function, line, column in file_facts.async_calls:
+            if name in hashing:
+                findings.append(
+                    _finding(
+                        line,
+                        column,
+                        "cpu-bound-in-async",
+                        f"{name}() hashes a password on the event loop in async "
+                        f"function {function}; use asyncio.to_thread",
+                        path,
+                    )
+                )
+        for name, provider in file_facts.providers.items():
+            if name in depends and provider.builds and not provider.cached:
+                findings.append(
+                    _finding(
+                        provider.line,
+                        provider.column,
+                        "per-request-dependency",
+                        f"Dependency {name} constructs {', '.join(provider.builds)} "
+                        f"on every request; construct once, e.g. with "
+                        f"functools.lru_cache or at startup",
+                        path,
+                    )
+                )
+    return sorted(findings, key=lambda f: (f.path, f.line, f.column, f.rule))
+
+
+def _finding(
+    line: int, column: int, rule: str, message: str, path: str = ""
+) -> Finding:
+    """Create a finding with the severity of its rule."""
+    return Finding(path, line, column + 1, rule, RULES[rule], message)
+
+
+def _functions(
+    module: ast.Module,
+) -> Iterator[Tuple[Optional[str], Union[ast.FunctionDef, ast.AsyncFunctionDef]]]:
+    """Yield every function of a module with the name of its class."""
+    stack: List[Tuple[Optional[str], ast.AST]] = [(None, module)]
+    while stack:
+        owner, node = stack.pop()
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.ClassDef):
+                stack.append((child.name, child))
+            elif isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                yield owner, child
+                stack.append((None, child))
+            else:
+                stack.append((owner, child))
+
+
+def _function_keys(
+    owner: Optional[str], function: Union[ast.FunctionDef, ast.AsyncFunctionDef]
+) -> List[str]:
+    """Return the names a call of a function may use, see :func:`_call_name`.
+
+    A method is called by its name on an instance, or qualified by its class.
+    A constructor is called by the class name.
+    """
+    if owner is None:
+        return [function.name]
+    if function.name == "__init__":
+        return [owner]
+    return [function.name, f"{owner}.{function.name}"]
+
+
+def _call_name(call: ast.Call) -> Optional[str]:
+    """Return the name of a called function.
+
+    Calls on a class, such as ``UserAggregate.create()``, are qualified by the
+    class name. Calls on an instance only know the method name.
+    """
+    func = call.func
+    if isinstance(func, ast.Name):
+        return func.id
+    if isinstance(func, ast.Attribute):
+        value = func.value
+        if isinstance(value, ast.Name) and value.id[:1].isupper():
+            return f"{value.id}.{func.attr}"
+        return func.attr
+    return None
+
+
+def _walk_body(
+    function: Union[ast.FunctionDef, ast.AsyncFunctionDef],
+) -> Iterator[ast.AST]:
+    """Yield the nodes of a function body, without nested scopes."""
+    stack: List[ast.AST] = list(function.body)
+    while stack:
+        node = stack.pop()
+        yield node
+        for child in ast.iter_child_nodes(node):
+            if not isinstance(
+                child,
+                (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda, ast.ClassDef),
+            ):
+                stack.append(child)
+
+
+def _constructed(function: Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> List[str]:
+    """Return the classes a function instantiates, except raised exceptions."""
+    raised = {
+        id(node.exc)
+        for node in _walk_body(function)
+        if isinstance(node, ast.Raise) and node.exc is not None
+    }
+    calls = [
+        (node.lineno, node.col_offset, node.func.id)
+        for node in _walk_body(function)
+        if isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id[:1].isupper()
+        and id(node) not in raised
+    ]
+    return list(dict.fromkeys(name for _, _, name in sorted(calls)))
+
+
+def _is_blocking(call: ast.Call) -> bool:
+    """Whether a call blocks on file or network I/O, or sleeps."""
+    func = call.func
+    if isinstance(func, ast.Name):
+        return func.id == "open"
+    if not isinstance(func, ast.Attribute):
+        return False
+    if func.attr in BLOCKING_METHODS:
+        return True
+    if isinstance(func.value, ast.Name):
+        if func.value.id == "time" and func.attr == "sleep":
+            return True
+        if func.value.id == "requests":
+            return True
+    return False
+
+
+def _is_hashing(call: ast.Call, imports_hasher: bool) -> bool:
+    """Whether a call hashes or verifies a password."""
+    func = call.func
+    if isinstance(func, ast.Name):
+        return func.id in HASHING_FUNCTIONS
+    name = func.attr if isinstance(func, ast.Attribute) else None
+    if name in HASHING_FUNCTIONS:
+        return True
+    return imports_hasher and name in HASHER_METHODS
+
+
+def _decorator_name(node: ast.expr) -> Optional[str]:
+    """Return the name of a decorator, with or without arguments."""
+    if isinstance(node, ast.Call):
+        node = node.func
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
@@ -0,0 +1,289 @@
+"""Bulk generation of domains and bounded contexts from a system spec."""
+
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from nagraj.config.project import ProjectConfigFile, load_project_spec
+from nagraj.config.schema import DomainConfig, NagrajProjectConfig
+from nagraj.core.scaffold import (
+    CONTEXT_TEMPLATE,
+    DOMAIN_TEMPLATE,
+    check_package_name,
+    get_project_slug,
+    save_project_config,
+)
+from nagraj.core.template import TemplateEngine, template_engine
+
+# A template rendered into a parent directory: (template name, context, parent)
+RenderJob = Tuple[str, Dict[str, str], str]
+
+_worker_engine: Optional[TemplateEngine] = None
+
+
+class DependencyCycleError(ValueError):
+    """Raised when bounded context dependencies form a cycle."""
+
+
+@dataclass
+class GenerateResult:
+    """Outcome of generating a system spec into a project."""
+
+    domains: List[str] = field(default_factory=list)
+    levels: List[List[str]] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+
+    @property
+    def contexts(self) -> List[str]:
+        """Every generated bounded context, in generation order."""
+        return [context for level in self.levels for context in level]
+
+
+def dependency_levels(
+    config: NagrajProjectConfig, known: Optional[Set[str]] = None
+) -> List[List[str]]:
+    """Group bounded contexts into levels of a dependency graph.
+
+    Contexts are identified as ``domain.context``. A dependency may name a
+    context of the same domain or use the qualified form. Every context only
+    depends on contexts of earlier levels.
+
+    Args:
+        config: Project configuration describing domains and contexts.
+        known: Qualified names of contexts that already exist and may be
+            depended upon without being generated.
+
+    Returns:
+        The qualified context names of each level, sorted within a level.
+
+    Raises:
+        ValueError: If a dependency names an unknown context.
+        DependencyCycleError: If the dependencies form a cycle.
+    """
+    known = known or set()
+    graph: Dict[str, Set[str]] = {}
+    for domain_name, domain in config.domains.items():
+        for context_name in domain.bounded_contexts:
+            graph[f"{domain_name}.{context_name}"] = set()
+
+    for domain_name, domain in config.domains.items():
+        for context_name, context in domain.bounded_contexts.items():
+            node = f"{domain_name}.{context_name}"
+            for dependency in context.dependencies:
+                target = (
+                    dependency if "." in dependency else f"{domain_name}.{dependency}"
+                )
+                if target in graph:
+                    graph[node].add(target)
+                elif target not in known:
+                    raise ValueError(
+                        f"Bounded context {node} depends on unknown context "
+                        f"{dependency}"
+                    )
+
+    levels: List[List[str]] = []
+    remaining = dict(graph)
+    done: Set[str] = set()
+    while remaining:
+        level = sorted(node for node, deps in remaining.items() if deps <= done)
+        if not level:
+            raise DependencyCycleError(
+                f"Dependency cycle between bounded contexts: {_find_cycle(remaining)}"
+            )
+        for node in level:
+            del remaining[node]
+        done.update(level)
+        levels.append(level)
+    return levels
+
+
+def generate_from_spec(
+    spec_path: Union[str, Path],
+    project_dir: Union[str, Path],
+    max_workers: Optional[int] = None,
+    engine: Optional[TemplateEngine] = None,
+) -> GenerateResult:
+    """Generate every domain and bounded context of a spec into a project.
+
+    Contexts are rendered level by level of their dependency graph, each
+    level spread across a process pool, so wall time follows the depth of
+    the graph rather than the number of contexts. ``.nagraj.yaml`` is
+    patched once per domain at the end. Contexts already configured in the
+    project are skipped. If a level fails, its outputs are removed and the
+    completed levels recorded, so the spec can be generated again.
+
+    Args:
+        spec_path: YAML file describing a full project configuration.
+        project_dir: Root directory of a generated project.
+        max_workers: Number of worker processes, ``1`` renders in-process.
+        engine: Template engine used when rendering in-process.
+
+    Returns:
+        The generated domains and the context levels.
+
+    Raises:
+        FileNotFoundError: If the spec or ``.nagraj.yaml`` does not exist.
+        FileExistsError: If an output directory exists but is not configured.
+        ValueError: If a name is invalid or a dependency is unknown.
+        DependencyCycleError: If the dependencies form a cycle.
+    """
+    project_dir = Path(project_dir)
+    spec = load_project_spec(spec_path)
+    config_file = ProjectConfigFile.find(project_dir)
+    existing = config_file.to_config()
+    known = {
+        f"{domain_name}.{context_name}"
+        for domain_name, domain in existing.domains.items()
+        for context_name in domain.bounded_contexts
+    }
+
+    result = GenerateResult()
+    pending = spec.model_copy(deep=True)
+    for domain_name, domain in pending.domains.items():
+        if domain_name not in existing.domains:
+            # Applies the same naming rules as adding a single domain
+            DomainConfig(name=domain_name)
+        check_package_name(domain_name, "domain")
+        for context_name in list(domain.bounded_contexts):
+            check_package_name(context_name, "bounded context")
+            if f"{domain_name}.{context_name}" in known:
+                result.skipped.append(f"{domain_name}.{context_name}")
+                del domain.bounded_contexts[context_name]
+    levels = dependency_levels(pending, known)
+
+    project_slug = get_project_slug(project_dir, existing.name)
+    package_dir = project_dir / project_slug
+    new_domains = [name for name in spec.domains if name not in existing.domains]
+    for domain_name in new_domains:
+        _check_free(package_dir / domain_name)
+    for node in (node for level in levels for node in level):
+        domain_name, context_name = node.split(".", 1)
+        _check_free(package_dir / domain_name / "bounded_contexts" / context_name)
+
+    def context_job(node: str) -> RenderJob:
+        domain_name, context_name = node.split(".", 1)
+        context = {
+            "project_slug": project_slug,
+            "domain_name": domain_name,
+            "context_name": context_name,
+        }
+        parent = package_dir / domain_name / "bounded_contexts"
+        return CONTEXT_TEMPLATE, context, str(parent)
+
+    batches: List[List[RenderJob]] = [
+        [
+            (
+                DOMAIN_TEMPLATE,
+                {"project_slug": project_slug, "domain_name": name},
+                str(package_dir),
+            )
+            for name in new_domains
+        ]
+    ]
+    batches.extend([context_job(node) for node in level] for level in levels)
+
+    batches = [batch for batch in batches if batch]
+    completed = 0
+    try:
+        if max_workers == 1 or not batches:
+            engine = engine or template_engine
+            for batch in batches:
+                for job in batch:
+                    _render_job(engine, job)
+                completed += 1
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                for batch in batches:
+                    # Wait for a whole level before starting the next one
+                    list(executor.map(_render_in_worker, batch, chunksize=8))
+                    completed += 1
+    except BaseException:
+        # Completed levels are kept and recorded, so that generating the spec
+        # again resumes with the failed level
+        for job in batches[completed]:
+            shutil.rmtree(_job_target(job), ignore_errors=True)
+        if new_domains:
+            new_domains = new_domains if completed else []
+            completed = max(completed - 1, 0)
+        levels = levels[:completed]
+        _update_project_config(project_dir, config_file, spec, new_domains, levels)
+        raise
+
+    result.domains = new_domains
+    result.levels = levels
+    _update_project_config(project_dir, config_file, spec, new_domains, levels)
+    return result
+
+
+def _render_job(engine: TemplateEngine, job: RenderJob) -> str:
+    """Render one template into its parent directory."""
+    template_name, context, parent = job
+    plan = engine.plan_project(template_name, context)
+    target = Path(parent) / plan.name
+    engine.write_project(plan, target)
+    if template_name == DOMAIN_TEMPLATE:
+        (target / "bounded_contexts").mkdir()
+    return str(target)
+
+
+def _job_target(job: RenderJob) -> Path:
+    """Return the directory a job renders into."""
+    _, context, parent = job
+    return Path(parent) / context.get("context_name", context["domain_name"])
+
+
+def _render_in_worker(job: RenderJob) -> str:
+    """Render a job with an engine created once per worker process."""
+    global _worker_engine
+    if _worker_engine is None:
+        _worker_engine = TemplateEngine()
+    return _render_job(_worker_engine, job)
+
+
+def _update_project_config(
+    project_dir: Path,
+    config_file: ProjectConfigFile,
+    spec: NagrajProjectConfig,
+    new_domains: List[str],
+    levels: List[List[str]],
+) -> None:
+    """Record the generated domains and contexts in ``.nagraj.yaml``."""
+    contexts: Dict[str, List[str]] = {}
+    for node in (node for level in levels for node in level):
+        domain_name, context_name = node.split(".", 1)
+        contexts.setdefault(domain_name, []).append(context_name)
+    # Keep the spec's ordering of contexts within each domain
+    for domain_name, names in contexts.items():
+        order = {
+            name: i for i, name in enumerate(spec.domains[domain_name].bounded_contexts)
+        }
+        names.sort(key=order.__getitem__)
+
+    config_file.add_domains(
+        {domain_name: contexts.pop(domain_name, []) for domain_name in new_domains}
+    )
+    for domain_name, names in contexts.items():
+        config_file.add_bounded_contexts(domain_name, names)
+    if new_domains or levels:
+        config_file.set_updated_at(datetime.now(UTC))
+        save_project_config(project_dir, config_file)
+
+
+def _check_free(path: Path) -> None:
+    """Ensure an output directory does not exist yet."""
+    if path.exists():
+        raise FileExistsError(f"Directory already exists: {path}")
+
+
+def _find_cycle(graph: Dict[str, Set[str]]) -> str:
+    """Describe one cycle of a graph in which every node has a dependency."""
+    node = min(graph)
+    path: List[str] = []
+    while node not in path:
+        path.append(node)
+        node = min(dep for dep in graph[node] if dep in graph)
+    cycle = path[path.index(node) :] + [node]
+    return " -> ".join(cycle)
@@ -0,0 +1,192 @@
+"""In-process reader for git configuration files."""
+
+import os
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Same include depth limit as git itself
+MAX_INCLUDE_DEPTH = 10
+
+_SECTION_RE = re.compile(
+    r'^\[\s*([A-Za-z0-9.-]+)(?:\s+"((?:[^"\\]|\\.)*)")?\s*\](.*)$'
+)
+_NAME_RE = re.compile(r"^[A-Za-z][A-Za-z0-9-]*$")
+_ESCAPES = {"\\": "\\", '"': '"', "n": "\n", "t": "\t", "b": "\b"}
+
+
+class GitConfigError(ValueError):
+    """Raised when a git config file cannot be read or parsed."""
+
+
+def global_config_paths() -> List[Path]:
+    """Return the global git config files in increasing order of precedence.
+
+    Mirrors ``git config --global``: ``$GIT_CONFIG_GLOBAL`` if set, otherwise
+    the XDG config file followed by ``~/.gitconfig``.
+    """
+    override = os.environ.get("GIT_CONFIG_GLOBAL")
+    if override:
+        return [Path(override).expanduser()]
+    xdg_home = os.environ.get("XDG_CONFIG_HOME") or str(Path.home() / ".config")
+    return [Path(xdg_home) / "git" / "config", Path.home() / ".gitconfig"]
+
+
+def normalize_key(key: str) -> str:
+    """Normalize a ``section[.subsection].name`` key for lookups.
+
+    Section and variable names are case-insensitive, subsections are not.
+    """
+    section, _, rest = key.partition(".")
+    subsection, _, name = rest.rpartition(".")
+    if not section or not name:
+        raise GitConfigError(f"Invalid git config key: {key}")
+    if subsection:
+        return f"{section.lower()}.{subsection}.{name.lower()}"
+    return f"{section.lower()}.{name.lower()}"
+
+
+@lru_cache(maxsize=None)
+def read_global_git_config() -> Dict[str, str]:
+    """Parse the global git config files once per process.
+
+    Returns:
+        A mapping of normalized keys to their effective values.
+
+    Raises:
+        GitConfigError: If a config file exists but cannot be parsed.
+    """
+    values: Dict[str, str] = {}
+    for path in global_config_paths():
+        if path.is_file():
+            parse_git_config(path, values)
+    return values
+
+
+def parse_git_config(
+    path: Path, values: Optional[Dict[str, str]] = None, depth: int = 0
+) -> Dict[str, str]:
+    """Parse a git config file into a flat mapping of keys to values.
+
+    ``[include] path`` directives are followed in place. ``[includeIf]``
+    sections are ignored, as they are by ``git config --global``. Later
+    assignments override earlier ones.
+
+    Args:
+        path: The config file to parse.
+        values: Mapping to update, a new one is created if omitted.
+        depth: Current include depth.
+
+    Returns:
+        The updated mapping of normalized keys to values.
+
+    Raises:
+        GitConfigError: If the file cannot be read or has invalid syntax.
+    """
+    if values is None:
+        values = {}
+    if depth > MAX_INCLUDE_DEPTH:
+        raise GitConfigError(f"Exceeded maximum include depth in {path}")
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except (OSError, UnicodeDecodeError) as e:
+        raise GitConfigError(f"Failed to read {path}: {e}") from e
+
+    section: Optional[str] = None
+    index = 0
+    while index < len(lines):
+        lineno = index + 1
+        line = lines[index].strip()
+        index += 1
+        if line.startswith("["):
+            section, line = _parse_section(line, path, lineno)
+            line = line.strip()
+        if not line or line[0] in "#;":
+            continue
+        if section is None:
+            raise GitConfigError(f"{path}:{lineno}: value outside of a section")
+
+        name, separator, raw_value = line.partition("=")
+        name = name.strip()
+        if not _NAME_RE.match(name):
+            raise GitConfigError(f"{path}:{lineno}: invalid variable name {name!r}")
+        value = "true"
+        if separator:
+            value, index = _parse_value(raw_value, lines, index, path, lineno)
+
+        if section == "include" and name.lower() == "path":
+            _include(path, value, values, depth)
+        elif not section.startswith("includeif."):
+            values[f"{section}.{name.lower()}"] = value
+    return values
+
+
+def _parse_section(line: str, path: Path, lineno: int) -> Tuple[str, str]:
+    """Parse a section header, returning the section key and trailing text."""
+    match = _SECTION_RE.match(line)
+    if not match:
+        raise GitConfigError(f"{path}:{lineno}: invalid section header")
+    name, subsection, rest = match.groups()
+    if subsection is not None:
+        subsection = re.sub(r"\\(.)", r"\1", subsection)
+        return f"{name.lower()}.{subsection}", rest
+    # Deprecated [section.subsection] syntax, subsection is lowercased
+    return name.lower(), rest
+
+
+def _parse_value(
+    text: str, lines: List[str], index: int, path: Path, lineno: int
+) -> Tuple[str, int]:
+    """Parse a value, following line continuations.
+
+    Returns:
+        A tuple of (value, index of the next unread line).
+    """
+    chars: List[str] = []
+    kept = 0
+    quoted = False
+    text = text.lstrip()
+    while True:
+        position = 0
+        continued = False
+        while position < len(text):
+            char = text[position]
+            position += 1
+            if char == "\\":
+                if position == len(text):
+                    continued = True
+                    break
+                escaped = text[position]
+                position += 1
+                if escaped not in _ESCAPES:
+                    raise GitConfigError(f"{path}:{lineno}: invalid escape \\{escaped}")
+                chars.append(_ESCAPES[escaped])
+                kept = len(chars)
+            elif char == '"':
+                quoted = not quoted
+                kept = len(chars)
+            elif not quoted and char in "#;":
+                break
+            else:
+                chars.append(char)
+                if quoted or not char.isspace():
+                    kept = len(chars)
+        if not continued:
+            break
+        if index >= len(lines):
+            raise GitConfigError(f"{path}:{lineno}: unterminated line continuation")
+        text = lines[index]
+        index += 1
+    if quoted:
+        raise GitConfigError(f"{path}:{lineno}: unterminated quoted value")
+    return "".join(chars[:kept]), index
+
+
+def _include(path: Path, value: str, values: Dict[str, str], depth: int) -> None:
+    """Parse an included config file, resolved relative to the including file."""
+    include_path = Path(value).expanduser()
+    if not include_path.is_absolute():
+        include_path = path.parent / include_path
+    if include_path.is_file():
+        parse_git_config(include_path, values, depth + 1)
@@ -0,0 +1,72 @@
+"""Manifest of the files nagraj rendered into a project."""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import BaseModel, Field
+
+from nagraj import __version__
+from nagraj.core.writer import write_file_atomic
+
+MANIFEST_FILE = ".nagraj.manifest.json"
+
+
+def hash_content(content: bytes) -> str:
+    """Return the hex digest used to track rendered file contents."""
+    return hashlib.sha256(content).hexdigest()
+
+
+class ProjectManifest(BaseModel):
+    """Record of the template, context and output hashes of a project.
+
+    The manifest lives next to ``.nagraj.yaml`` and lets later commands
+    re-render the project in memory and touch only files whose rendered
+    output actually changed. The template variables each file read while
+    rendering are recorded in ``keys``, so that changing a variable only
+    needs to re-render the files that read it, as long as the template is
+    still the one the project was rendered from.
+    """
+
+    nagraj_version: str = __version__
+    template: str
+    template_digest: Optional[str] = None
+    context: Dict[str, Any] = Field(default_factory=dict)
+    files: Dict[str, str] = Field(default_factory=dict)
+    keys: Dict[str, List[str]] = Field(default_factory=dict)
+
+    @classmethod
+    def path_for(cls, project_dir: Union[str, Path]) -> Path:
+        """Return the manifest path of a project directory."""
+        return Path(project_dir) / MANIFEST_FILE
+
+    @classmethod
+    def load(cls, project_dir: Union[str, Path]) -> "ProjectManifest":
+        """Load the manifest of a project.
+
+        Raises:
+            FileNotFoundError: If the project has no manifest.
+        """
+        path = cls.path_for(project_dir)
+        if not path.is_file():
+            raise FileNotFoundError(f"No nagraj manifest found at {path}")
+        return cls.model_validate_json(path.read_bytes())
+
+    def dumps(self) -> str:
+        """Serialize the manifest with files in a stable order."""
+        data = self.model_dump(mode="json")
+        data["files"] = dict(sorted(self.files.items()))
+        data["keys"] = dict(sorted(self.keys.items()))
+        return json.dumps(data, indent=2) + "\n"
+
+    def is_current(self, template_digest: str) -> bool:
+        """Whether the recorded keys still hold for a template digest."""
+        return (
+            self.nagraj_version == __version__
+            and self.template_digest == template_digest
+        )
+
+    def save(self, project_dir: Union[str, Path]) -> None:
+        """Write the manifest into a project directory."""
+        write_file_atomic(self.path_for(project_dir), self.dumps().encode("utf-8"))
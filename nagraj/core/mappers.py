@@ -0,0 +1,522 @@
+"""Generation of mappers between aggregates and their ORM models.
+
+The field declarations of an aggregate and of its ORM model, including the
+fields inherited from base classes of the project, are read from source with
+:mod:`ast`. Nothing of the generated project is imported, so mappers can be
+generated without its dependencies installed. The emitted functions copy
+every field in straight-line code, and build the aggregate with
+``model_construct`` since the stored state was validated when it was saved.
+
+Fields are paired by name. A field holding a value object is stored in one
+column named after the field, or prefixed with it, such as ``password`` in
+``password_hash``:
+
+- A dataclass with a single field is stored as that field.
+- Any other value object needs one property returning the column type and
+  one ``from_*`` classmethod taking it, such as ``Password.hashed_value``
+  and ``Password.from_hash``.
+
+A column without a field that matches a read-only property of the
+aggregate, such as ``version``, is read from the property and restored into
+the attribute behind it. Columns and fields with a default may be left
+unpaired.
+"""
+
+import ast
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from nagraj.config.project import ProjectConfigFile
+from nagraj.core.scaffold import get_project_slug
+from nagraj.core.writer import write_file_atomic
+
+MAPPERS_PACKAGE = "mappers"
+ORM_SUFFIX = "ORM"
+AGGREGATE_SUFFIX = "Aggregate"
+
+MAPPERS_INIT = '"""Mappers between aggregates and their ORM models."""\n'
+
+
+@dataclass
+class ModelField:
+    """A field declared in a class body."""
+
+    name: str
+    annotation: ast.expr
+    has_default: bool
+    # Module declaring the field, which resolves the names of the annotation
+    module: Path
+
+
+@dataclass
+class ModelClass:
+    """Declarations of a class and of its base classes in the project."""
+
+    name: str
+    path: Path
+    fields: Dict[str, ModelField] = field(default_factory=dict)
+    # Return annotation of every property, by name
+    properties: Dict[str, Optional[str]] = field(default_factory=dict)
+    # Parameter annotation of every single-argument ``from_*`` classmethod
+    factories: Dict[str, Optional[str]] = field(default_factory=dict)
+    # Attributes assigned as ``self._name`` in a method
+    private: Set[str] = field(default_factory=set)
+    is_dataclass: bool = False
+
+
+@dataclass
+class MapperFile:
+    """A generated mapper module."""
+
+    path: Path
+    aggregate: str
+    orm: str
+    changed: bool
+
+
+class SourceIndex:
+    """Classes of a project package, resolved through the imports of modules.
+
+    Args:
+        package_dir: Directory of the top-level package of the project.
+    """
+
+    def __init__(self, package_dir: Path) -> None:
+        self.package_dir = package_dir
+        self._modules: Dict[Path, ast.Module] = {}
+        self._classes: Dict[Tuple[Path, str], ModelClass] = {}
+
+    def parse(self, path: Path) -> ast.Module:
+        """Parse a module once."""
+        if path not in self._modules:
+            self._modules[path] = ast.parse(path.read_bytes(), filename=str(path))
+        return self._modules[path]
+
+    def find_class(
+        self, path: Path, name: str, depth: int = 0
+    ) -> Optional[Tuple[Path, ast.ClassDef]]:
+        """Find a class defined in, or imported into, a module.
+
+        Returns:
+            The module defining the class and its definition, or ``None`` if
+            the class is not defined in the project.
+        """
+        module = self.parse(path)
+        for node in module.body:
+            if isinstance(node, ast.ClassDef) and node.name == name:
+                return path, node
+        if depth > 16:
+            return None
+        for node in module.body:
+            if not isinstance(node, ast.ImportFrom):
+                continue
+            for alias in node.names:
+                if (alias.asname or alias.name) != name:
+                    continue
+                target = self._resolve_module(path, node.module, node.level)
+                if target is None:
+                    return None
+                return self.find_class(target, alias.name, depth + 1)
+        return None
+
+    def load(self, path: Path, name: str) -> ModelClass:
+        """Collect the declarations of a class and of its project base classes.
+
+        Raises:
+            ValueError: If the class is not defined in the project.
+        """
+        found = self.find_class(path, name)
+        if found is None:
+            raise ValueError(f"Class {name} not found in {path}")
+        class_path, node = found
+        key = (class_path, node.name)
+        if key not in self._classes:
+            self._classes[key] = self._collect(class_path, node)
+        return self._classes[key]
+
+    def _collect(self, path: Path, node: ast.ClassDef) -> ModelClass:
+        """Collect the declarations of a class, base classes first."""
+        model = ModelClass(node.name, path)
+        for base in node.bases:
+            if isinstance(base, ast.Name) and self.find_class(path, base.id):
+                inherited = self.load(path, base.id)
+                model.fields.update(inherited.fields)
+                model.properties.update(inherited.properties)
+                model.factories.update(inherited.factories)
+                model.private |= inherited.private
+        model.is_dataclass = any(
+            _decorator_name(decorator) == "dataclass"
+            for decorator in node.decorator_list
+        )
+
+        for statement in node.body:
+            if isinstance(statement, ast.AnnAssign):
+                target = statement.target
+                annotation = ast.unparse(statement.annotation)
+                if (
+                    isinstance(target, ast.Name)
+                    and not target.id.startswith("_")
+                    and not annotation.startswith("ClassVar")
+                ):
+                    model.fields[target.id] = ModelField(
+                        target.id,
+                        statement.annotation,
+                        _has_default(statement.value),
+                        path,
+                    )
+            elif isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                decorators = {_decorator_name(d) for d in statement.decorator_list}
+                if "property" in decorators:
+                    returns = statement.returns
+                    model.properties[statement.name] = (
+                        ast.unparse(returns) if returns is not None else None
+                    )
+                elif "classmethod" in decorators and statement.name.startswith("from_"):
+                    args = statement.args.args[1:]
+                    if len(args) == 1:
+                        annotation_node = args[0].annotation
+                        model.factories[statement.name] = (
+                            ast.unparse(annotation_node)
+                            if annotation_node is not None
+                            else None
+                        )
+                for child in ast.walk(statement):
+                    if (
+                        isinstance(child, ast.Attribute)
+                        and isinstance(child.ctx, ast.Store)
+                        and isinstance(child.value, ast.Name)
+                        and child.value.id == "self"
+                        and child.attr.startswith("_")
+                    ):
+                        model.private.add(child.attr)
+        return model
+
+    def _resolve_module(
+        self, path: Path, module: Optional[str], level: int
+    ) -> Optional[Path]:
+        """Return the file of an imported module, if it is part of the project."""
+        parts = module.split(".") if module else []
+        if level:
+            base = path.parent
+            for _ in range(level - 1):
+                base = base.parent
+        elif parts and parts[0] == self.package_dir.name:
+            base = self.package_dir.parent
+        else:
+            return None
+        target = base.joinpath(*parts)
+        if target.with_suffix(".py").is_file():
+            return target.with_suffix(".py")
+        if (target / "__init__.py").is_file():
+            return target / "__init__.py"
+        return None
+
+
+def find_mappers(package_dir: Path) -> List[Tuple[Path, str, Path, str]]:
+    """Find the aggregates that have an ORM model.
+
+    An ORM model ``NameORM`` declared with ``table=True`` in
+    ``infrastructure/orms`` of a bounded context is paired with the
+    aggregate ``NameAggregate`` in ``domain/aggregates`` of the same context.
+
+    Returns:
+        The module and name of every aggregate and of its ORM model.
+    """
+    pairs = []
+    for orm_path in sorted(package_dir.glob("**/infrastructure/orms/*.py")):
+        context_dir = orm_path.parents[2]
+        module = ast.parse(orm_path.read_bytes(), filename=str(orm_path))
+        for node in module.body:
+            if not (
+                isinstance(node, ast.ClassDef)
+                and node.name.endswith(ORM_SUFFIX)
+                and any(
+                    keyword.arg == "table"
+                    and isinstance(keyword.value, ast.Constant)
+                    and keyword.value.value is True
+                    for keyword in node.keywords
+                )
+            ):
+                continue
+            aggregate_name = node.name[: -len(ORM_SUFFIX)] + AGGREGATE_SUFFIX
+            aggregates_dir = context_dir / "domain" / "aggregates"
+            for aggregate_path in sorted(aggregates_dir.glob("*.py")):
+                source = aggregate_path.read_text()
+                if re.search(rf"^class {aggregate_name}\b", source, re.MULTILINE):
+                    pairs.append((aggregate_path, aggregate_name, orm_path, node.name))
+                    break
+    return pairs
+
+
+def render_mapper(
+    index: SourceIndex,
+    mapper_path: Path,
+    aggregate_path: Path,
+    aggregate_name: str,
+    orm_path: Path,
+    orm_name: str,
+) -> str:
+    """Return the source of the mapper module of an aggregate.
+
+    Raises:
+        ValueError: If a field or column cannot be mapped.
+    """
+    aggregate = index.load(aggregate_path, aggregate_name)
+    orm = index.load(orm_path, orm_name)
+    imports = {(aggregate.path, aggregate.name), (orm.path, orm.name)}
+
+    to_orm: List[str] = []
+    to_aggregate: Dict[str, str] = {}
+    restored: List[str] = []
+    paired: Set[str] = set()
+    for column in orm.fields.values():
+        column_type, column_optional = _split_optional(column.annotation)
+        field_name = _field_of_column(aggregate, orm, column.name)
+        if field_name is None:
+            if (
+                column.name in aggregate.properties
+                and f"_{column.name}" in aggregate.private
+            ):
+                to_orm.append(f"{column.name}=aggregate.{column.name}")
+                restored.append(f"aggregate._{column.name} = orm.{column.name}")
+            elif not column.has_default:
+                raise ValueError(
+                    f"Column {column.name} of {orm.name} has no field "
+                    f"in {aggregate.name}"
+                )
+            continue
+
+        paired.add(field_name)
+        source = f"aggregate.{field_name}"
+        stored = f"orm.{column.name}"
+        model_field = aggregate.fields[field_name]
+        field_type, field_optional = _split_optional(model_field.annotation)
+        value_object = None
+        if isinstance(field_type, ast.Name):
+            found = index.find_class(model_field.module, field_type.id)
+            if found is not None:
+                value_object = index.load(found[0], found[1].name)
+        if value_object is None:
+            to_orm.append(f"{column.name}={source}")
+            to_aggregate[field_name] = stored
+            continue
+
+        imports.add((value_object.path, value_object.name))
+        read, build = _value_object_conversion(
+            value_object, ast.unparse(column_type), f"{orm.name}.{column.name}"
+        )
+        to_column = f"{source}.{read}"
+        from_column = build.format(stored)
+        if field_optional or column_optional:
+            to_column = f"None if {source} is None else {to_column}"
+            from_column = f"None if {stored} is None else {from_column}"
+        to_orm.append(f"{column.name}={to_column}")
+        to_aggregate[field_name] = from_column
+
+    for name, model_field in aggregate.fields.items():
+        if name not in paired and not model_field.has_default:
+            raise ValueError(
+                f"Field {name} of {aggregate.name} has no column in {orm.name}"
+            )
+
+    base_name = orm.name[: -len(ORM_SUFFIX)]
+    snake = _snake_case(base_name)
+    label = snake.replace("_", " ")
+    lines = [
+        f'"""Mappers between {aggregate.name} and {orm.name}.',
+        "",
+        "Generated by ``nagraj gen mappers`` from the field declarations of both",
+        "models, do not edit. Run ``nagraj gen mappers`` again after changing them.",
+        '"""',
+        "",
+    ]
+    # Furthest modules first, as isort orders relative imports
+    for dots, module, name in sorted(
+        ((*_relative_module(mapper_path, path), name) for path, name in imports),
+        key=lambda item: (-len(item[0]), item[1], item[2]),
+    ):
+        lines.append(f"from {dots}{module} import {name}")
+    lines += [
+        "",
+        "",
+        f"def {snake}_to_orm(aggregate: {aggregate.name}) -> {orm.name}:",
+        f'    """Convert a {label} aggregate to its ORM model."""',
+        f"    return {orm.name}(",
+        *(f"        {argument}," for argument in to_orm),
+        "    )",
+        "",
+        "",
+        f"def {snake}_to_aggregate(orm: {orm.name}) -> {aggregate.name}:",
+        f'    """Convert an ORM model to a {label} aggregate without validation."""',
+        f"    aggregate = {aggregate.name}.model_construct(",
+        *(f"        {name}={value}," for name, value in to_aggregate.items()),
+        "    )",
+        *(f"    {statement}" for statement in restored),
+        "    return aggregate",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def generate_mappers(
+    project_dir: Union[str, Path], check: bool = False
+) -> List[MapperFile]:
+    """Generate the mapper module of every aggregate with an ORM model.
+
+    Each mapper is written to ``infrastructure/mappers/<name>_mapper.py`` of
+    the bounded context of the aggregate. Modules that are up to date are
+    not rewritten.
+
+    Args:
+        project_dir: Root directory of a generated project.
+        check: Only report which modules are out of date, without writing.
+
+    Returns:
+        Every mapper module, with paths relative to the project directory.
+
+    Raises:
+        FileNotFoundError: If the project has no ``.nagraj.yaml``.
+        ValueError: If a field or column cannot be mapped.
+    """
+    project_dir = Path(project_dir)
+    config = ProjectConfigFile.find(project_dir).to_config()
+    package_dir = project_dir / get_project_slug(project_dir, config.name)
+    index = SourceIndex(package_dir)
+
+    results = []
+    for aggregate_path, aggregate_name, orm_path, orm_name in find_mappers(package_dir):
+        mappers_dir = orm_path.parents[1] / MAPPERS_PACKAGE
+        name = _snake_case(orm_name[: -len(ORM_SUFFIX)])
+        mapper_path = mappers_dir / f"{name}_mapper.py"
+        content = render_mapper(
+            index, mapper_path, aggregate_path, aggregate_name, orm_path, orm_name
+        ).encode()
+        changed = not mapper_path.is_file() or mapper_path.read_bytes() != content
+        if changed and not check:
+            write_file_atomic(mapper_path, content)
+            init_path = mappers_dir / "__init__.py"
+            if not init_path.exists():
+                write_file_atomic(init_path, MAPPERS_INIT.encode())
+        results.append(
+            MapperFile(
+                mapper_path.relative_to(project_dir),
+                aggregate_name,
+                orm_name,
+                changed,
+            )
+        )
+    return results
+
+
+def _field_of_column(
+    aggregate: ModelClass, orm: ModelClass, column: str
+) -> Optional[str]:
+    """Return the aggregate field stored in a column.
+
+    A column is named after its field, or prefixed with the name of a field
+    that has no column of its own name.
+    """
+    if column in aggregate.fields:
+        return column
+    prefixed = [
+        name
+        for name in aggregate.fields
+        if column.startswith(f"{name}_") and name not in orm.fields
+    ]
+    if len(prefixed) > 1:
+        raise ValueError(
+            f"Column {column} of {orm.name} matches several fields of "
+            f"{aggregate.name}: {', '.join(prefixed)}"
+        )
+    return prefixed[0] if prefixed else None
+
+
+def _value_object_conversion(
+    value_object: ModelClass, column_type: str, column: str
+) -> Tuple[str, str]:
+    """Return the attribute storing a value object and the call loading it.
+
+    The call is a format string taking the stored value.
+    """
+    if value_object.is_dataclass and len(value_object.fields) == 1:
+        name = next(iter(value_object.fields))
+        return name, f"{value_object.name}({name}={{}})"
+    reads = [
+        name
+        for name, returns in value_object.properties.items()
+        if returns == column_type
+    ]
+    factories = [
+        name
+        for name, argument in value_object.factories.items()
+        if argument == column_type
+    ]
+    if len(reads) != 1 or len(factories) != 1:
+        raise ValueError(
+            f"Cannot store {value_object.name} in column {column}: it needs a "
+            f"single property returning {column_type} and a single from_* "
+            f"classmethod taking it"
+        )
+    return reads[0], f"{value_object.name}.{factories[0]}({{}})"
+
+
+def _split_optional(annotation: ast.expr) -> Tuple[ast.expr, bool]:
+    """Split ``X | None`` and ``Optional[X]`` into ``X`` and whether it is optional."""
+    if isinstance(annotation, ast.BinOp) and isinstance(annotation.op, ast.BitOr):
+        for inner, other in (
+            (annotation.left, annotation.right),
+            (annotation.right, annotation.left),
+        ):
+            if isinstance(other, ast.Constant) and other.value is None:
+                return inner, True
+    if (
+        isinstance(annotation, ast.Subscript)
+        and isinstance(annotation.value, ast.Name)
+        and annotation.value.id == "Optional"
+    ):
+        return annotation.slice, True
+    return annotation, False
+
+
+def _has_default(value: Optional[ast.expr]) -> bool:
+    """Whether a field declared with this value has a default."""
+    if value is None:
+        return False
+    if isinstance(value, ast.Call) and _decorator_name(value.func) == "Field":
+        if value.args:
+            first = value.args[0]
+            return not (isinstance(first, ast.Constant) and first.value is Ellipsis)
+        return any(
+            keyword.arg in ("default", "default_factory") for keyword in value.keywords
+        )
+    return True
+
+
+def _decorator_name(node: ast.expr) -> Optional[str]:
+    """Return the name of a decorator or called function."""
+    if isinstance(node, ast.Call):
+        node = node.func
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def _relative_module(from_path: Path, to_path: Path) -> Tuple[str, str]:
+    """Return the leading dots and module of a relative import between files."""
+    source = from_path.parent.parts
+    target = (
+        to_path.parent if to_path.name == "__init__.py" else to_path.with_suffix("")
+    ).parts
+    common = 0
+    while common < min(len(source), len(target)) and source[common] == target[common]:
+        common += 1
+    return "." * (len(source) - common + 1), ".".join(target[common:])
+
+
+def _snake_case(name: str) -> str:
+    """Convert a class name such as ``OrderItem`` to ``order_item``."""
+    return re.sub(r"(?<=[a-z0-9])(?=[A-Z])", "_", name).lower()
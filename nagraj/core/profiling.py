@@ -0,0 +1,217 @@
+"""Lightweight timing of command phases for ``nagraj --profile``.
+
+Code marks phases with :func:`profile_span`, which does nothing unless
+profiling was started. Spans nest per thread into a timing tree that can
+be summarized as the slowest items or exported for Chrome's trace viewer
+(``chrome://tracing``, Perfetto) or speedscope.
+
+This module only uses the standard library, so importing it does not slow
+down CLI startup.
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, ContextManager, Dict, Iterator, List, Optional, Union
+
+PROFILE_FORMATS = ("chrome", "speedscope")
+
+
+@dataclass
+class Span:
+    """A timed phase, with the phases it contains."""
+
+    name: str
+    category: str
+    thread: int
+    start: float
+    end: Optional[float] = None
+    children: List["Span"] = field(default_factory=list)
+
+    @property
+    def duration(self) -> float:
+        """Seconds spent in the span, up to now if it is still open."""
+        end = time.perf_counter() if self.end is None else self.end
+        return end - self.start
+
+    @property
+    def self_time(self) -> float:
+        """Seconds spent in the span outside of its children."""
+        return self.duration - sum(child.duration for child in self.children)
+
+
+class Profiler:
+    """Records a timing tree of spans from any number of threads.
+
+    Spans opened in a thread nest inside the span that thread has open;
+    the first span of a new thread becomes a root of its own.
+    """
+
+    def __init__(self, name: str = "nagraj") -> None:
+        self.name = name
+        self.origin = time.perf_counter()
+        self.roots: List[Span] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._threads: Dict[int, int] = {}
+
+    @contextmanager
+    def span(self, name: str, category: str = "phase") -> Iterator[Span]:
+        """Time the enclosed block as a span."""
+        stack: List[Span] = self._stack()
+        span = Span(name, category, self._thread_number(), time.perf_counter())
+        if stack:
+            stack[-1].children.append(span)
+        else:
+            with self._lock:
+                self.roots.append(span)
+        stack.append(span)
+        try:
+            yield span
+        finally:
+            span.end = time.perf_counter()
+            stack.pop()
+
+    def iter_spans(self) -> Iterator[Span]:
+        """Iterate over every span, parents before their children."""
+        pending = list(reversed(self.roots))
+        while pending:
+            span = pending.pop()
+            yield span
+            pending.extend(reversed(span.children))
+
+    def top(self, count: int) -> List[Span]:
+        """Return the slowest spans by self time."""
+        spans = sorted(self.iter_spans(), key=lambda span: span.self_time)
+        return spans[::-1][:count]
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """Export the spans in the Chrome trace event format."""
+        pid = os.getpid()
+        events: List[Dict[str, Any]] = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": number,
+                "args": {"name": "main" if number == 0 else f"worker {number}"},
+            }
+            for number in sorted(set(self._threads.values()))
+        ]
+        for span in self.iter_spans():
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": (span.start - self.origin) * 1e6,
+                    "dur": span.duration * 1e6,
+                    "pid": pid,
+                    "tid": span.thread,
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def speedscope(self) -> Dict[str, Any]:
+        """Export the spans in the speedscope evented format, one per thread."""
+        frames: List[Dict[str, str]] = []
+        frame_index: Dict[tuple[str, str], int] = {}
+        profiles = []
+        for thread in sorted(set(self._threads.values())):
+            events: List[Dict[str, Any]] = []
+
+            def visit(span: Span) -> None:
+                key = (span.name, span.category)
+                if key not in frame_index:
+                    frame_index[key] = len(frames)
+                    frames.append({"name": span.name, "file": span.category})
+                start = (span.start - self.origin) * 1000
+                events.append({"type": "O", "frame": frame_index[key], "at": start})
+                for child in span.children:
+                    visit(child)
+                end = start + span.duration * 1000
+                events.append({"type": "C", "frame": frame_index[key], "at": end})
+
+            for root in self.roots:
+                if root.thread == thread:
+                    visit(root)
+            profiles.append(
+                {
+                    "type": "evented",
+                    "name": "main" if thread == 0 else f"worker {thread}",
+                    "unit": "milliseconds",
+                    "startValue": events[0]["at"] if events else 0,
+                    "endValue": events[-1]["at"] if events else 0,
+                    "events": events,
+                }
+            )
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": self.name,
+            "exporter": "nagraj",
+            "shared": {"frames": frames},
+            "profiles": profiles,
+        }
+
+    def dump(self, path: Union[str, Path], profile_format: str = "chrome") -> None:
+        """Write the spans to a JSON file.
+
+        Raises:
+            ValueError: If the format is not one of :data:`PROFILE_FORMATS`.
+        """
+        if profile_format == "chrome":
+            data = self.chrome_trace()
+        elif profile_format == "speedscope":
+            data = self.speedscope()
+        else:
+            raise ValueError(
+                f"Unsupported profile format {profile_format}, "
+                f"expected one of: {', '.join(PROFILE_FORMATS)}"
+            )
+        Path(path).write_text(json.dumps(data))
+
+    def _stack(self) -> List[Span]:
+        """Return the open spans of the current thread."""
+        stack: Optional[List[Span]] = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _thread_number(self) -> int:
+        """Return a small stable number for the current thread."""
+        ident = threading.get_ident()
+        with self._lock:
+            return self._threads.setdefault(ident, len(self._threads))
+
+
+_profiler: Optional[Profiler] = None
+
+
+def start_profiling(name: str = "nagraj") -> Profiler:
+    """Start recording spans into a new global profiler."""
+    global _profiler
+    _profiler = Profiler(name)
+    return _profiler
+
+
+def stop_profiling() -> Optional[Profiler]:
+    """Stop recording spans and return the profiler that recorded them."""
+    global _profiler
+    profiler, _profiler = _profiler, None
+    return profiler
+
+
+def profile_span(name: str, category: str = "phase") -> ContextManager[Any]:
+    """Time the enclosed block if profiling is active.
+
+    Example:
+        >>> with profile_span("load settings", "settings"):
+        ...     pass
+    """
+    if _profiler is None:
+        return nullcontext()
+    return _profiler.span(name, category)
@@ -0,0 +1,194 @@
+"""Adding domains and bounded contexts to an existing project."""
+
+import shutil
+from pathlib import Path
+from typing import Iterable, List, Optional, Union
+
+from nagraj.config.project import PROJECT_CONFIG_FILE, ProjectConfigFile
+from nagraj.config.schema import BoundedContextConfig, DomainConfig
+from nagraj.core.manifest import ProjectManifest, hash_content
+from nagraj.core.template import TemplateEngine, template_engine
+
+DOMAIN_TEMPLATE = "nagraj-domain-template"
+CONTEXT_TEMPLATE = "nagraj-bounded-context-template"
+
+
+def add_domain(
+    project_dir: Union[str, Path],
+    domain_name: str,
+    contexts: Iterable[str] = (),
+    engine: Optional[TemplateEngine] = None,
+) -> List[Path]:
+    """Add a domain, and optionally bounded contexts, to a generated project.
+
+    Only the new subtree is rendered and ``.nagraj.yaml`` is patched in place,
+    so the cost does not grow with the size of the existing project.
+
+    Args:
+        project_dir: Root directory of a generated project.
+        domain_name: Name of the new domain.
+        contexts: Names of bounded contexts to create inside the domain.
+        engine: Template engine to render with, defaults to the global engine.
+
+    Returns:
+        The created domain directory followed by any bounded context directories.
+
+    Raises:
+        FileNotFoundError: If the project has no ``.nagraj.yaml``.
+        FileExistsError: If the domain directory already exists.
+        ValueError: If a name is invalid or the domain is already configured.
+    """
+    engine = engine or template_engine
+    project_dir = Path(project_dir)
+    config_file = ProjectConfigFile.find(project_dir)
+    config = config_file.to_config()
+    if domain_name in config.domains:
+        raise ValueError(f"Domain {domain_name} already exists")
+    check_package_name(domain_name, "domain")
+    domain = DomainConfig(name=domain_name)
+    for context_name in contexts:
+        check_package_name(context_name, "bounded context")
+        domain.add_bounded_context(BoundedContextConfig(name=context_name))
+    config.add_domain(domain)
+
+    project_slug = get_project_slug(project_dir, config.name)
+    plan = engine.plan_project(
+        DOMAIN_TEMPLATE, {"project_slug": project_slug, "domain_name": domain_name}
+    )
+    domain_dir = project_dir / project_slug / plan.name
+    if domain_dir.exists():
+        raise FileExistsError(f"Domain directory already exists: {domain_dir}")
+    engine.write_project(plan, domain_dir)
+    try:
+        (domain_dir / "bounded_contexts").mkdir()
+        created = [domain_dir]
+        for context_name in domain.bounded_contexts:
+            created.append(
+                _write_context(
+                    engine, project_slug, domain_dir, domain_name, context_name
+                )
+            )
+        config_file.add_domain(domain_name, domain.bounded_contexts)
+        config_file.set_updated_at(config.updated_at)
+        save_project_config(project_dir, config_file)
+    except BaseException:
+        shutil.rmtree(domain_dir, ignore_errors=True)
+        raise
+    return created
+
+
+def add_bounded_context(
+    project_dir: Union[str, Path],
+    domain_name: str,
+    context_name: str,
+    engine: Optional[TemplateEngine] = None,
+) -> Path:
+    """Add a bounded context to an existing domain of a generated project.
+
+    Args:
+        project_dir: Root directory of a generated project.
+        domain_name: Name of the domain that owns the context.
+        context_name: Name of the new bounded context.
+        engine: Template engine to render with, defaults to the global engine.
+
+    Returns:
+        The created bounded context directory.
+
+    Raises:
+        FileNotFoundError: If the project has no ``.nagraj.yaml``.
+        FileExistsError: If the bounded context directory already exists.
+        ValueError: If the domain does not exist or the context already does.
+    """
+    engine = engine or template_engine
+    project_dir = Path(project_dir)
+    config_file = ProjectConfigFile.find(project_dir)
+    config = config_file.to_config()
+    if domain_name not in config.domains:
+        raise ValueError(f"Domain {domain_name} does not exist")
+    check_package_name(context_name, "bounded context")
+    config.domains[domain_name].add_bounded_context(
+        BoundedContextConfig(name=context_name)
+    )
+    config.add_bounded_context(
+        domain_name, config.domains[domain_name].bounded_contexts[context_name]
+    )
+
+    project_slug = get_project_slug(project_dir, config.name)
+    domain_dir = project_dir / project_slug / domain_name
+    context_dir = _write_context(
+        engine, project_slug, domain_dir, domain_name, context_name
+    )
+    try:
+        config_file.add_bounded_context(domain_name, context_name)
+        config_file.set_updated_at(config.updated_at)
+        save_project_config(project_dir, config_file)
+    except BaseException:
+        shutil.rmtree(context_dir, ignore_errors=True)
+        raise
+    return context_dir
+
+
+def save_project_config(project_dir: Path, config_file: ProjectConfigFile) -> None:
+    """Save an edited ``.nagraj.yaml`` and record its new hash in the manifest.
+
+    Without the new hash, ``nagraj sync`` would take the edit for a local
+    modification of the file.
+    """
+    config_file.save()
+    try:
+        manifest = ProjectManifest.load(project_dir)
+    except FileNotFoundError:
+        return
+    manifest.files[PROJECT_CONFIG_FILE] = hash_content(config_file.text.encode("utf-8"))
+    manifest.save(project_dir)
+
+
+def _write_context(
+    engine: TemplateEngine,
+    project_slug: str,
+    domain_dir: Path,
+    domain_name: str,
+    context_name: str,
+) -> Path:
+    """Render the bounded context template into a domain directory."""
+    plan = engine.plan_project(
+        CONTEXT_TEMPLATE,
+        {
+            "project_slug": project_slug,
+            "domain_name": domain_name,
+            "context_name": context_name,
+        },
+    )
+    context_dir = domain_dir / "bounded_contexts" / plan.name
+    if context_dir.exists():
+        raise FileExistsError(
+            f"Bounded context directory already exists: {context_dir}"
+        )
+    engine.write_project(plan, context_dir)
+    return context_dir
+
+
+def check_package_name(name: str, kind: str) -> None:
+    """Ensure a domain or bounded context name can be used as a package name.
+
+    Raises:
+        ValueError: If the name is not a valid Python identifier.
+    """
+    if not name.isidentifier():
+        raise ValueError(f"Invalid {kind} name {name!r}: must be a valid identifier")
+
+
+def get_project_slug(project_dir: Path, project_name: str) -> str:
+    """Return the package name of a generated project.
+
+    The slug recorded in the project manifest is preferred; projects without
+    a manifest fall back to deriving it from the project name.
+    """
+    try:
+        slug = ProjectManifest.load(project_dir).context.get("project_slug")
+    except FileNotFoundError:
+        slug = None
+    if slug:
+        return str(slug)
+    # Same derivation as the project template's cookiecutter.json
+    return project_name.lower().replace(" ", "_").replace("-", "_")
@@ -0,0 +1,150 @@
+"""Read-only access to template files on disk or inside a template bundle."""
+
+import hashlib
+import os
+import stat
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Tuple
+
+from jinja2 import BaseLoader, ChoiceLoader, FileSystemLoader
+
+if TYPE_CHECKING:
+    from nagraj.core.bundle import TemplateBundle
+
+# Directory of a template holding files for {% include %} and {% extends %}
+# only, searched after the template directory as Cookiecutter does
+SHARED_TEMPLATES_DIR = "templates"
+
+
+class TemplateSource(ABC):
+    """The files of a single Cookiecutter template.
+
+    Paths are POSIX paths relative to the template directory, the same names
+    the Jinja2 loader returned by :meth:`get_loader` expects.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    @abstractmethod
+    def get_loader(self) -> BaseLoader:
+        """Return a Jinja2 loader rooted at the template directory.
+
+        Names not found there are looked up in :data:`SHARED_TEMPLATES_DIR`.
+        """
+
+    @abstractmethod
+    def read_bytes(self, path: str) -> bytes:
+        """Return the raw contents of a template file."""
+
+    @abstractmethod
+    def get_mode(self, path: str) -> int:
+        """Return the permission bits of a template file."""
+
+    @abstractmethod
+    def list_dir(self, path: str) -> List[Tuple[str, bool]]:
+        """List a directory as (name, is_dir) pairs sorted by name."""
+
+    def read_text(self, path: str) -> str:
+        """Return the contents of a template file decoded as UTF-8."""
+        return self.read_bytes(path).decode("utf-8")
+
+    def digest(self) -> str:
+        """Return a hash of the path, mode and contents of every file.
+
+        Used to tell whether a template changed since a project was
+        rendered from it.
+        """
+        digest = hashlib.sha256()
+        pending = [""]
+        while pending:
+            directory = pending.pop()
+            for name, is_dir in self.list_dir(directory):
+                path = f"{directory}/{name}" if directory else name
+                if is_dir:
+                    # Bytecode of a development checkout is not part of it
+                    if name != "__pycache__":
+                        pending.append(path)
+                    continue
+                digest.update(f"{path}\0{self.get_mode(path):o}\0".encode())
+                digest.update(hashlib.sha256(self.read_bytes(path)).digest())
+        return digest.hexdigest()
+
+    def find_project_root(self) -> str:
+        """Find the templated project directory inside the template."""
+        for name, is_dir in self.list_dir(""):
+            if is_dir and "cookiecutter" in name and "{{" in name:
+                return name
+        raise FileNotFoundError(f"No project template found in {self}")
+
+
+class DirectoryTemplateSource(TemplateSource):
+    """A template read from a directory, used during development."""
+
+    def __init__(self, name: str, directory: Path) -> None:
+        super().__init__(name)
+        self.directory = directory
+
+    def __str__(self) -> str:
+        return str(self.directory)
+
+    def get_loader(self) -> BaseLoader:
+        """Return a loader reading templates from the directory."""
+        return FileSystemLoader(
+            [str(self.directory), str(self.directory / SHARED_TEMPLATES_DIR)]
+        )
+
+    def read_bytes(self, path: str) -> bytes:
+        """Return the raw contents of a template file."""
+        return (self.directory / path).read_bytes()
+
+    def get_mode(self, path: str) -> int:
+        """Return the permission bits of a template file."""
+        return stat.S_IMODE(os.stat(self.directory / path).st_mode)
+
+    def list_dir(self, path: str) -> List[Tuple[str, bool]]:
+        """List a directory as (name, is_dir) pairs sorted by name."""
+        with os.scandir(self.directory / path) as it:
+            entries = [(entry.name, entry.is_dir()) for entry in it]
+        return sorted(entries)
+
+
+class BundleTemplateSource(TemplateSource):
+    """A template read from a packed template bundle."""
+
+    def __init__(self, bundle: "TemplateBundle", name: str) -> None:
+        super().__init__(name)
+        self.bundle = bundle
+
+    def __str__(self) -> str:
+        return f"{self.bundle}:{self.name}"
+
+    def get_loader(self) -> BaseLoader:
+        """Return a loader reading templates from the bundle."""
+        from nagraj.core.bundle import BundleLoader
+
+        return ChoiceLoader(
+            [
+                BundleLoader(self.bundle, prefix=f"{self.name}/"),
+                BundleLoader(
+                    self.bundle, prefix=f"{self.name}/{SHARED_TEMPLATES_DIR}/"
+                ),
+            ]
+        )
+
+    def read_bytes(self, path: str) -> bytes:
+        """Return the raw contents of a template file."""
+        return self.bundle.read(self._path(path))
+
+    def get_mode(self, path: str) -> int:
+        """Return the permission bits of a template file."""
+        return self.bundle.get_mode(self._path(path))
+
+    def list_dir(self, path: str) -> List[Tuple[str, bool]]:
+        """List a directory as (name, is_dir) pairs sorted by name."""
+        return self.bundle.list_dir(self._path(path))
+
+    def _path(self, path: str) -> str:
+        """Return the bundle path of a template-relative path."""
+        return f"{self.name}/{path}" if path else self.name
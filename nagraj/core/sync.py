@@ -0,0 +1,246 @@
+"""Incremental re-rendering of generated projects."""
+
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from nagraj.config.project import PROJECT_CONFIG_FILE, ProjectConfigFile
+from nagraj.core.manifest import ProjectManifest, hash_content
+from nagraj.core.template import (
+    ALL_KEYS,
+    ProjectPlan,
+    TemplateEngine,
+    template_engine,
+)
+from nagraj.core.writer import write_file_atomic
+
+
+@dataclass
+class SyncResult:
+    """Outcome of synchronizing a project with its template."""
+
+    created: List[str] = field(default_factory=list)
+    updated: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    conflicts: List[str] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def changed(self) -> bool:
+        """Whether any file was (or would be) written or removed."""
+        return bool(self.created or self.updated or self.removed)
+
+
+def sync_project(
+    project_dir: Union[str, Path],
+    overrides: Optional[Dict[str, Any]] = None,
+    force: bool = False,
+    dry_run: bool = False,
+    engine: Optional[TemplateEngine] = None,
+) -> SyncResult:
+    """Re-render a project in memory and write only files whose output changed.
+
+    Files whose rendered output hash matches the manifest are never touched,
+    so their mtimes (and any tool caches keyed on them) survive. A file that
+    was edited since it was generated is reported as a conflict instead of
+    being overwritten, unless ``force`` is set.
+
+    Changing ``project_name`` derives ``project_slug`` from the new name again,
+    unless ``project_slug`` is changed as well.
+
+    With overrides, and a template unchanged since the manifest was written,
+    only files that read a changed variable are rendered again, see
+    :func:`affected_paths`. Without overrides every file is rendered, which
+    picks up template changes and repairs outdated manifest hashes.
+
+    Args:
+        project_dir: Root directory of a generated project.
+        overrides: Template variables to change before re-rendering.
+        force: Overwrite or remove locally modified files, except
+            ``.nagraj.yaml``.
+        dry_run: Compute the result without writing anything.
+        engine: Template engine to render with, defaults to the global engine.
+
+    Returns:
+        The files created, updated, removed or left in conflict.
+
+    Raises:
+        FileNotFoundError: If the project has no nagraj manifest.
+    """
+    project_dir = Path(project_dir)
+    engine = engine or template_engine
+    manifest = ProjectManifest.load(project_dir)
+    context = {**manifest.context, **(overrides or {})}
+    if overrides and "project_name" in overrides and "project_slug" not in overrides:
+        # Resolved from the new name by the template's cookiecutter.json
+        context.pop("project_slug", None)
+    plan = engine.plan_project(manifest.template, context)
+    digest = plan.source.digest()
+
+    paths: Iterable[str] = plan.files
+    if overrides and manifest.is_current(digest):
+        paths = affected_paths(manifest, plan)
+    keys: Dict[str, List[str]] = {}
+    files = engine.render_files(plan, paths, keys=keys)
+    keep_added_domains(project_dir, files)
+    result, _ = write_changes(
+        project_dir, manifest, plan, files, force, dry_run, keys, digest
+    )
+    return result
+
+
+def keep_added_domains(project_dir: Path, files: Dict[str, bytes]) -> None:
+    """Carry domains added to a project over into its re-rendered config.
+
+    ``.nagraj.yaml`` is rendered with the domains of the template only.
+    Domains and bounded contexts added since, by ``nagraj add`` or
+    ``nagraj generate``, are inserted into the rendered file in place.
+    """
+    content = files.get(PROJECT_CONFIG_FILE)
+    path = project_dir / PROJECT_CONFIG_FILE
+    if content is None or not path.is_file():
+        return
+    current = ProjectConfigFile(path).to_config()
+    config_file = ProjectConfigFile(path)
+    config_file.text = content.decode("utf-8")
+    rendered = config_file.to_config()
+
+    added = {
+        name: list(domain.bounded_contexts)
+        for name, domain in current.domains.items()
+        if name not in rendered.domains
+    }
+    if added:
+        config_file.add_domains(added)
+    for name, domain in rendered.domains.items():
+        if name in current.domains:
+            missing = [
+                context
+                for context in current.domains[name].bounded_contexts
+                if context not in domain.bounded_contexts
+            ]
+            if missing:
+                config_file.add_bounded_contexts(name, missing)
+    if config_file.text != content.decode("utf-8"):
+        config_file.set_updated_at(current.updated_at)
+        files[PROJECT_CONFIG_FILE] = config_file.text.encode("utf-8")
+
+
+def affected_paths(manifest: ProjectManifest, plan: ProjectPlan) -> List[str]:
+    """Return the outputs of a plan that a change of variables may affect.
+
+    These are the outputs that read a variable whose value differs from
+    the manifest, or whose variables were not recorded. Only valid while
+    the manifest :meth:`~ProjectManifest.is_current`.
+    """
+    old = manifest.context
+    new = plan.context["cookiecutter"]
+    changed = {key for key in old.keys() | new.keys() if old.get(key) != new.get(key)}
+    changed.add(ALL_KEYS)
+    return [
+        path
+        for path in plan.files
+        if path not in manifest.keys or not changed.isdisjoint(manifest.keys[path])
+    ]
+
+
+def write_changes(
+    project_dir: Union[str, Path],
+    manifest: ProjectManifest,
+    plan: ProjectPlan,
+    files: Dict[str, bytes],
+    force: bool = False,
+    dry_run: bool = False,
+    keys: Optional[Dict[str, List[str]]] = None,
+    template_digest: Optional[str] = None,
+) -> Tuple[SyncResult, ProjectManifest]:
+    """Write the rendered files of a plan whose output changed.
+
+    Outputs of the plan missing from ``files`` were not re-rendered and
+    keep their manifest hashes. Files of the manifest that the plan no
+    longer produces are removed.
+
+    Args:
+        project_dir: Root directory of a generated project.
+        manifest: The project's current manifest.
+        plan: Plan the files were rendered from.
+        files: Rendered contents keyed by path relative to the project.
+        force: Overwrite or remove locally modified files, except
+            ``.nagraj.yaml``.
+        dry_run: Compute the result without writing anything.
+        keys: Variables read by the rendered files, see
+            :meth:`TemplateEngine.render_file`.
+        template_digest: Digest of the template the files were rendered
+            from, kept from the manifest if not given.
+
+    Returns:
+        The outcome and the updated manifest, which is saved unless
+        ``dry_run`` is set.
+    """
+    project_dir = Path(project_dir)
+    result = SyncResult()
+    hashes: Dict[str, str] = {
+        path: manifest.files[path]
+        for path in plan.files
+        if path not in files and path in manifest.files
+    }
+    result.unchanged = len(hashes)
+    for path, content in files.items():
+        new_hash = hash_content(content)
+        old_hash = manifest.files.get(path)
+        hashes[path] = new_hash
+        if new_hash == old_hash:
+            result.unchanged += 1
+            continue
+
+        target = project_dir / path
+        if target.is_file():
+            disk_hash = hash_content(target.read_bytes())
+            if disk_hash == new_hash:
+                result.unchanged += 1
+                continue
+            # The project config is an input too, never overwritten by force
+            if disk_hash != old_hash and (not force or path == PROJECT_CONFIG_FILE):
+                result.conflicts.append(path)
+                if old_hash is None:
+                    del hashes[path]
+                else:
+                    hashes[path] = old_hash
+                continue
+            result.updated.append(path)
+        else:
+            result.created.append(path)
+
+        if not dry_run:
+            write_file_atomic(target, content)
+            os.chmod(target, plan.source.get_mode(plan.files[path]))
+
+    for path in sorted(manifest.files.keys() - plan.files.keys()):
+        target = project_dir / path
+        if not target.is_file():
+            continue
+        if force or hash_content(target.read_bytes()) == manifest.files[path]:
+            result.removed.append(path)
+            if not dry_run:
+                target.unlink()
+        else:
+            result.conflicts.append(path)
+            hashes[path] = manifest.files[path]
+
+    recorded = {**manifest.keys, **(keys or {})}
+    # Conflicting files keep hashes that do not match the new context, so
+    # they are left without variables and rendered again by every sync
+    for path in result.conflicts:
+        recorded.pop(path, None)
+    updated_manifest = ProjectManifest(
+        template=manifest.template,
+        template_digest=template_digest or manifest.template_digest,
+        context=plan.context["cookiecutter"],
+        files=hashes,
+        keys={path: recorded[path] for path in hashes if path in recorded},
+    )
+    if not dry_run and updated_manifest != manifest:
+        updated_manifest.save(project_dir)
+
+    return result, updated_manifest
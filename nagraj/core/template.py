@@ -1,20 +1,147 @@
+import json
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Union
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
-from cookiecutter.main import cookiecutter
-from jinja2 import Environment, FileSystemLoader, Template
+from cookiecutter.environment import StrictEnvironment
+from cookiecutter.generate import apply_overwrites_to_context
+from cookiecutter.prompt import prompt_for_config
+from jinja2 import BaseLoader, BytecodeCache, Environment, FileSystemLoader, Template
 
-from nagraj.config.settings import settings
+from nagraj.config.settings import get_settings
+from nagraj.core.archive import ARCHIVE_FORMATS, ArchiveMember, write_archive
+from nagraj.core.bundle import (
+    BundleBytecodeCache,
+    BundleLoader,
+    TemplateBundle,
+    load_bundle,
+)
+from nagraj.core.cache import TemplateBytecodeCache
+from nagraj.core.manifest import MANIFEST_FILE, ProjectManifest, hash_content
+from nagraj.core.profiling import profile_span
+from nagraj.core.sources import (
+    BundleTemplateSource,
+    DirectoryTemplateSource,
+    TemplateSource,
+)
+from nagraj.core.writer import ProjectWriter, write_file_atomic
+
+# Recorded for a file that read the whole context, e.g. by iterating over it
+ALL_KEYS = "*"
+
+
+class RecordingContext(Dict[str, Any]):
+    """A ``cookiecutter`` context that records which variables are read.
+
+    Jinja2 resolves ``cookiecutter.name`` through item access, so every
+    variable a template reads passes through :meth:`__getitem__` or
+    :meth:`get`. Reading the context as a whole records :data:`ALL_KEYS`.
+    """
+
+    def __init__(self, data: Dict[str, Any], reads: Set[str]) -> None:
+        super().__init__(data)
+        self._reads = reads
+
+    def __getitem__(self, key: str) -> Any:
+        self._reads.add(key)
+        return super().__getitem__(key)
+
+    def __contains__(self, key: object) -> bool:
+        self._reads.add(str(key))
+        return super().__contains__(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        self._reads.add(key)
+        return super().get(key, default)
+
+    def __iter__(self) -> Iterator[str]:
+        self._reads.add(ALL_KEYS)
+        return super().__iter__()
+
+    def __len__(self) -> int:
+        self._reads.add(ALL_KEYS)
+        return super().__len__()
+
+    def __repr__(self) -> str:
+        self._reads.add(ALL_KEYS)
+        return super().__repr__()
+
+    def keys(self) -> Any:
+        self._reads.add(ALL_KEYS)
+        return super().keys()
+
+    def values(self) -> Any:
+        self._reads.add(ALL_KEYS)
+        return super().values()
+
+    def items(self) -> Any:
+        self._reads.add(ALL_KEYS)
+        return super().items()
+
+    def copy(self) -> Dict[str, Any]:
+        self._reads.add(ALL_KEYS)
+        return dict(super().items())
+
+
+class ProjectPlan(NamedTuple):
+    """A template walked and resolved for a concrete context."""
+
+    template_name: str
+    source: TemplateSource
+    context: Dict[str, Any]
+    env: Environment
+    name: str
+    directories: List[str]
+    files: Dict[str, str]
 
 
 class TemplateEngine:
     """Template engine abstraction that handles both Cookiecutter and Jinja2."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self, use_cache: bool = True, bundle: Optional[TemplateBundle] = None
+    ) -> None:
+        """Create a template engine.
+
+        Args:
+            use_cache: Whether to use the persistent template cache.
+            bundle: Packed templates to render from. Defaults to the bundle
+                shipped with nagraj, unless a template path was configured
+                explicitly; the template directory is used when neither
+                applies.
+        """
+        settings = get_settings()
+        if bundle is None and "template_path" not in settings.model_fields_set:
+            bundle = load_bundle()
+        self.bundle = bundle
+
+        self.bytecode_cache: Optional[BytecodeCache] = None
+        if use_cache:
+            self.bytecode_cache = TemplateBytecodeCache(
+                settings.cache_dir, settings.cache_max_size
+            )
+        loader: BaseLoader = FileSystemLoader(str(settings.template_path))
+        if bundle is not None:
+            self.bytecode_cache = BundleBytecodeCache(bundle, self.bytecode_cache)
+            loader = BundleLoader(bundle)
         self.jinja_env = Environment(
-            loader=FileSystemLoader(str(settings.template_path)),
+            loader=loader,
             trim_blocks=True,
             lstrip_blocks=True,
+            bytecode_cache=self.bytecode_cache,
         )
 
     def render_template(
@@ -24,26 +151,290 @@ class TemplateEngine:
         template: Template = self.jinja_env.get_template(str(template_path))
         return template.render(**context)
 
+    def has_template(self, template_name: str) -> bool:
+        """Whether a template is available in the bundle or template path."""
+        if self.bundle is not None and template_name in self.bundle.templates:
+            return True
+        return (get_settings().template_path / template_name).exists()
+
+    def get_template_source(self, template_name: str) -> TemplateSource:
+        """Return the files of a template, preferring the bundle.
+
+        Raises:
+            FileNotFoundError: If the template does not exist.
+        """
+        if self.bundle is not None and template_name in self.bundle.templates:
+            return BundleTemplateSource(self.bundle, template_name)
+        template_dir = get_settings().template_path / template_name
+        if not template_dir.is_dir():
+            raise FileNotFoundError(f"Template directory not found: {template_dir}")
+        return DirectoryTemplateSource(template_name, template_dir)
+
+    def build_context(
+        self,
+        source: TemplateSource,
+        extra_context: Dict[str, Any],
+        no_input: bool = True,
+    ) -> Dict[str, Any]:
+        """Build the cookiecutter context for a project template.
+
+        Defaults from ``cookiecutter.json`` are resolved exactly as Cookiecutter
+        would resolve them, so derived values such as ``project_slug`` match.
+        """
+        defaults = json.loads(
+            source.read_text("cookiecutter.json"), object_pairs_hook=OrderedDict
+        )
+        if extra_context:
+            apply_overwrites_to_context(defaults, extra_context)
+        context: Dict[str, Any] = OrderedDict(cookiecutter=defaults)
+        context["cookiecutter"] = prompt_for_config(context, no_input=no_input)
+        return context
+
+    def plan_project(
+        self,
+        template_name: str,
+        context: Dict[str, Any],
+        no_input: bool = True,
+        env: Optional[Environment] = None,
+    ) -> ProjectPlan:
+        """Resolve the context of a template and render every output path.
+
+        Args:
+            template_name: Name of the template directory under the template path.
+            context: Template variables, optionally wrapped in a ``cookiecutter`` key.
+            no_input: Whether to skip prompting for template variables.
+            env: Environment of an earlier plan of the same template to reuse,
+                keeping the templates it already compiled in memory.
+
+        Returns:
+            The plan used to render or write the project.
+        """
+        source = self.get_template_source(template_name)
+
+        # Extract the inner context if it's wrapped in a cookiecutter namespace
+        extra_context = context.get("cookiecutter", context)
+        with profile_span("build context", "plan"):
+            full_context = self.build_context(source, extra_context, no_input)
+
+        if env is None:
+            env = StrictEnvironment(
+                context=full_context,
+                loader=source.get_loader(),
+                keep_trailing_newline=True,
+                bytecode_cache=self.bytecode_cache,
+            )
+        with profile_span("walk template", "plan"):
+            name, directories, files = self._walk_template(env, source, full_context)
+        return ProjectPlan(
+            template_name=template_name,
+            source=source,
+            context=full_context,
+            env=env,
+            name=name,
+            directories=directories,
+            files=files,
+        )
+
+    def render_project(
+        self,
+        template_name: str,
+        context: Dict[str, Any],
+        no_input: bool = True,
+        max_workers: Optional[int] = None,
+        keys: Optional[Dict[str, List[str]]] = None,
+    ) -> Tuple[ProjectPlan, Dict[str, bytes]]:
+        """Render a whole project in memory.
+
+        Args:
+            keys: Filled with the variables each file read, see
+                :meth:`render_file`.
+
+        Returns:
+            A tuple of (plan, rendered contents keyed by path relative to the
+            project directory).
+        """
+        plan = self.plan_project(template_name, context, no_input)
+        return plan, self.render_files(plan, plan.files, max_workers, keys)
+
+    def render_files(
+        self,
+        plan: ProjectPlan,
+        paths: Iterable[str],
+        max_workers: Optional[int] = None,
+        keys: Optional[Dict[str, List[str]]] = None,
+    ) -> Dict[str, bytes]:
+        """Render some output files of a project plan in memory.
+
+        Returns:
+            The rendered contents keyed by path relative to the project
+            directory.
+        """
+        paths = list(paths)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            contents = executor.map(
+                lambda path: self.render_file(plan, path, keys), paths
+            )
+            return dict(zip(paths, contents))
+
+    def render_file(
+        self,
+        plan: ProjectPlan,
+        path: str,
+        keys: Optional[Dict[str, List[str]]] = None,
+    ) -> bytes:
+        """Render a single output file of a project plan.
+
+        Args:
+            plan: Plan the file belongs to.
+            path: Output path relative to the project directory.
+            keys: If given, the ``cookiecutter`` variables the file read
+                are stored in it under ``path``, see
+                :class:`RecordingContext`.
+        """
+        name = plan.files[path]
+        with profile_span(path, "render"):
+            try:
+                with profile_span(name, "load"):
+                    template = plan.env.get_template(name)
+            except UnicodeDecodeError:
+                # Binary files are copied verbatim
+                if keys is not None:
+                    keys[path] = []
+                return plan.source.read_bytes(name)
+            if keys is None:
+                return template.render(**plan.context).encode("utf-8")
+            reads: Set[str] = set()
+            context = {
+                **plan.context,
+                "cookiecutter": RecordingContext(plan.context["cookiecutter"], reads),
+            }
+            content = template.render(**context).encode("utf-8")
+            keys[path] = sorted(reads)
+            return content
+
     def generate_project(
         self,
         template_name: str,
         output_dir: Union[str, Path],
         context: Dict[str, Any],
         no_input: bool = True,
+        max_workers: Optional[int] = None,
+        fsync: Optional[str] = None,
     ) -> Path:
-        """Generate a project structure using Cookiecutter."""
-        template_path = settings.template_path / template_name
+        """Generate a project structure from a Cookiecutter template.
 
-        # Extract the inner context if it's wrapped in a cookiecutter namespace
-        extra_context = context.get("cookiecutter", context)
+        The template is walked once and every file name and file body is
+        rendered with a single shared Jinja2 environment, see
+        :meth:`write_project`. A manifest of the rendered output is written
+        alongside ``.nagraj.yaml``.
+
+        Args:
+            template_name: Name of the template directory under the template path.
+            output_dir: Directory in which the project directory is created.
+            context: Template variables, optionally wrapped in a ``cookiecutter`` key.
+            no_input: Whether to skip prompting for template variables.
+            max_workers: Maximum number of writer threads.
+            fsync: fsync policy, defaults to the ``fsync_policy`` setting.
+
+        Returns:
+            Path to the generated project directory.
+        """
+        plan = self.plan_project(template_name, context, no_input)
+
+        project_dir = Path(output_dir) / plan.name
+        if project_dir.exists():
+            raise FileExistsError(f"Project directory already exists: {project_dir}")
+
+        with ProjectWriter(project_dir, fsync or get_settings().fsync_policy) as writer:
+            keys: Dict[str, List[str]] = {}
+            hashes = self._write_plan(plan, writer, max_workers, keys)
+            manifest = ProjectManifest(
+                template=template_name,
+                template_digest=plan.source.digest(),
+                context=plan.context["cookiecutter"],
+                files=hashes,
+                keys=keys,
+            )
+            writer.write_file(MANIFEST_FILE, manifest.dumps().encode("utf-8"))
 
-        result = cookiecutter(
-            str(template_path),
-            output_dir=str(output_dir),
-            no_input=no_input,
-            extra_context=extra_context,
+        return project_dir.resolve()
+
+    def generate_archive(
+        self,
+        template_name: str,
+        output: BinaryIO,
+        context: Dict[str, Any],
+        archive_format: str = "zip",
+        no_input: bool = True,
+        max_workers: Optional[int] = None,
+    ) -> ProjectPlan:
+        """Render a project in memory and stream it into an archive.
+
+        Nothing is written to the filesystem; the archive holds the same
+        files, modes and manifest that :meth:`generate_project` would write,
+        under a top-level directory named after the project.
+
+        Args:
+            template_name: Name of the template directory under the template path.
+            output: Binary stream to write the archive to, need not be seekable.
+            context: Template variables, optionally wrapped in a ``cookiecutter`` key.
+            archive_format: Either ``zip`` or ``tar.gz``.
+            no_input: Whether to skip prompting for template variables.
+            max_workers: Maximum number of rendering threads.
+
+        Returns:
+            The plan the project was rendered from.
+        """
+        if archive_format not in ARCHIVE_FORMATS:
+            raise ValueError(f"Unsupported archive format {archive_format}")
+        keys: Dict[str, List[str]] = {}
+        plan, files = self.render_project(
+            template_name, context, no_input, max_workers, keys
         )
-        return Path(result)
+        manifest = ProjectManifest(
+            template=template_name,
+            template_digest=plan.source.digest(),
+            context=plan.context["cookiecutter"],
+            files={path: hash_content(content) for path, content in files.items()},
+            keys=keys,
+        )
+        files[MANIFEST_FILE] = manifest.dumps().encode("utf-8")
+
+        def members() -> Iterator[ArchiveMember]:
+            yield ArchiveMember(f"{plan.name}/", None, 0o755)
+            for directory in plan.directories:
+                yield ArchiveMember(f"{plan.name}/{directory}/", None, 0o755)
+            for path in sorted(files):
+                source = plan.files.get(path)
+                mode = 0o644 if source is None else plan.source.get_mode(source)
+                yield ArchiveMember(f"{plan.name}/{path}", files[path], mode)
+
+        write_archive(output, archive_format, members())
+        return plan
+
+    def write_project(
+        self,
+        plan: ProjectPlan,
+        project_dir: Union[str, Path],
+        max_workers: Optional[int] = None,
+        fsync: Optional[str] = None,
+    ) -> Dict[str, str]:
+        """Render the files of a plan into a new directory.
+
+        The tree is written into a staging directory next to ``project_dir``
+        and renamed into place once complete, see :class:`ProjectWriter`.
+
+        Args:
+            plan: Plan to render.
+            project_dir: Directory to create, it must not exist yet.
+            max_workers: Maximum number of writer threads.
+            fsync: fsync policy, defaults to the ``fsync_policy`` setting.
+
+        Returns:
+            The content hash of every written file, keyed by relative path.
+        """
+        with ProjectWriter(project_dir, fsync or get_settings().fsync_policy) as writer:
+            return self._write_plan(plan, writer, max_workers)
 
     def write_template(
         self,
@@ -51,11 +442,69 @@ class TemplateEngine:
         output_path: Union[str, Path],
         context: Dict[str, Any],
     ) -> None:
-        """Render a template and write it to a file."""
+        """Render a template and atomically replace a file with the output."""
         content = self.render_template(template_path, context)
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(content)
+        write_file_atomic(output_path, content.encode("utf-8"))
+
+    @staticmethod
+    def _walk_template(
+        env: Environment,
+        source: TemplateSource,
+        context: Dict[str, Any],
+    ) -> Tuple[str, List[str], Dict[str, str]]:
+        """Walk the template once and render every output path.
+
+        Returns:
+            A tuple of (project directory name, output directories ordered
+            parents first, template names keyed by output file), with output
+            paths relative to the project directory.
+        """
+
+        def render_name(name: str) -> str:
+            if "{{" in name or "{%" in name:
+                return env.from_string(name).render(**context)
+            return name
+
+        project_root = source.find_project_root()
+        directories: List[str] = []
+        files: Dict[str, str] = {}
+        pending = [(project_root, "")]
+        while pending:
+            directory, target = pending.pop()
+            for name, is_dir in source.list_dir(directory):
+                entry_target = f"{target}{render_name(name)}"
+                if is_dir:
+                    directories.append(entry_target)
+                    pending.append((f"{directory}/{name}", f"{entry_target}/"))
+                else:
+                    files[entry_target] = f"{directory}/{name}"
+        directories.sort()
+        return render_name(project_root), directories, files
+
+    def _write_plan(
+        self,
+        plan: ProjectPlan,
+        writer: ProjectWriter,
+        max_workers: Optional[int] = None,
+        keys: Optional[Dict[str, List[str]]] = None,
+    ) -> Dict[str, str]:
+        """Render the files of a plan into a staged directory.
+
+        Each directory is created once, parents first; rendering and writing
+        of files is spread over a thread pool. ``keys`` is filled as by
+        :meth:`render_file`.
+        """
+        for directory in plan.directories:
+            writer.mkdir(directory)
+
+        def write_file(path: str) -> str:
+            content = self.render_file(plan, path, keys)
+            writer.write_file(path, content, plan.source.get_mode(plan.files[path]))
+            return hash_content(content)
+
+        paths = list(plan.files)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(paths, executor.map(write_file, paths)))
 
 
 # Global template engine instance
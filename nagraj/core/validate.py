@@ -0,0 +1,100 @@
+"""Validation of a project's structure against its ``.nagraj.yaml``."""
+
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from nagraj.config.project import PROJECT_CONFIG_FILE, ProjectConfigFile
+from nagraj.config.schema import NagrajProjectConfig
+
+
+@dataclass
+class ValidationReport:
+    """Outcome of validating a project's structure."""
+
+    project_dir: str
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def valid(self) -> bool:
+        """Whether the project has no structure errors."""
+        return not self.errors
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the report as JSON-serializable data."""
+        return {
+            "project_dir": self.project_dir,
+            "valid": self.valid,
+            "errors": list(self.errors),
+        }
+
+
+def validate_project(project_dir: Union[str, Path]) -> ValidationReport:
+    """Validate a project's directory structure against its configuration.
+
+    Raises:
+        FileNotFoundError: If the project has no ``.nagraj.yaml``.
+    """
+    config = ProjectConfigFile.find(project_dir).to_config()
+    return ValidationReport(
+        str(project_dir), config.validate_structure(str(project_dir))
+    )
+
+
+def watch_project(
+    project_dir: Union[str, Path],
+    on_change: Callable[[ValidationReport], None],
+    interval: float = 1.0,
+    should_stop: Callable[[], bool] = lambda: False,
+) -> None:
+    """Validate a project repeatedly and report whenever the result changes.
+
+    ``.nagraj.yaml`` is only parsed again when its modification time or size
+    changed. A missing or unreadable configuration is reported as an error
+    instead of ending the watch.
+
+    Args:
+        project_dir: Root directory of a generated project.
+        on_change: Called with the first report and every changed report.
+        interval: Seconds to wait between validations.
+        should_stop: Polled after every validation, the watch ends once it
+            returns True.
+    """
+    config_path = Path(project_dir) / PROJECT_CONFIG_FILE
+    config: Optional[NagrajProjectConfig] = None
+    config_error = ""
+    config_stamp: Optional[Tuple[int, int]] = None
+    loaded = False
+    last_report: Optional[ValidationReport] = None
+    while True:
+        stamp = _stamp(config_path)
+        if not loaded or stamp != config_stamp:
+            loaded, config_stamp = True, stamp
+            try:
+                config = ProjectConfigFile.find(project_dir).to_config()
+                config_error = ""
+            except Exception as e:
+                config, config_error = None, str(e)
+
+        if config is None:
+            report = ValidationReport(str(project_dir), [config_error])
+        else:
+            report = ValidationReport(
+                str(project_dir), config.validate_structure(str(project_dir))
+            )
+        if report != last_report:
+            on_change(report)
+            last_report = report
+        if should_stop():
+            return
+        time.sleep(interval)
+
+
+def _stamp(path: Path) -> Optional[Tuple[int, int]]:
+    """Return the modification time and size of a file, if it exists."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
@@ -0,0 +1,266 @@
+"""Re-rendering of a generated project while its inputs are edited."""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from jinja2 import Environment
+
+from nagraj.config.loader import get_parse_cache
+from nagraj.config.project import PROJECT_CONFIG_FILE, ProjectConfigFile
+from nagraj.config.schema import NagrajProjectConfig
+from nagraj.core.manifest import ProjectManifest
+from nagraj.core.scaffold import (
+    CONTEXT_TEMPLATE,
+    DOMAIN_TEMPLATE,
+    check_package_name,
+    get_project_slug,
+)
+from nagraj.core.sources import DirectoryTemplateSource
+from nagraj.core.sync import SyncResult, affected_paths, write_changes
+from nagraj.core.template import TemplateEngine, template_engine
+from nagraj.core.watcher import FileWatcher
+
+# Template variables set by the ``project`` section of .nagraj.yaml
+PROJECT_KEYS = {
+    "name": "project_name",
+    "description": "project_description",
+    "version": "version",
+    "author": "author_name",
+    "email": "author_email",
+    "python_version": "python_version",
+}
+
+
+@dataclass
+class WatchResult:
+    """Outcome of applying one batch of changes to a project."""
+
+    config_changed: bool = False
+    templates: List[str] = field(default_factory=list)
+    scaffolded: List[str] = field(default_factory=list)
+    sync: SyncResult = field(default_factory=SyncResult)
+    error: Optional[str] = None
+
+
+class WatchSession:
+    """A generated project kept in memory between edits of its inputs.
+
+    The session holds the project manifest, the parsed ``.nagraj.yaml`` and
+    one Jinja2 environment per template, so every template is compiled once
+    and a change only costs rendering the outputs it affects:
+
+    - The ``project`` section of ``.nagraj.yaml`` overrides the matching
+      template variables, see :data:`PROJECT_KEYS`, and re-renders the
+      project files that read a changed variable.
+    - Domains and bounded contexts listed in ``.nagraj.yaml`` that have no
+      directory yet are generated. Removed entries are left on disk.
+    - A changed file of the project template re-renders the outputs
+      rendered from it. Templates are only watched when they are rendered
+      from the template directory rather than the packed bundle.
+
+    ``.nagraj.yaml`` itself is never re-rendered, since it is the input.
+    Files modified since they were generated are reported as conflicts and
+    kept, unless ``force`` is set.
+
+    Raises:
+        FileNotFoundError: If the project has no manifest or ``.nagraj.yaml``.
+    """
+
+    def __init__(
+        self,
+        project_dir: Union[str, Path],
+        engine: Optional[TemplateEngine] = None,
+        force: bool = False,
+    ) -> None:
+        self.project_dir = Path(project_dir).resolve()
+        self.engine = engine or template_engine
+        self.force = force
+        self.config_path = self.project_dir / PROJECT_CONFIG_FILE
+        self.manifest = ProjectManifest.load(self.project_dir)
+        self.config = ProjectConfigFile(self.config_path).to_config()
+        self.project_slug = get_project_slug(self.project_dir, self.config.name)
+
+        source = self.engine.get_template_source(self.manifest.template)
+        self.template_dir: Optional[Path] = None
+        if isinstance(source, DirectoryTemplateSource):
+            self.template_dir = source.directory.resolve()
+        self._envs: Dict[str, Environment] = {}
+
+    def start(self, watcher: FileWatcher) -> None:
+        """Watch the inputs of the project."""
+        watcher.watch(self.project_dir)
+        if self.template_dir is not None:
+            watcher.watch(self.template_dir, recursive=True)
+
+    def apply(self, changed: Iterable[Path]) -> Optional[WatchResult]:
+        """Bring the project up to date with changed input files.
+
+        Args:
+            changed: Paths reported by a :class:`FileWatcher`.
+
+        Returns:
+            The outcome, or ``None`` if no input of the project changed. A
+            broken input, such as invalid YAML in the middle of an edit, is
+            reported as an error and the previous state is kept.
+        """
+        result = WatchResult()
+        full = False
+        for path in changed:
+            if path == self.config_path:
+                result.config_changed = True
+            elif self.template_dir is not None and path.is_relative_to(
+                self.template_dir
+            ):
+                name = path.relative_to(self.template_dir).as_posix()
+                # A new or removed template file changes the project layout
+                full = full or name in (".", "cookiecutter.json") or path.is_dir()
+                result.templates.append(name)
+        if not (result.config_changed or result.templates):
+            return None
+        result.templates.sort()
+
+        try:
+            overrides: Dict[str, Any] = {}
+            if result.config_changed:
+                config, overrides = self._load_config()
+                result.scaffolded = self._scaffold(config)
+                self.config = config
+            result.sync = self._sync(overrides, result.templates, full)
+        except Exception as e:
+            result.error = str(e)
+        return result
+
+    def _load_config(self) -> Tuple[NagrajProjectConfig, Dict[str, Any]]:
+        """Parse ``.nagraj.yaml`` into a configuration and variable overrides."""
+        config_file = ProjectConfigFile(self.config_path)
+        config = config_file.to_config()
+        # Parsed once by to_config, this is a parse cache hit
+        data = get_parse_cache().load(self.config_path) or {}
+        project = data.get("project") or {}
+        overrides = {
+            key: str(project[name])
+            for name, key in PROJECT_KEYS.items()
+            if project.get(name) is not None and key in self.manifest.context
+        }
+        return config, overrides
+
+    def _scaffold(self, config: NagrajProjectConfig) -> List[str]:
+        """Generate configured domains and contexts that have no directory."""
+        package_dir = self.project_dir / self.project_slug
+        created: List[Path] = []
+        for domain_name, domain in config.domains.items():
+            check_package_name(domain_name, "domain")
+            domain_dir = package_dir / domain_name
+            if not domain_dir.exists():
+                context = {
+                    "project_slug": self.project_slug,
+                    "domain_name": domain_name,
+                }
+                self._write(DOMAIN_TEMPLATE, context, domain_dir)
+                (domain_dir / "bounded_contexts").mkdir()
+                created.append(domain_dir)
+            for context_name in domain.bounded_contexts:
+                check_package_name(context_name, "bounded context")
+                context_dir = domain_dir / "bounded_contexts" / context_name
+                if not context_dir.exists():
+                    context = {
+                        "project_slug": self.project_slug,
+                        "domain_name": domain_name,
+                        "context_name": context_name,
+                    }
+                    self._write(CONTEXT_TEMPLATE, context, context_dir)
+                    created.append(context_dir)
+        return [path.relative_to(self.project_dir).as_posix() for path in created]
+
+    def _write(self, template_name: str, context: Dict[str, Any], target: Path) -> None:
+        """Render a template into a new directory."""
+        plan = self.engine.plan_project(
+            template_name, context, env=self._envs.get(template_name)
+        )
+        self._envs[template_name] = plan.env
+        self.engine.write_project(plan, target)
+
+    def _sync(
+        self, overrides: Dict[str, Any], templates: List[str], full: bool
+    ) -> SyncResult:
+        """Re-render the project files affected by changed variables or templates."""
+        template_name = self.manifest.template
+        changed_keys = {
+            key
+            for key, value in overrides.items()
+            if self.manifest.context.get(key) != value
+        }
+        if not (changed_keys or templates):
+            return SyncResult()
+
+        plan = self.engine.plan_project(
+            template_name,
+            {**self.manifest.context, **overrides},
+            env=self._envs.get(template_name),
+        )
+        self._envs[template_name] = plan.env
+
+        # Template files outside the project directory are only rendered
+        # through {% include %}, which any project file may use
+        root = plan.source.find_project_root()
+        if full or not all(_is_selected(name, [root]) for name in templates):
+            selected = set(plan.files)
+        else:
+            # Variables recorded for templates that did not change still hold
+            selected = set(affected_paths(self.manifest, plan))
+            selected.update(
+                path
+                for path, name in plan.files.items()
+                if _is_selected(name, templates)
+            )
+        selected.discard(PROJECT_CONFIG_FILE)
+        keys: Dict[str, List[str]] = {}
+        files = {
+            path: self.engine.render_file(plan, path, keys)
+            for path in plan.files
+            if path in selected
+        }
+        result, self.manifest = write_changes(
+            self.project_dir,
+            self.manifest,
+            plan,
+            files,
+            self.force,
+            keys=keys,
+            template_digest=plan.source.digest() if templates else None,
+        )
+        return result
+
+
+def run_watch(
+    session: WatchSession,
+    watcher: FileWatcher,
+    on_change: Callable[[WatchResult], None],
+    debounce: float = 0.2,
+    should_stop: Callable[[], bool] = lambda: False,
+) -> None:
+    """Apply changes of a project's inputs as they happen.
+
+    Args:
+        session: The project to keep up to date.
+        watcher: Watcher to receive changes from, closed when the watch ends.
+        on_change: Called with the outcome of every batch of changes.
+        debounce: Seconds without changes that end a batch.
+        should_stop: Polled after every wait, the watch ends once it
+            returns True.
+    """
+    with watcher:
+        session.start(watcher)
+        while not should_stop():
+            changed = watcher.wait(debounce, timeout=1.0)
+            if not changed:
+                continue
+            result = session.apply(changed)
+            if result is not None:
+                on_change(result)
+
+
+def _is_selected(name: str, templates: List[str]) -> bool:
+    """Whether a template file is, or is inside, one of the changed paths."""
+    return any(name == path or name.startswith(f"{path}/") for path in templates)
@@ -0,0 +1,249 @@
+"""Change notifications for files and directory trees.
+
+On Linux changes are reported by inotify through the C library, without
+any extra dependency. Elsewhere, or when inotify is unavailable, the
+watched paths are polled for changes of modification time and size.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+IGNORED_NAMES = {"__pycache__", ".git"}
+
+# inotify event masks, see inotify(7)
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_ISDIR = 0x40000000
+WATCH_MASK = (
+    IN_MODIFY
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+)
+_EVENT = struct.Struct("iIII")
+
+
+class FileWatcher(ABC):
+    """Reports paths that changed below watched files and directories."""
+
+    @abstractmethod
+    def watch(self, path: Path, recursive: bool = False) -> None:
+        """Watch a directory, and optionally every directory below it."""
+
+    @abstractmethod
+    def changes(self, timeout: Optional[float] = None) -> Set[Path]:
+        """Wait for changes and return the changed paths.
+
+        Args:
+            timeout: Seconds to wait at most, ``None`` waits until a change.
+
+        Returns:
+            The changed paths, empty when the timeout expired. A watched
+            directory is returned when its changes could not be told apart.
+        """
+
+    def close(self) -> None:
+        """Release the resources of the watcher."""
+
+    def wait(self, debounce: float, timeout: Optional[float] = None) -> Set[Path]:
+        """Wait for a burst of changes to settle.
+
+        Changes keep being collected until none arrived for ``debounce``
+        seconds, so an editor saving several files, or writing one file in
+        several steps, is reported once.
+        """
+        changed = self.changes(timeout)
+        while changed:
+            more = self.changes(debounce)
+            if not more:
+                break
+            changed |= more
+        return changed
+
+    def __enter__(self) -> "FileWatcher":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+
+class InotifyWatcher(FileWatcher):
+    """A watcher using Linux inotify.
+
+    Raises:
+        OSError: If inotify is not available.
+    """
+
+    def __init__(self) -> None:
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self._fd = fd
+        # Watched directory and whether it is watched recursively, by
+        # watch descriptor
+        self._watches: Dict[int, Tuple[Path, bool]] = {}
+
+    def watch(self, path: Path, recursive: bool = False) -> None:
+        """Watch a directory, and optionally every directory below it."""
+        directories = _walk_dirs(path) if recursive else iter([path])
+        for directory in directories:
+            wd = self._add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+            if wd < 0:
+                errno = ctypes.get_errno()
+                raise OSError(errno, os.strerror(errno), str(directory))
+            self._watches[wd] = (directory, recursive)
+
+    def changes(self, timeout: Optional[float] = None) -> Set[Path]:
+        """Wait for changes and return the changed paths."""
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return set()
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed: Set[Path] = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT.unpack_from(data, offset)
+            offset += _EVENT.size
+            name = os.fsdecode(data[offset : offset + length].rstrip(b"\0"))
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                changed.update(directory for directory, _ in self._watches.values())
+                continue
+            if wd not in self._watches:
+                continue
+            directory, recursive = self._watches[wd]
+            if not name:
+                changed.add(directory)
+                continue
+            if name in IGNORED_NAMES:
+                continue
+            path = directory / name
+            changed.add(path)
+            if recursive and mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                try:
+                    self.watch(path, recursive=True)
+                except OSError:
+                    pass  # Removed again before it could be watched
+                changed.update(_walk_files(path))
+        return changed
+
+    def close(self) -> None:
+        """Release the inotify file descriptor."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class PollingWatcher(FileWatcher):
+    """A watcher comparing modification times and sizes at an interval."""
+
+    def __init__(self, interval: float = 1.0) -> None:
+        self.interval = interval
+        self._roots: List[Tuple[Path, bool]] = []
+        self._stamps: Dict[Path, Tuple[int, int]] = {}
+
+    def watch(self, path: Path, recursive: bool = False) -> None:
+        """Watch a directory, and optionally every directory below it."""
+        self._roots.append((path, recursive))
+        self._stamps.update(self._scan_root(path, recursive))
+
+    def changes(self, timeout: Optional[float] = None) -> Set[Path]:
+        """Poll until a change was found or the timeout expired."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            delay = self.interval
+            if deadline is not None:
+                delay = min(delay, max(deadline - time.monotonic(), 0))
+            time.sleep(delay)
+            stamps: Dict[Path, Tuple[int, int]] = {}
+            for root, recursive in self._roots:
+                stamps.update(self._scan_root(root, recursive))
+            changed = {
+                path
+                for path in stamps.keys() | self._stamps.keys()
+                if stamps.get(path) != self._stamps.get(path)
+            }
+            self._stamps = stamps
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    @staticmethod
+    def _scan_root(root: Path, recursive: bool) -> Dict[Path, Tuple[int, int]]:
+        """Return the modification time and size of every watched file."""
+        stamps: Dict[Path, Tuple[int, int]] = {}
+        paths = _walk_files(root) if recursive else _list_files(root)
+        for path in paths:
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            stamps[path] = (stat.st_mtime_ns, stat.st_size)
+        return stamps
+
+
+def create_watcher(polling: bool = False, interval: float = 1.0) -> FileWatcher:
+    """Return an inotify watcher, or a polling one if inotify is unavailable.
+
+    Args:
+        polling: Always poll, e.g. for network filesystems that do not
+            deliver inotify events.
+        interval: Seconds between polls.
+    """
+    if not polling:
+        try:
+            return InotifyWatcher()
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(interval)
+
+
+def _list_files(directory: Path) -> Iterator[Path]:
+    """Yield the files directly inside a directory."""
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_file():
+            yield Path(entry.path)
+
+
+def _walk_dirs(root: Path) -> Iterator[Path]:
+    """Yield a directory and every directory below it."""
+    for directory, dirnames, _ in os.walk(root):
+        dirnames[:] = [name for name in dirnames if name not in IGNORED_NAMES]
+        yield Path(directory)
+
+
+def _walk_files(root: Path) -> Iterator[Path]:
+    """Yield every file below a directory."""
+    for directory in _walk_dirs(root):
+        yield from _list_files(directory)
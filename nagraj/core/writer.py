@@ -0,0 +1,176 @@
+"""Crash-safe writing of generated directory trees.
+
+A tree is written into a hidden sibling staging directory and renamed into
+place in one step once complete, so an interrupted generation never leaves
+a half-written project behind. How much is flushed to disk before the
+rename is chosen with an fsync policy:
+
+``none``
+    Nothing is fsynced. The rename still makes the tree appear at once, but
+    its contents may be lost if the machine crashes shortly afterwards.
+``end``
+    Every file and directory is fsynced once, after all of them were
+    written, then the rename itself is made durable.
+``per-file``
+    Every file is fsynced as soon as it is written, as with ``end`` the
+    directories and the rename are made durable at the end.
+"""
+
+import os
+import shutil
+import uuid
+from pathlib import Path
+from types import TracebackType
+from typing import List, Optional, Type, Union
+
+from nagraj.core.profiling import profile_span
+
+FSYNC_POLICIES = ("none", "end", "per-file")
+
+
+class ProjectWriter:
+    """Write a directory tree into a staging directory and swap it into place.
+
+    Use as a context manager: the tree is committed when the block exits
+    normally and discarded when it raises. Files may be written from
+    several threads at once.
+    """
+
+    def __init__(self, target: Union[str, Path], fsync: str = "none") -> None:
+        """Prepare writing a new directory.
+
+        Args:
+            target: Directory to create, it must not exist yet.
+            fsync: One of :data:`FSYNC_POLICIES`.
+
+        Raises:
+            ValueError: If the fsync policy is unknown.
+        """
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(
+                f"Unsupported fsync policy {fsync}, "
+                f"expected one of: {', '.join(FSYNC_POLICIES)}"
+            )
+        self.target = Path(target)
+        self.fsync = fsync
+        self.staging_dir = self.target.parent / (
+            f".{self.target.name}.{uuid.uuid4().hex[:8]}.tmp"
+        )
+        self._directories: List[Path] = []
+        self._files: List[Path] = []
+
+    def __enter__(self) -> "ProjectWriter":
+        """Create the staging directory.
+
+        Raises:
+            FileExistsError: If the target directory already exists.
+        """
+        self._check_target()
+        self.target.parent.mkdir(parents=True, exist_ok=True)
+        os.mkdir(self.staging_dir)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Commit the staged tree, or discard it if the block raised."""
+        if exc_type is not None:
+            self.abort()
+            return
+        try:
+            with profile_span(f"commit {self.target.name}", "write"):
+                self.commit()
+        except BaseException:
+            self.abort()
+            raise
+
+    def mkdir(self, path: str) -> None:
+        """Create a directory, its parent must already have been created."""
+        directory = self.staging_dir / path
+        os.mkdir(directory)
+        self._directories.append(directory)
+
+    def write_file(self, path: str, content: bytes, mode: int = 0o644) -> None:
+        """Write a new file with the given permission bits."""
+        target = self.staging_dir / path
+        with profile_span(path, "write"), open(target, "xb") as f:
+            f.write(content)
+            os.fchmod(f.fileno(), mode)
+            if self.fsync == "per-file":
+                f.flush()
+                os.fsync(f.fileno())
+        self._files.append(target)
+
+    def commit(self) -> Path:
+        """Flush the staged tree as the fsync policy requires and rename it.
+
+        Returns:
+            The target directory.
+
+        Raises:
+            FileExistsError: If the target directory was created meanwhile.
+        """
+        if self.fsync == "end":
+            for path in self._files:
+                _fsync_path(path)
+        if self.fsync != "none":
+            # Deepest first, so that no directory is synced before its entries
+            for directory in reversed(self._directories):
+                _fsync_path(directory)
+            _fsync_path(self.staging_dir)
+
+        # Renaming onto an existing empty directory would silently succeed
+        self._check_target()
+        os.rename(self.staging_dir, self.target)
+        if self.fsync != "none":
+            _fsync_path(self.target.parent)
+        return self.target
+
+    def abort(self) -> None:
+        """Remove the staging directory and everything written to it."""
+        shutil.rmtree(self.staging_dir, ignore_errors=True)
+
+    def _check_target(self) -> None:
+        """Ensure the target directory does not exist yet."""
+        if self.target.exists():
+            raise FileExistsError(f"Directory already exists: {self.target}")
+
+
+def write_file_atomic(
+    path: Union[str, Path], content: bytes, fsync: bool = False
+) -> None:
+    """Replace a file in one step via a temporary sibling file.
+
+    The parent directory is created if needed and the permission bits of an
+    existing file are kept. Readers see either the old or the new contents,
+    never a partial write.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+    try:
+        with open(tmp_path, "xb") as f:
+            f.write(content)
+            if path.exists():
+                shutil.copymode(path, tmp_path)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    if fsync:
+        _fsync_path(path.parent)
+
+
+def _fsync_path(path: Path) -> None:
+    """Flush a file or directory to disk."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
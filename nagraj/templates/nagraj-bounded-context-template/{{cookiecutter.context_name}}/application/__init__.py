@@ -0,0 +1 @@
+"""Application layer for the {{ cookiecutter.context_title }} context."""
@@ -0,0 +1 @@
+"""Commands for the {{ cookiecutter.context_title }} context."""
@@ -0,0 +1 @@
+"""Data transfer objects for the {{ cookiecutter.context_title }} context."""
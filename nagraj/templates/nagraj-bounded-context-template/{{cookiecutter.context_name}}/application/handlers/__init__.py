@@ -0,0 +1 @@
+"""Command and query handlers for the {{ cookiecutter.context_title }} context."""
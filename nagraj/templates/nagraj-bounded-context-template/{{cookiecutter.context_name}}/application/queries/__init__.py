@@ -0,0 +1 @@
+"""Queries for the {{ cookiecutter.context_title }} context."""
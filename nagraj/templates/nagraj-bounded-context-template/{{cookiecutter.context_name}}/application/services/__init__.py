@@ -0,0 +1 @@
+"""Application services for the {{ cookiecutter.context_title }} context."""
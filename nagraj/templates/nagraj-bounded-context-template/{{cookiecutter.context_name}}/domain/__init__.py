@@ -0,0 +1 @@
+"""Domain layer for the {{ cookiecutter.context_title }} context."""
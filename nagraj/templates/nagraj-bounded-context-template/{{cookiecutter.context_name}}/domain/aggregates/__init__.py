@@ -0,0 +1 @@
+"""Domain aggregates for the {{ cookiecutter.context_title }} context."""
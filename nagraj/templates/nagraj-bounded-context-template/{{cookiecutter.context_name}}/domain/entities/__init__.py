@@ -0,0 +1 @@
+"""Domain entities for the {{ cookiecutter.context_title }} context."""
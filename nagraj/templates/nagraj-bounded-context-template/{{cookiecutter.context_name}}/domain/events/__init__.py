@@ -0,0 +1 @@
+"""Domain events for the {{ cookiecutter.context_title }} context."""
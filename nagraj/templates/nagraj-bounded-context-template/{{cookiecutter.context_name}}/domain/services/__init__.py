@@ -0,0 +1 @@
+"""Domain services for the {{ cookiecutter.context_title }} context."""
@@ -0,0 +1 @@
+"""Domain specifications for the {{ cookiecutter.context_title }} context."""
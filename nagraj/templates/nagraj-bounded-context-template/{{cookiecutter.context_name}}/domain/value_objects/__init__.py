@@ -0,0 +1 @@
+"""Domain value objects for the {{ cookiecutter.context_title }} context."""
@@ -0,0 +1 @@
+"""Infrastructure layer for the {{ cookiecutter.context_title }} context."""
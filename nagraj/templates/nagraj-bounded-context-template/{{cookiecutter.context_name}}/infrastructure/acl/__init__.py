@@ -0,0 +1 @@
+"""Anti-corruption layer for the {{ cookiecutter.context_title }} context."""
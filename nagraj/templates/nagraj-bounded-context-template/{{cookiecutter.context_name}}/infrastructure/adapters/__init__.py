@@ -0,0 +1 @@
+"""Infrastructure adapters for the {{ cookiecutter.context_title }} context."""
@@ -0,0 +1 @@
+"""Event handlers for the {{ cookiecutter.context_title }} context."""
@@ -0,0 +1 @@
+"""Event stores for the {{ cookiecutter.context_title }} context."""
@@ -0,0 +1 @@
+"""ORM models for the {{ cookiecutter.context_title }} context."""
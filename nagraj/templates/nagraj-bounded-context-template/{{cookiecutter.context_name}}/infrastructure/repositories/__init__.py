@@ -0,0 +1 @@
+"""Repositories for the {{ cookiecutter.context_title }} context."""
@@ -0,0 +1 @@
+"""Interfaces for the {{ cookiecutter.context_title }} context."""
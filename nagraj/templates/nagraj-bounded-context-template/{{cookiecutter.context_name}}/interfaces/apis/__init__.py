@@ -0,0 +1 @@
+"""FastAPI API endpoints for the {{ cookiecutter.context_title }} context."""
@@ -0,0 +1 @@
+"""FastAPI dependencies for the {{ cookiecutter.context_title }} context."""
@@ -0,0 +1 @@
+"""FastAPI middlewares for the {{ cookiecutter.context_title }} context."""
@@ -0,0 +1,2 @@
+"""Interface Data transfer objects for the {{ cookiecutter.context_title }} context.
+These are the request/response models for the API endpoints."""
@@ -0,0 +1 @@
+"""Base classes and abstractions for the {{ cookiecutter.domain_title }} domain"""
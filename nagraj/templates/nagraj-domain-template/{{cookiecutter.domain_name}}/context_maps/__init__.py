@@ -0,0 +1 @@
+"""Context maps for all bounded contexts of the {{ cookiecutter.domain_title }} domain."""
@@ -0,0 +1,71 @@
+"""Base domain event class."""
+
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID, uuid4
+
+from pydantic import AwareDatetime, BaseModel, ConfigDict, Field, ValidationError
+
+
+class BaseDomainEvent(BaseModel):
+    """
+    Base Class for Domain Events
+
+    Domain events represent something meaningful that happened in the domain. They are immutable
+    and typically used to communicate changes across different parts of the system, such as in
+    event sourcing or CQRS architectures.
+
+    Events are validated by pydantic alone: the event type defaults to the name of
+    the event class when the class is defined, not each time an event is created.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    event_id: UUID = Field(default_factory=uuid4)
+    aggregate_id: UUID = Field(description="ID of the aggregate this event belongs to")
+    occurred_on: AwareDatetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc)
+    )
+    event_type: str = Field(default="")
+    event_version: int = Field(default=1)
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Default the event type of an event class to its name."""
+        super().__pydantic_init_subclass__(**kwargs)
+        cls.model_fields["event_type"].default = cls.__name__
+        cls.model_rebuild(force=True)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare two domain events for equality based on their event_id."""
+        if not isinstance(other, BaseDomainEvent):
+            return False
+        return self.event_id == other.event_id
+
+    def __hash__(self) -> int:
+        """Generate a hash based on the event_id."""
+        return hash(self.event_id)
+
+    def __repr__(self) -> str:
+        """
+        String representation of the domain event.
+
+        Returns:
+            str: A string representation of the domain event.
+        """
+        return f"{self.__class__.__name__}(event_id={self.event_id}, event_type={self.event_type})"
+
+    @classmethod
+    def from_json(cls, json_str: str) -> "BaseDomainEvent":
+        """Create a domain event from a JSON string."""
+        try:
+            return cls.model_validate_json(json_str)
+        except ValidationError as e:
+            raise ValueError(f"Failed to deserialize domain event: {str(e)}")
+        except Exception as e:
+            raise ValueError(f"Failed to deserialize domain event: {str(e)}")
+
+    def model_dump_json(self, **kwargs: Any) -> str:
+        """Override model_dump_json to handle datetime serialization."""
+        kwargs.setdefault("exclude_none", True)
+        return super().model_dump_json(**kwargs)
@@ -0,0 +1,105 @@
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+
+from pydantic import AwareDatetime, BaseModel, Field
+from pydantic.config import ConfigDict
+
+from .domain_event import BaseDomainEvent
+
+
+class BaseEntity(BaseModel):
+    """
+    Domain Entity Base Class
+
+    This module defines the base class for domain entities in a domain-driven design (DDD)
+    architecture. Entities represent stateful concepts within the domain, defined by a unique
+    identity (`id`) rather than their attributes. They encapsulate behavior and can change
+    state over time while maintaining domain invariants.
+
+    Entities are validated when they are created from untrusted input. Attribute
+    assignments made by the entity's own methods and entities rebuilt from storage
+    with `model_construct` are trusted and not validated again, so methods that
+    change state are responsible for updating `updated_at`.
+    """
+
+    id: UUID = Field(
+        default_factory=uuid4,
+        description="Unique identifier for the entity",
+        frozen=True,
+    )
+    created_at: AwareDatetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        description="UTC timestamp of when the entity was first created",
+        frozen=True,
+    )
+    updated_at: AwareDatetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        description="UTC timestamp of when the entity was last updated",
+        frozen=False,
+    )
+    # Not `list` itself: model_construct inspects the signature of default
+    # factories on every call, which is far slower for builtins
+    domain_events: list[BaseDomainEvent] = Field(
+        default_factory=lambda: [],
+        description="List of domain events that have occurred on this entity",
+        frozen=False,
+    )
+
+    # Assignments are trusted, only construction validates its input
+    model_config = ConfigDict(extra="forbid")
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare entities by their unique ID.
+
+        Args:
+            other (object): The object to compare with.
+
+        Returns:
+            bool: True if the IDs match, otherwise False.
+        """
+        if isinstance(other, BaseEntity):
+            return self.id == other.id
+        return False
+
+    def __hash__(self) -> int:
+        """
+        Generate a hash based on the entity's unique ID.
+
+        Returns:
+            int: The hash of the entity's ID.
+        """
+        return hash(self.id)
+
+    def __repr__(self) -> str:
+        """
+        String representation of the entity.
+
+        Returns:
+            str: A string representation of the entity.
+        """
+        return f"{self.__class__.__name__}(id={self.id})"
+
+    def model_dump(self, **kwargs) -> dict:
+        """
+        Serialize the entity to a dictionary using Pydantic's model_dump method.
+
+        Returns:
+            dict: The serialized entity.
+        """
+        return super().model_dump(**kwargs)
+
+    def add_domain_event(self, event: BaseDomainEvent) -> None:
+        """
+        Adds a domain event to the entity.
+
+        Args:
+            event (BaseDomainEvent): The domain event to add.
+        """
+        self.domain_events.append(event)
+
+    def clear_domain_events(self) -> None:
+        """
+        Clears all domain events for the entity.
+        """
+        self.domain_events.clear()
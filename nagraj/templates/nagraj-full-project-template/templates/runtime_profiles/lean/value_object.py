@@ -0,0 +1,16 @@
+from abc import ABC
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)  # Ensures immutability
+class BaseValueObject(ABC):
+    """
+    Base class for Value Objects in a Domain-Driven Design (DDD) project.
+    Value Objects are immutable and equality is based on their state, not identity.
+
+    The base class has no instance dictionary, so value objects declared with
+    `@dataclass(frozen=True, slots=True)` store their attributes in slots.
+    Equality, hashing and the representation are the methods the dataclass
+    decorator generates for each value object, which compare the attribute
+    values directly instead of looking the fields up on every call.
+    """
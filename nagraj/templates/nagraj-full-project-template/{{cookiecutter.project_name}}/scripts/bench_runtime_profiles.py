@@ -0,0 +1,133 @@
+"""Micro-benchmarks of the domain base classes of this project's runtime profile.
+
+Run it from the root of a project generated with each runtime profile to
+compare them:
+
+    python -m scripts.bench_runtime_profiles
+
+It prints one column of the table in the README, for the profile of this
+project, measured on the running Python.
+"""
+
+import argparse
+import platform
+import sys
+import timeit
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable, Self
+from uuid import uuid4
+
+import pydantic
+from pydantic import model_validator
+
+from {{ cookiecutter.project_slug }}.common.base import (
+    BaseAggregate,
+    BaseDomainEvent,
+    BaseValueObject,
+)
+
+PROFILE = "{{ cookiecutter.runtime_profile }}"
+
+# Value objects created to measure their memory
+MEMORY_SAMPLES = 10_000
+
+
+@dataclass(frozen=True{% if cookiecutter.runtime_profile == "lean" %}, slots=True{% endif %})
+class Price(BaseValueObject):
+    """Value object with two fields."""
+
+    amount: int
+    currency: str
+
+
+class Order(BaseAggregate):
+    """Aggregate with one value object field."""
+
+    price: Price
+
+    @model_validator(mode="after")
+    def validate_invariants(self) -> Self:
+        """Accept every order."""
+        return self
+
+
+class PriceChanged(BaseDomainEvent):
+    """Domain event with one field."""
+
+    amount: int
+
+
+def time_operation(operation: Callable[[], object], repeat: int) -> float:
+    """Return the best time of an operation over several runs, in seconds."""
+    timer = timeit.Timer(operation)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def value_object_size() -> float:
+    """Return the memory allocated per value object, in bytes."""
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        prices = [Price(amount=i, currency="EUR") for i in range(MEMORY_SAMPLES)]
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (after - before - sys.getsizeof(prices)) / MEMORY_SAMPLES
+
+
+def format_time(seconds: float) -> str:
+    """Format a duration in microseconds with three significant digits."""
+    micros = seconds * 1e6
+    if micros < 10:
+        return f"{micros:.2f} µs"
+    if micros < 100:
+        return f"{micros:.1f} µs"
+    return f"{micros:.0f} µs"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--repeat", type=int, default=15, help="runs per operation, the best counts"
+    )
+    args = parser.parse_args()
+
+    price = Price(amount=100, currency="EUR")
+    same_price = Price(amount=100, currency="EUR")
+    other_price = Price(amount=200, currency="EUR")
+    order = Order.create(price=price)
+    stored = order.model_dump(exclude={"domain_events"})
+    stored["price"] = price
+
+    def assign_price() -> None:
+        order.price = other_price
+
+    operations: list[tuple[str, Callable[[], object]]] = [
+        ("Create a value object", lambda: Price(amount=100, currency="EUR")),
+        ("Compare and hash a value object", lambda: (price == same_price, hash(price))),
+        ("Create an aggregate", lambda: Order.create(price=price)),
+        (
+            "Load an aggregate with `model_construct`",
+            lambda: Order.model_construct(**stored),
+        ),
+        ("Assign an attribute of an aggregate", assign_price),
+        ("Create a domain event", lambda: PriceChanged(aggregate_id=uuid4(), amount=1)),
+    ]
+
+    print(f"| Operation | {PROFILE} |")
+    print("| --- | ---: |")
+    for name, operation in operations:
+        print(f"| {name} | {format_time(time_operation(operation, args.repeat))} |")
+    print(f"| Memory per value object | {value_object_size():.0f} B |")
+    print()
+    print(
+        f"Best of {args.repeat} runs on {platform.python_implementation()} "
+        f"{platform.python_version()} with pydantic {pydantic.VERSION}, "
+        f"{platform.system()} {platform.machine()}."
+    )
+
+
+if __name__ == "__main__":
+    main()
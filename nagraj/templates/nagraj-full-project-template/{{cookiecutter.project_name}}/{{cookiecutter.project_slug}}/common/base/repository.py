@@ -1,10 +1,17 @@
 from abc import ABC, abstractmethod
-from typing import Generic, Optional, TypeVar
+from contextlib import AbstractAsyncContextManager
+from typing import Generic, Iterable, Optional, TypeVar
 from uuid import UUID
 
+import asyncpg
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel.ext.asyncio.session import AsyncSession
+
 from ..core.infrastructure.database.database import db
+from ..exceptions.infrastructure_exceptions import ConcurrencyConflictException
 
 from .aggregate import BaseAggregate
+from .orm import BaseORM
 
 T = TypeVar("T", bound=BaseAggregate)
 
@@ -18,16 +25,81 @@ class BaseRepository(ABC, Generic[T]):
     """
 
     def __init__(self, schema: str):
-        """Initialize repository with specific schema."""
+        """Initialize repository with specific schema.
+
+        Repositories of the same schema share its connection pool, which is
+        registered on first use without connecting.
+        """
         self._schema = schema
         self._initialized = False
+        db.register_schema(schema)
 
     async def _ensure_initialized(self) -> None:
-        """Ensure the database connection is initialized with the correct schema."""
+        """Ensure the schema of the repository exists."""
         if not self._initialized:
             await db.create_pool(schema=self._schema)
             self._initialized = True
 
+    def session(self) -> AbstractAsyncContextManager[AsyncSession]:
+        """Get a database session from the pool of the repository's schema."""
+        return db.session(self._schema)
+
+    def connection(self) -> AbstractAsyncContextManager[asyncpg.Connection]:
+        """Get a raw asyncpg connection from the pool of the repository's schema."""
+        return db.connection(self._schema)
+
+    async def upsert(
+        self,
+        orm_model: BaseORM,
+        exclude_from_update: Iterable[str] = ("id", "created_at"),
+    ) -> int:
+        """Insert a row, or update the row with the same id, in one round trip.
+
+        Runs a single ``INSERT ... ON CONFLICT (id) DO UPDATE ... WHERE
+        version = :expected RETURNING version`` statement in autocommit mode.
+        A new row is stored with the version of the model. An existing row is
+        only updated if its version is still the version of the model, the
+        one it was loaded with: it is overwritten with every column of the
+        model except `exclude_from_update` and its version incremented.
+
+        Args:
+            orm_model: The ORM model of the row
+            exclude_from_update: Columns kept when the row already exists
+
+        Returns:
+            The version of the stored row
+
+        Raises:
+            ConcurrencyConflictException: If the row was updated since the
+                model was loaded
+        """
+        await self._ensure_initialized()
+        table = orm_model.__table__  # type: ignore
+        statement = insert(table).values(
+            {column.name: getattr(orm_model, column.name) for column in table.columns}
+        )
+        excluded = set(exclude_from_update) | {"version"}
+        updates = {
+            column.name: statement.excluded[column.name]
+            for column in table.columns
+            if column.name not in excluded
+        }
+        updates["version"] = table.c.version + 1
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.id],
+            set_=updates,
+            where=table.c.version == orm_model.version,
+        ).returning(table.c.version)
+        async with db.autocommit(self._schema) as conn:
+            result = await conn.execute(statement)
+            version = result.scalar_one_or_none()
+        if version is None:
+            raise ConcurrencyConflictException(
+                f"{type(orm_model).__name__} {orm_model.id} was modified "
+                f"concurrently, expected version {orm_model.version}"
+            )
+        return version
+
     @abstractmethod
     async def save(self, aggregate: T) -> None:
         """
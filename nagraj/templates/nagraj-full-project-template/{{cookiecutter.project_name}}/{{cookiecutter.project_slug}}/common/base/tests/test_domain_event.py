@@ -7,6 +7,14 @@ import pytest
 
 from {{ cookiecutter.project_slug }}.common.base.domain_event import BaseDomainEvent
 
+{% if cookiecutter.runtime_profile == "lean" -%}
+INVALID_DATETIME_MESSAGE = "Input should be a valid datetime"
+NAIVE_DATETIME_MESSAGE = "Input should have timezone info"
+{%- else -%}
+INVALID_DATETIME_MESSAGE = "occurred_on must be a valid ISO format datetime"
+NAIVE_DATETIME_MESSAGE = "Datetime must be timezone-aware"
+{%- endif %}
+
 
 class TestDomainEvent(BaseDomainEvent):
     """Test domain event class."""
@@ -132,9 +140,7 @@ def test_domain_event_json_serialization(event_id, aggregate_id, occurred_on):
 def test_domain_event_validation_error():
     """Test validation error handling."""
     # Test with invalid datetime format
-    with pytest.raises(
-        ValueError, match="occurred_on must be a valid ISO format datetime"
-    ):
+    with pytest.raises(ValueError, match=INVALID_DATETIME_MESSAGE):
         TestDomainEvent(
             event_id=uuid4(),
             aggregate_id=uuid4(),
@@ -143,7 +149,7 @@ def test_domain_event_validation_error():
         )
 
     naive_datetime = datetime(2024, 1, 1)
-    with pytest.raises(ValueError, match="Datetime must be timezone-aware"):
+    with pytest.raises(ValueError, match=NAIVE_DATETIME_MESSAGE):
         TestDomainEvent(
             event_id=uuid4(),
             aggregate_id=uuid4(),
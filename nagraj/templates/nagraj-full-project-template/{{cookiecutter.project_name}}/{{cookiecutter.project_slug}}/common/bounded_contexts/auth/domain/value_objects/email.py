@@ -12,7 +12,7 @@ class EmailValidator(BaseModel):
     email: EmailStr
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True{% if cookiecutter.runtime_profile == "lean" %}, slots=True{% endif %})
 class Email(BaseValueObject):
     """Email value object."""
 
@@ -0,0 +1,39 @@
+"""Mappers between UserAggregate and UserORM.
+
+Generated by ``nagraj gen mappers`` from the field declarations of both
+models, do not edit. Run ``nagraj gen mappers`` again after changing them.
+"""
+
+from ...domain.aggregates.user_aggregate import UserAggregate
+from ...domain.value_objects.email import Email
+from ...domain.value_objects.password import Password
+from ..orms.user_orm import UserORM
+
+
+def user_to_orm(aggregate: UserAggregate) -> UserORM:
+    """Convert a user aggregate to its ORM model."""
+    return UserORM(
+        id=aggregate.id,
+        created_at=aggregate.created_at,
+        updated_at=aggregate.updated_at,
+        version=aggregate.version,
+        email=aggregate.email.value,
+        password_hash=aggregate.password.hashed_value,
+        is_active=aggregate.is_active,
+        last_login=aggregate.last_login,
+    )
+
+
+def user_to_aggregate(orm: UserORM) -> UserAggregate:
+    """Convert an ORM model to a user aggregate without validation."""
+    aggregate = UserAggregate.model_construct(
+        id=orm.id,
+        created_at=orm.created_at,
+        updated_at=orm.updated_at,
+        email=Email(value=orm.email),
+        password=Password.from_hash(orm.password_hash),
+        is_active=orm.is_active,
+        last_login=orm.last_login,
+    )
+    aggregate._version = orm.version
+    return aggregate
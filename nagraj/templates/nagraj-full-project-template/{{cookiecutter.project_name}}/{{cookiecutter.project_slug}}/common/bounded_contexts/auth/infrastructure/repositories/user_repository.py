@@ -4,8 +4,8 @@ from typing import Optional
 from uuid import UUID
 
 from {{cookiecutter.project_slug}}.common.base import BaseRepository
-from {{cookiecutter.project_slug}}.common.core.infrastructure.database.database import db
 from {{cookiecutter.project_slug}}.common.exceptions.infrastructure_exceptions import (
+    ConcurrencyConflictException,
     DatabaseException,
 )
 from sqlmodel import select
@@ -24,40 +24,24 @@ class UserRepository(BaseRepository[UserAggregate]):
         self._adapter = UserAdapter()
 
     async def save(self, aggregate: UserAggregate) -> None:
-        """Save a user aggregate."""
+        """Save a user aggregate with a single upsert statement.
+
+        Raises:
+            ConcurrencyConflictException: If the user was saved by someone else
+                since the aggregate was loaded
+        """
         try:
             orm_model = self._adapter.to_orm(aggregate)
-            async with db.session() as session:
-                # Check if user exists
-                statement = select(UserORM).where(UserORM.id == aggregate.id)
-                result = await session.exec(statement)
-                existing_user = result.first()
-
-                if existing_user:
-                    # Update existing user
-                    existing_user.email = orm_model.email
-                    existing_user.password_hash = orm_model.password_hash
-                    existing_user.is_active = orm_model.is_active
-                    existing_user.last_login = orm_model.last_login
-                    existing_user.updated_at = orm_model.updated_at
-                    # Increment version on update
-                    existing_user.version += 1
-                    session.add(existing_user)
-                else:
-                    # Insert new user (version starts at 1 from BaseORM)
-                    session.add(orm_model)
-
-                await session.commit()
-
-                # Update aggregate version to match ORM
-                aggregate.increment_version()
+            aggregate._version = await self.upsert(orm_model)
+        except ConcurrencyConflictException:
+            raise
         except Exception as e:
             raise DatabaseException(f"Failed to save user: {str(e)}")
 
     async def get_by_id(self, id: UUID) -> Optional[UserAggregate]:
         """Get a user by ID."""
         try:
-            async with db.session() as session:
+            async with self.session() as session:
                 statement = select(UserORM).where(UserORM.id == id)
                 result = await session.exec(statement)
                 user_orm = result.first()
@@ -70,7 +54,7 @@ class UserRepository(BaseRepository[UserAggregate]):
     async def get_by_email(self, email: str) -> Optional[UserAggregate]:
         """Get a user by email."""
         try:
-            async with db.session() as session:
+            async with self.session() as session:
                 statement = select(UserORM).where(UserORM.email == email)
                 result = await session.exec(statement)
                 user_orm = result.first()
@@ -83,7 +67,7 @@ class UserRepository(BaseRepository[UserAggregate]):
     async def delete(self, id: UUID) -> None:
         """Delete a user by ID."""
         try:
-            async with db.session() as session:
+            async with self.session() as session:
                 statement = select(UserORM).where(UserORM.id == id)
                 result = await session.exec(statement)
                 user_orm = result.first()
@@ -94,9 +78,12 @@ class UserRepository(BaseRepository[UserAggregate]):
             raise DatabaseException(f"Failed to delete user: {str(e)}")
 
     async def check_version(self, id: UUID, expected_version: int) -> bool:
-        """Check if the aggregate version matches the expected version."""
+        """Check if the aggregate version matches the expected version.
+
+        Not needed before saving, ``save`` compares the versions itself.
+        """
         try:
-            async with db.session() as session:
+            async with self.session() as session:
                 statement = select(UserORM).where(UserORM.id == id)
                 result = await session.exec(statement)
                 user_orm = result.first()
@@ -1,5 +1,6 @@
 from contextlib import asynccontextmanager
 
+from {{cookiecutter.project_slug}}.common.core.config.settings import settings
 from {{cookiecutter.project_slug}}.common.core.infrastructure.database.database import db
 
 from fastapi import FastAPI
@@ -12,8 +13,12 @@ from .middlewares.api_logs import setup_logging_middleware
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for database connection."""
-    # Startup
+    # Startup: open the pools and their connections before the first request
     await db.create_pool()
+    for schema in settings.db_schemas:
+        await db.create_pool(schema)
+    await db.warm_up()
+    db.start_probing()
     yield
     # Shutdown
     await db.close_pool()
@@ -98,6 +98,105 @@ class DomainSettings(BaseSettings):
             return "public,auth"
         return value.strip()
 
+    # A worker holds at most db_pool_size + db_pool_max_overflow connections
+    db_pool_size: int = Field(
+        alias="DB_POOL_SIZE",
+        default_factory=lambda: int(os.getenv("DB_POOL_SIZE", "10")),
+    )
+
+    @field_validator("db_pool_size")
+    @classmethod
+    def validate_db_pool_size(cls, value: int) -> int:
+        if value < 1:
+            raise ValueError("DB_POOL_SIZE must be at least 1")
+        return value
+
+    db_pool_max_overflow: int = Field(
+        alias="DB_POOL_MAX_OVERFLOW",
+        default_factory=lambda: int(os.getenv("DB_POOL_MAX_OVERFLOW", "0")),
+    )
+
+    @field_validator("db_pool_max_overflow")
+    @classmethod
+    def validate_db_pool_max_overflow(cls, value: int) -> int:
+        if value < 0:
+            raise ValueError("DB_POOL_MAX_OVERFLOW must not be negative")
+        return value
+
+    db_pool_timeout: float = Field(
+        alias="DB_POOL_TIMEOUT",
+        default_factory=lambda: float(os.getenv("DB_POOL_TIMEOUT", "30")),
+    )
+
+    @field_validator("db_pool_timeout")
+    @classmethod
+    def validate_db_pool_timeout(cls, value: float) -> float:
+        if value <= 0:
+            raise ValueError("DB_POOL_TIMEOUT must be positive")
+        return value
+
+    # Connections opened when the application starts, and kept open when idle
+    db_pool_min_size: int = Field(
+        alias="DB_POOL_MIN_SIZE",
+        default_factory=lambda: int(os.getenv("DB_POOL_MIN_SIZE", "2")),
+    )
+
+    @field_validator("db_pool_min_size")
+    @classmethod
+    def validate_db_pool_min_size(cls, value: int) -> int:
+        if value < 0:
+            raise ValueError("DB_POOL_MIN_SIZE must not be negative")
+        return value
+
+    # Seconds after which a connection is replaced, 0 keeps connections forever
+    db_pool_recycle: float = Field(
+        alias="DB_POOL_RECYCLE",
+        default_factory=lambda: float(os.getenv("DB_POOL_RECYCLE", "1800")),
+    )
+
+    @field_validator("db_pool_recycle")
+    @classmethod
+    def validate_db_pool_recycle(cls, value: float) -> float:
+        if value < 0:
+            raise ValueError("DB_POOL_RECYCLE must not be negative")
+        return value
+
+    # Seconds an idle connection above db_pool_min_size is kept open
+    db_pool_idle_timeout: float = Field(
+        alias="DB_POOL_IDLE_TIMEOUT",
+        default_factory=lambda: float(os.getenv("DB_POOL_IDLE_TIMEOUT", "300")),
+    )
+
+    @field_validator("db_pool_idle_timeout")
+    @classmethod
+    def validate_db_pool_idle_timeout(cls, value: float) -> float:
+        if value < 0:
+            raise ValueError("DB_POOL_IDLE_TIMEOUT must not be negative")
+        return value
+
+    # Seconds between probes of idle connections, 0 disables them; connections
+    # idle for longer than this are pinged by the probe
+    db_pool_probe_interval: float = Field(
+        alias="DB_POOL_PROBE_INTERVAL",
+        default_factory=lambda: float(os.getenv("DB_POOL_PROBE_INTERVAL", "30")),
+    )
+
+    @field_validator("db_pool_probe_interval")
+    @classmethod
+    def validate_db_pool_probe_interval(cls, value: float) -> float:
+        if value < 0:
+            raise ValueError("DB_POOL_PROBE_INTERVAL must not be negative")
+        return value
+
+    # Ping every connection when it is checked out, for networks that drop idle
+    # connections faster than the probe interval
+    db_pool_pre_ping: bool = Field(
+        alias="DB_POOL_PRE_PING",
+        default_factory=lambda: (
+            os.getenv("DB_POOL_PRE_PING", "false").lower() == "true"
+        ),
+    )
+
     jwt_secret_key: str = Field(
         alias="JWT_SECRET_KEY",
         default_factory=lambda: os.getenv("JWT_SECRET_KEY", ""),
@@ -1,9 +1,12 @@
-from contextlib import asynccontextmanager
-from typing import AsyncGenerator, Optional
+import asyncio
+import time
+from contextlib import asynccontextmanager, suppress
+from typing import AsyncGenerator, Awaitable, Callable, Optional
 
 import asyncpg
-from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
-from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, Pool
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -17,81 +20,312 @@ from ...logging import LoggerService
 
 logger = LoggerService().get_logger({"module": "database"})
 
+# Runs once on every new connection of a schema's pool
+ConnectionSetup = Callable[[asyncpg.Connection], Awaitable[None]]
+
+# Schema of the default search path, served by the default pool
+DEFAULT_SCHEMA = "public"
+
+# Keys of the info dictionary of a pooled connection
+IDLE_SINCE = "idle_since"
+PING = "ping"
+
+# Seconds the probe waits for an idle connection to answer a ping
+PING_TIMEOUT = 2
+
 
 class Database:
-    """Database connection manager."""
+    """Database connection manager.
+
+    Every schema registered with :meth:`register_schema` gets one connection
+    pool, shared by everything using the schema, and connections without a
+    schema, or of the ``public`` schema, come from the default pool. Sessions
+    and raw asyncpg connections are drawn from the same pool, the one of the
+    schema's SQLAlchemy engine, so a worker process holds at most
+    ``db_pool_size + db_pool_max_overflow`` connections per pool.
+
+    :meth:`warm_up` opens ``db_pool_min_size`` connections of every pool at
+    startup, and :meth:`start_probing` pings the idle connections in the
+    background instead of every connection when it is checked out, unless
+    ``db_pool_pre_ping`` is set: dead connections are discarded and
+    connections idle for too long closed.
+    """
 
     def __init__(self):
-        self._engine: Optional[AsyncEngine] = None
-        self._pool: Optional[asyncpg.Pool] = None
+        self._engines: dict[Optional[str], AsyncEngine] = {}
+        self._setups: dict[Optional[str], Optional[ConnectionSetup]] = {}
+        self._created_schemas: set[str] = set()
+        self._open: dict[Optional[str], set[ConnectionPoolEntry]] = {}
+        self._probe_task: Optional[asyncio.Task] = None
         self._settings = DomainSettings()
         self.connection_url = (
             f"postgresql+asyncpg://{settings.db_user}:{settings.db_password}"
             f"@{settings.db_host}:{settings.db_port}/{settings.db_name}"
         )
 
+    def register_schema(
+        self, schema: Optional[str], setup: Optional[ConnectionSetup] = None
+    ) -> AsyncEngine:
+        """Register the connection pool of a schema.
+
+        Connections of the pool use the schema as their search path from the
+        moment they are opened, and `setup` runs once on every new connection.
+        Registering a schema again returns its existing engine, and the
+        ``public`` schema uses the default pool.
+
+        Args:
+            schema: Schema of the pool, None for the default pool.
+            setup: Coroutine function configuring a new asyncpg connection.
+
+        Returns:
+            The SQLAlchemy engine owning the pool.
+        """
+        if schema == DEFAULT_SCHEMA:
+            schema = None
+        if schema in self._engines:
+            if setup is not None and setup is not self._setups[schema]:
+                raise DatabaseException(
+                    f"Schema {schema} is already registered with another setup"
+                )
+            return self._engines[schema]
+        try:
+            engine = self._create_engine(schema, setup)
+        except Exception as e:
+            logger.error(f"Failed to create SQLAlchemy engine: {str(e)}")
+            raise DatabaseException(f"Failed to create SQLAlchemy engine: {str(e)}")
+        self._engines[schema] = engine
+        self._setups[schema] = setup
+        return engine
+
     async def create_pool(self, schema: Optional[str] = None) -> None:
-        """Create database connection pool."""
+        """Create the connection pool of a schema, and the schema if missing."""
         try:
             logger.info("Creating database connection pool...", module="database")
+            if schema == DEFAULT_SCHEMA:
+                schema = None
+            self.register_schema(schema)
 
-            self._pool = await asyncpg.create_pool(
-                host=self._settings.db_host,
-                port=self._settings.db_port,
-                user=self._settings.db_user,
-                password=self._settings.db_password,
-                database=self._settings.db_name,
-            )
-
-            if schema:
-                # Create schema if it doesn't exist and set it as the default for this connection
-                async with self._pool.acquire() as connection:
+            if schema and schema not in self._created_schemas:
+                async with self.connection() as connection:
                     await connection.execute(f"CREATE SCHEMA IF NOT EXISTS {schema}")
-                    await connection.execute(f"SET search_path TO {schema}")
-                logger.info(f"Created/set schema: {schema}", module="database")
+                self._created_schemas.add(schema)
+                logger.info(f"Created schema: {schema}", module="database")
 
         except Exception as e:
             logger.error(f"Failed to create database pool: {str(e)}", module="database")
             raise DatabaseException(f"Failed to create database pool: {str(e)}")
 
     @property
-    def pool(self) -> asyncpg.Pool:
-        """Get the connection pool."""
-        if not self._pool:
+    def pool(self) -> Pool:
+        """Get the default connection pool."""
+        if None not in self._engines:
             raise DatabaseException("Database pool not initialized")
-        return self._pool
+        return self._engines[None].pool
 
     async def close_pool(self) -> None:
-        """Close the connection pool."""
-        if self._pool:
-            await self._pool.close()
-            self._pool = None
+        """Close the connection pools of every schema."""
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._probe_task
+            self._probe_task = None
+        engines = list(self._engines.values())
+        self._engines.clear()
+        self._setups.clear()
+        self._open.clear()
+        for engine in engines:
+            await engine.dispose()
 
     @property
     def engine(self) -> AsyncEngine:
-        """Get the SQLAlchemy async engine."""
-        if not self._engine:
-            try:
-                logger.info("Creating SQLAlchemy engine...")
-                self._engine = create_async_engine(
-                    self.connection_url,
-                    echo=False,
-                    future=True,
-                    poolclass=AsyncAdaptedQueuePool,
-                    pool_pre_ping=True,
-                    pool_size=20,
-                    max_overflow=10,
-                )
-                logger.info("SQLAlchemy engine created successfully")
-            except Exception as e:
-                logger.error(f"Failed to create SQLAlchemy engine: {str(e)}")
-                raise DatabaseException(f"Failed to create SQLAlchemy engine: {str(e)}")
-        return self._engine
+        """Get the SQLAlchemy async engine of the default pool."""
+        return self.register_schema(None)
+
+    def _create_engine(
+        self, schema: Optional[str], setup: Optional[ConnectionSetup]
+    ) -> AsyncEngine:
+        """Create an engine whose connections are configured when opened."""
+        logger.info("Creating SQLAlchemy engine...", schema=schema)
+        connect_args = {}
+        if schema:
+            # Sent with the startup message, no extra round trip
+            connect_args["server_settings"] = {"search_path": schema}
+        engine = create_async_engine(
+            self.connection_url,
+            echo=False,
+            future=True,
+            poolclass=AsyncAdaptedQueuePool,
+            # Idle connections sink to the bottom, where the idle timeout closes them
+            pool_use_lifo=True,
+            pool_size=self._settings.db_pool_size,
+            max_overflow=self._settings.db_pool_max_overflow,
+            pool_timeout=self._settings.db_pool_timeout,
+            pool_recycle=self._settings.db_pool_recycle or -1,
+            pool_pre_ping=self._settings.db_pool_pre_ping,
+            connect_args=connect_args,
+        )
+        self._track_connections(engine, schema)
+        if setup is not None:
+
+            @event.listens_for(engine.sync_engine, "connect")
+            def setup_connection(dbapi_connection, connection_record) -> None:
+                dbapi_connection.run_async(setup)
+
+        logger.info("SQLAlchemy engine created successfully", schema=schema)
+        return engine
+
+    def _track_connections(self, engine: AsyncEngine, schema: Optional[str]) -> None:
+        """Record which connections of a pool are open, and which are idle."""
+        open_connections = self._open.setdefault(schema, set())
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def on_connect(dbapi_connection, connection_record) -> None:
+            open_connections.add(connection_record)
+
+        @event.listens_for(engine.sync_engine, "close")
+        def on_close(dbapi_connection, connection_record) -> None:
+            open_connections.discard(connection_record)
+
+        @event.listens_for(engine.sync_engine, "checkout")
+        def on_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+            connection_record.info.pop(IDLE_SINCE, None)
+            # Checked out while the probe pings it: wait for the answer, a
+            # dead connection is replaced by the pool
+            ping = connection_record.info.pop(PING, None)
+            if ping is not None and not dbapi_connection.run_async(
+                lambda _: asyncio.shield(ping)
+            ):
+                raise exc.DisconnectionError("Connection failed its liveness probe")
+
+        @event.listens_for(engine.sync_engine, "checkin")
+        def on_checkin(dbapi_connection, connection_record) -> None:
+            connection_record.info[IDLE_SINCE] = time.monotonic()
+
+    async def warm_up(self) -> None:
+        """Open ``db_pool_min_size`` connections of every pool.
+
+        Called at startup, so that the first requests after a deploy do not
+        pay for connection setup and TLS handshakes.
+        """
+        size = min(self._settings.db_pool_min_size, self._settings.db_pool_size)
+        for schema, engine in list(self._engines.items()):
+            missing = size - len(self._open[schema])
+            if missing <= 0:
+                continue
+            connections = await self._check_out(engine, missing)
+            for conn in connections:
+                await conn.close()
+            logger.info(f"Opened {missing} database connection(s)", schema=schema)
+
+    def start_probing(self) -> None:
+        """Probe the idle connections of every pool in the background."""
+        if self._settings.db_pool_probe_interval > 0 and self._probe_task is None:
+            self._probe_task = asyncio.create_task(self._probe_forever())
+
+    async def _probe_forever(self) -> None:
+        """Probe every pool once per ``db_pool_probe_interval``."""
+        while True:
+            await asyncio.sleep(self._settings.db_pool_probe_interval)
+            for schema in list(self._engines):
+                try:
+                    await self._probe(schema)
+                except Exception as e:
+                    logger.error(
+                        f"Failed to probe database pool: {str(e)}", schema=schema
+                    )
+
+    async def _probe(self, schema: Optional[str]) -> None:
+        """Close and ping the idle connections of a pool.
+
+        Connections idle for longer than the idle timeout are closed, longest
+        idle first, while more than ``db_pool_min_size`` are open. Those sit
+        at the bottom of the LIFO pool, and a closed connection keeps its
+        slot, so it is only reopened once every open connection is in use.
+        Old connections are left to ``pool_recycle``.
+
+        The other connections idle for longer than the probe interval are
+        pinged where they sit, as a checkout would hand out the most recently
+        used connection instead, and discarded when they do not answer within
+        ``PING_TIMEOUT``. A request checking one out meanwhile waits for the
+        answer rather than sharing the connection with the ping. Nothing is
+        pinged when ``db_pool_pre_ping`` pings every checkout instead.
+        """
+        open_connections = self._open.get(schema, set())
+        idle = sorted(
+            (record for record in open_connections if IDLE_SINCE in record.info),
+            key=lambda record: record.info[IDLE_SINCE],
+        )
+        now = time.monotonic()
+        stale = []
+        for record in idle:
+            idle_for = now - record.info[IDLE_SINCE]
+            if (
+                len(open_connections) > self._settings.db_pool_min_size
+                and idle_for > self._settings.db_pool_idle_timeout
+            ):
+                record.invalidate()
+            elif idle_for >= self._settings.db_pool_probe_interval:
+                stale.append(record)
+        if not self._settings.db_pool_pre_ping:
+            await asyncio.gather(*(self._ping(record) for record in stale))
+
+    async def _ping(self, record: ConnectionPoolEntry) -> None:
+        """Ping an idle connection, discarding it when it does not answer."""
+        connection = record.driver_connection
+        ping = asyncio.ensure_future(self._answers(connection))
+        record.info[PING] = ping
+        try:
+            alive = await ping
+        finally:
+            if record.info.get(PING) is ping:
+                del record.info[PING]
+        # A connection checked out meanwhile was left to the checkout
+        if (
+            not alive
+            and IDLE_SINCE in record.info
+            and record.driver_connection is connection
+        ):
+            record.invalidate()
+
+    @staticmethod
+    async def _answers(connection: asyncpg.Connection) -> bool:
+        """Whether a connection answers a query within ``PING_TIMEOUT``.
+
+        A connection that does not answer is terminated at once: closing it
+        gracefully would wait for the server to acknowledge the cancelled
+        ping, which never happens when the network dropped the connection.
+        """
+        try:
+            await connection.fetchval("SELECT 1", timeout=PING_TIMEOUT)
+        except Exception as e:
+            reason = str(e) or type(e).__name__  # Timeouts have no message
+            logger.warning(f"Discarding dead database connection: {reason}")
+            connection.terminate()
+            return False
+        return True
+
+    async def _check_out(
+        self, engine: AsyncEngine, count: int
+    ) -> list[AsyncConnection]:
+        """Check out several connections of a pool at once, used at startup."""
+        results = await asyncio.gather(
+            *(engine.connect().start() for _ in range(count)),
+            return_exceptions=True,
+        )
+        connections = [r for r in results if isinstance(r, AsyncConnection)]
+        errors = [r for r in results if not isinstance(r, AsyncConnection)]
+        if errors:
+            for conn in connections:
+                await conn.close()
+            raise DatabaseException(f"Failed to open database connection: {errors[0]}")
+        return connections
 
     @asynccontextmanager
-    async def session(self) -> AsyncGenerator[AsyncSession, None]:
-        """Get a database session."""
-        session = AsyncSession(self.engine, expire_on_commit=False)
+    async def session(
+        self, schema: Optional[str] = None
+    ) -> AsyncGenerator[AsyncSession, None]:
+        """Get a database session from the pool of a schema."""
+        session = AsyncSession(self.register_schema(schema), expire_on_commit=False)
         try:
             yield session
         except Exception as e:
@@ -102,23 +336,34 @@ class Database:
             await session.close()
 
     @asynccontextmanager
-    async def connection(self) -> AsyncGenerator[asyncpg.Connection, None]:
-        """Get a raw database connection from the pool."""
-        if not self._pool:
-            await self.create_pool()
+    async def connection(
+        self, schema: Optional[str] = None
+    ) -> AsyncGenerator[asyncpg.Connection, None]:
+        """Get a raw asyncpg connection from the pool of a schema."""
+        async with self.register_schema(schema).connect() as conn:
+            pooled = await conn.get_raw_connection()
+            try:
+                yield pooled.driver_connection
+            except Exception as e:
+                logger.error(f"Database connection error: {str(e)}")
+                raise DatabaseException(f"Database connection error: {str(e)}")
 
-        pool = self._pool
-        if not pool:
-            raise DatabaseException("Database pool is not initialized")
+    @asynccontextmanager
+    async def autocommit(
+        self, schema: Optional[str] = None
+    ) -> AsyncGenerator[AsyncConnection, None]:
+        """Get a SQLAlchemy connection in autocommit mode from the pool of a schema.
 
-        conn = await pool.acquire()
-        try:
-            yield conn
-        except Exception as e:
-            logger.error(f"Database connection error: {str(e)}")
-            raise DatabaseException(f"Database connection error: {str(e)}")
-        finally:
-            await pool.release(conn)
+        Every statement is committed on its own, without the round trips of
+        BEGIN and COMMIT, for writes that fit in a single statement.
+        """
+        async with self.register_schema(schema).connect() as conn:
+            await conn.execution_options(isolation_level="AUTOCOMMIT")
+            try:
+                yield conn
+            except Exception as e:
+                logger.error(f"Database connection error: {str(e)}")
+                raise DatabaseException(f"Database connection error: {str(e)}")
 
     async def create_database(self) -> None:
         """Create all database tables."""
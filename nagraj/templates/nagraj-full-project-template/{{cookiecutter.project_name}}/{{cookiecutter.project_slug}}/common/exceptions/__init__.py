@@ -9,6 +9,7 @@ from .domain_exceptions import (
     EntityNotFoundException,
 )
 from .infrastructure_exceptions import (
+    ConcurrencyConflictException,
     DatabaseException,
     InfrastructureException,
     RepositoryException,
@@ -22,6 +23,7 @@ __all__ = [
     # Application exceptions
     "InvalidRequestException",
     # Infrastructure exceptions
+    "ConcurrencyConflictException",
     "DatabaseException",
     "InfrastructureException",
     "RepositoryException",
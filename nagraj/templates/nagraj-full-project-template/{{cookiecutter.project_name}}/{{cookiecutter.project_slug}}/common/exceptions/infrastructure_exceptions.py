@@ -72,3 +72,12 @@ class UpdateOperationFailedException(RepositoryException):
 
     def __init__(self, message: str, status_code: int = 500) -> None:
         super().__init__(message, status_code)
+
+
+class ConcurrencyConflictException(RepositoryException):
+    """
+    Exception raised when an aggregate was modified since it was loaded
+    """
+
+    def __init__(self, message: str, status_code: int = 409) -> None:
+        super().__init__(message, status_code)
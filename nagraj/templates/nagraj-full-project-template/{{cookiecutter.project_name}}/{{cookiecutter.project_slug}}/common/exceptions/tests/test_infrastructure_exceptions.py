@@ -1,6 +1,7 @@
 """Tests for infrastructure exceptions."""
 
 from ..infrastructure_exceptions import (
+    ConcurrencyConflictException,
     DatabaseException,
     DeleteOperationFailedException,
     EntityNotFoundRepositoryException,
@@ -73,6 +74,13 @@ def test_update_operation_failed_exception():
     assert isinstance(exception, RepositoryException)
 
 
+def test_concurrency_conflict_exception():
+    """Test ConcurrencyConflictException."""
+    exception = ConcurrencyConflictException("User was modified concurrently")
+    assert str(exception) == "('User was modified concurrently', 409)"
+    assert isinstance(exception, RepositoryException)
+
+
 def test_exception_inheritance_chain():
     """Test the complete inheritance chain of repository exceptions."""
     exceptions = [
@@ -80,6 +88,7 @@ def test_exception_inheritance_chain():
         SaveOperationFailedException("Save failed"),
         DeleteOperationFailedException("Delete failed"),
         UpdateOperationFailedException("Update failed"),
+        ConcurrencyConflictException("Conflict"),
     ]
 
     for exception in exceptions:
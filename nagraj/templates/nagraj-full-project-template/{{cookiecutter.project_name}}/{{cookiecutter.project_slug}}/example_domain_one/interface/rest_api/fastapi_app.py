@@ -5,6 +5,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from {{ cookiecutter.project_slug }}.common.bounded_contexts.auth.interfaces.apis.routes.v1.auth import (
     router as auth_router,
 )
+from {{ cookiecutter.project_slug }}.common.core.config.settings import settings
 from {{ cookiecutter.project_slug }}.common.core.infrastructure.database.database import db
 from {{ cookiecutter.project_slug }}.common.core.logging.api_logs import (
     setup_logging_middleware,
@@ -15,8 +16,12 @@ from {{ cookiecutter.project_slug }}.common.core.logging.api_logs import (
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for database connection."""
-    # Startup
+    # Startup: open the pools and their connections before the first request
     await db.create_pool()
+    for schema in settings.db_schemas:
+        await db.create_pool(schema)
+    await db.warm_up()
+    db.start_probing()
     yield
     # Shutdown
     await db.close_pool()
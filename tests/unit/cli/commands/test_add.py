@@ -0,0 +1,63 @@
+"""Unit tests for the add commands."""
+
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from nagraj.cli.commands.add import add
+
+
+@pytest.fixture
+def cli_runner():
+    """Fixture for click CLI runner."""
+    return CliRunner()
+
+
+def test_add_domain_command(cli_runner, tmp_path):
+    """Test add domain passes the requested contexts."""
+    with patch("nagraj.core.scaffold.add_domain") as mock_add:
+        mock_add.return_value = [tmp_path / "app" / "shipping"]
+
+        result = cli_runner.invoke(
+            add,
+            [
+                "domain",
+                "shipping",
+                "--context",
+                "tracking",
+                "--project-dir",
+                str(tmp_path),
+            ],
+        )
+
+    assert result.exit_code == 0
+    mock_add.assert_called_once_with(tmp_path, "shipping", ("tracking",))
+    assert "Added domain shipping" in result.output
+
+
+def test_add_context_command(cli_runner, tmp_path):
+    """Test add context targets the given domain."""
+    with patch("nagraj.core.scaffold.add_bounded_context") as mock_add:
+        mock_add.return_value = tmp_path / "billing"
+
+        result = cli_runner.invoke(
+            add, ["context", "commerce", "billing", "--project-dir", str(tmp_path)]
+        )
+
+    assert result.exit_code == 0
+    mock_add.assert_called_once_with(tmp_path, "commerce", "billing")
+    assert "Added bounded context billing to commerce" in result.output
+
+
+def test_add_context_command_error(cli_runner, tmp_path):
+    """Test add context when the domain does not exist."""
+    with patch("nagraj.core.scaffold.add_bounded_context") as mock_add:
+        mock_add.side_effect = ValueError("Domain commerce does not exist")
+
+        result = cli_runner.invoke(
+            add, ["context", "commerce", "billing", "--project-dir", str(tmp_path)]
+        )
+
+    assert result.exit_code != 0
+    assert "Failed to add bounded context" in result.output
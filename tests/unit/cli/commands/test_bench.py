@@ -0,0 +1,95 @@
+"""Unit tests for the bench commands."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from nagraj.cli.commands.bench import bench
+from nagraj.core.benchmark import REPORT_FORMAT
+
+
+@pytest.fixture
+def cli_runner():
+    """Fixture for click CLI runner."""
+    return CliRunner()
+
+
+def write_report(path, **medians):
+    """Write a report holding the given metric medians."""
+    path.write_text(
+        json.dumps(
+            {
+                "format": REPORT_FORMAT,
+                "metrics": {
+                    name: {"median": median, "min": median, "max": median}
+                    for name, median in medians.items()
+                },
+            }
+        )
+    )
+    return path
+
+
+def test_bench_run_writes_report(cli_runner, tmp_path):
+    """Test that a run stores its report as JSON."""
+    output = tmp_path / "baseline.json"
+    with patch("nagraj.core.benchmark.run_benchmarks") as mock_run:
+        mock_run.return_value = {
+            "format": REPORT_FORMAT,
+            "metrics": {"init.cold": {"median": 0.5, "min": 0.4, "max": 1.5}},
+        }
+
+        result = cli_runner.invoke(
+            bench,
+            ["run", "--rounds", "3", "--size", "10", "--output", str(output)],
+        )
+
+    assert result.exit_code == 0, result.output
+    lines = result.output.splitlines()
+    header = next(line for line in lines if "median" in line)
+    assert header.split()[1::2] == ["metric", "median", "min", "max"]
+    row = next(line for line in lines if "init.cold" in line)
+    assert row.index("500.00 ms") < row.index("400.00 ms") < row.index("1.500 s")
+    assert json.loads(output.read_text()) == mock_run.return_value
+    kwargs = mock_run.call_args.kwargs
+    assert kwargs["rounds"] == 3
+    assert kwargs["sizes"] == (10,)
+
+
+def test_bench_compare_passes(cli_runner, tmp_path):
+    """Test comparing reports within the threshold."""
+    baseline = write_report(tmp_path / "baseline.json", a=1.0, b=2.0)
+    current = write_report(tmp_path / "current.json", a=1.1, b=1.0)
+
+    result = cli_runner.invoke(bench, ["compare", str(baseline), str(current)])
+
+    assert result.exit_code == 0, result.output
+    assert "+10.0%" in result.output
+    assert "-50.0%" in result.output
+
+
+def test_bench_compare_fails_on_regression(cli_runner, tmp_path):
+    """Test that a regression past the threshold fails the command."""
+    baseline = write_report(tmp_path / "baseline.json", a=1.0, b=2.0)
+    current = write_report(tmp_path / "current.json", a=1.1, b=3.0)
+
+    result = cli_runner.invoke(
+        bench, ["compare", str(baseline), str(current), "--threshold", "0.05"]
+    )
+
+    assert result.exit_code == 1
+    assert "2 metric(s) regressed by more than 5%: a, b" in result.output
+
+
+def test_bench_compare_invalid_report(cli_runner, tmp_path):
+    """Test comparing against a file that is not a benchmark report."""
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text("{}")
+    current = write_report(tmp_path / "current.json", a=1.0)
+
+    result = cli_runner.invoke(bench, ["compare", str(baseline), str(current)])
+
+    assert result.exit_code == 1
+    assert "Failed to compare benchmarks" in result.output
@@ -0,0 +1,34 @@
+"""Unit tests for the cache command."""
+
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from nagraj.cli.commands.cache import cache
+
+
+@pytest.fixture
+def cli_runner():
+    """Fixture for click CLI runner."""
+    return CliRunner()
+
+
+def test_cache_clear(cli_runner, tmp_path):
+    """Test clearing the template cache."""
+    (tmp_path / "entry.jinja.cache").write_bytes(b"data")
+    (tmp_path / "yaml").mkdir()
+    (tmp_path / "yaml" / "entry.yaml.pickle").write_bytes(b"data")
+    (tmp_path / "doctor").mkdir()
+    (tmp_path / "doctor" / "entry.doctor.pickle").write_bytes(b"data")
+
+    with patch("nagraj.config.settings.get_settings") as mock_get_settings:
+        mock_get_settings.return_value.cache_dir = tmp_path
+        mock_get_settings.return_value.cache_max_size = 1024
+        result = cli_runner.invoke(cache, ["clear"])
+
+    assert result.exit_code == 0
+    assert "Cleared template cache" in result.output
+    assert not (tmp_path / "entry.jinja.cache").exists()
+    assert not (tmp_path / "yaml" / "entry.yaml.pickle").exists()
+    assert not (tmp_path / "doctor" / "entry.doctor.pickle").exists()
@@ -0,0 +1,88 @@
+"""Unit tests for the doctor command."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from nagraj.cli.commands.doctor import doctor
+from nagraj.config.settings import settings
+
+BLOCKING = """\
+async def handle(path):
+    with open(path) as f:
+        return f.read()
+"""
+
+DEPENDENCY = """\
+from fastapi import Depends
+
+
+def get_service():
+    return Service()
+
+
+def route(service=Depends(get_service)):
+    pass
+"""
+
+
+@pytest.fixture
+def cli_runner(tmp_path, monkeypatch):
+    """Fixture for click CLI runner with an isolated cache."""
+    monkeypatch.setattr(settings, "cache_dir", tmp_path / "cache")
+    return CliRunner()
+
+
+def write_project(tmp_path, **modules):
+    """Write the modules of a project and return its directory."""
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    for name, source in modules.items():
+        (project_dir / f"{name}.py").write_text(source)
+    return str(project_dir)
+
+
+def test_doctor_command_errors(cli_runner, tmp_path):
+    """Test that errors are printed with their location and fail the command."""
+    project_dir = write_project(tmp_path, handler=BLOCKING)
+
+    result = cli_runner.invoke(doctor, ["--project-dir", project_dir])
+
+    assert result.exit_code == 1
+    assert "handler.py:2:10" in result.output
+    assert "blocking-io-in-async" in result.output
+    assert "1 error(s) and 0 warning(s) in 1 file(s)" in result.output
+
+
+def test_doctor_command_warnings(cli_runner, tmp_path):
+    """Test that warnings only fail the command with --strict."""
+    project_dir = write_project(tmp_path, routes=DEPENDENCY)
+
+    result = cli_runner.invoke(doctor, ["--project-dir", project_dir])
+
+    assert result.exit_code == 0, result.output
+    assert "0 error(s) and 1 warning(s)" in result.output
+
+    result = cli_runner.invoke(doctor, ["--project-dir", project_dir, "--strict"])
+
+    assert result.exit_code == 1
+
+
+def test_doctor_command_json(cli_runner, tmp_path):
+    """Test the JSON report."""
+    project_dir = write_project(tmp_path, handler=BLOCKING, routes=DEPENDENCY)
+
+    result = cli_runner.invoke(
+        doctor, ["--project-dir", project_dir, "--format", "json", "--no-cache"]
+    )
+
+    assert result.exit_code == 1
+    report = json.loads(result.output)
+    assert report["files"] == 2
+    assert report["cached"] == 0
+    assert report["passed"] is False
+    assert [(f["path"], f["line"], f["severity"]) for f in report["findings"]] == [
+        ("handler.py", 2, "error"),
+        ("routes.py", 4, "warning"),
+    ]
@@ -0,0 +1,68 @@
+"""Unit tests for the gen command."""
+
+import pytest
+from click.testing import CliRunner
+
+from nagraj.cli.commands.gen import gen
+from nagraj.config.settings import settings
+from nagraj.core.template import TemplateEngine
+
+MAPPER = (
+    "test_project/common/bounded_contexts/auth/infrastructure/mappers/user_mapper.py"
+)
+
+
+@pytest.fixture
+def cli_runner(tmp_path, monkeypatch):
+    """Fixture for click CLI runner with an isolated cache."""
+    monkeypatch.setattr(settings, "cache_dir", tmp_path / "cache")
+    return CliRunner()
+
+
+@pytest.fixture
+def project_dir(cli_runner, tmp_path):
+    """Fixture for a freshly generated project."""
+    context = {
+        "project_name": "test_project",
+        "author_name": "Test Author",
+        "author_email": "test@example.com",
+    }
+    return TemplateEngine().generate_project(
+        "nagraj-full-project-template", tmp_path / "out", context
+    )
+
+
+def test_gen_mappers(cli_runner, project_dir):
+    """Test regenerating an outdated mapper."""
+    (project_dir / MAPPER).write_text("# outdated\n")
+
+    result = cli_runner.invoke(gen, ["mappers", "--project-dir", str(project_dir)])
+
+    assert result.exit_code == 0, result.output
+    assert "Updated 1 of 1 mapper(s)" in result.output
+    assert "def user_to_aggregate" in (project_dir / MAPPER).read_text()
+
+
+def test_gen_mappers_check(cli_runner, project_dir):
+    """Test that --check reports outdated mappers without writing them."""
+    args = ["mappers", "--project-dir", str(project_dir), "--check"]
+
+    result = cli_runner.invoke(gen, args)
+
+    assert result.exit_code == 0, result.output
+    assert "All 1 mapper(s) are up to date" in result.output
+
+    (project_dir / MAPPER).write_text("# outdated\n")
+    result = cli_runner.invoke(gen, args)
+
+    assert result.exit_code == 1
+    assert "1 of 1 mapper(s) are out of date" in result.output
+    assert (project_dir / MAPPER).read_text() == "# outdated\n"
+
+
+def test_gen_mappers_without_project(cli_runner, tmp_path):
+    """Test that a directory without .nagraj.yaml is reported."""
+    result = cli_runner.invoke(gen, ["mappers", "--project-dir", str(tmp_path)])
+
+    assert result.exit_code == 1
+    assert "Failed to generate mappers" in result.output
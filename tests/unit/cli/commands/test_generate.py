@@ -0,0 +1,68 @@
+"""Unit tests for the generate command."""
+
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from nagraj.cli.commands.generate import generate
+from nagraj.core.generate import GenerateResult
+
+
+@pytest.fixture
+def cli_runner():
+    """Fixture for click CLI runner."""
+    return CliRunner()
+
+
+@pytest.fixture
+def spec_path(tmp_path):
+    """Fixture for an empty spec file."""
+    path = tmp_path / "system.yaml"
+    path.write_text("domains: {}\n")
+    return path
+
+
+def test_generate_command(cli_runner, tmp_path, spec_path):
+    """Test generate command reports each level."""
+    with patch("nagraj.core.generate.generate_from_spec") as mock_generate:
+        mock_generate.return_value = GenerateResult(
+            domains=["commerce"],
+            levels=[["commerce.catalog"], ["commerce.order"]],
+        )
+
+        result = cli_runner.invoke(
+            generate,
+            [
+                "--spec",
+                str(spec_path),
+                "--project-dir",
+                str(tmp_path),
+                "--workers",
+                "4",
+            ],
+        )
+
+    assert result.exit_code == 0
+    mock_generate.assert_called_once_with(spec_path, tmp_path, max_workers=4)
+    assert "1 domain(s) and 2 bounded context(s) in 2 level(s)" in result.output
+
+
+def test_generate_command_error(cli_runner, tmp_path, spec_path):
+    """Test generate command when the spec has a cycle."""
+    with patch("nagraj.core.generate.generate_from_spec") as mock_generate:
+        mock_generate.side_effect = ValueError("Dependency cycle")
+
+        result = cli_runner.invoke(
+            generate, ["--spec", str(spec_path), "--project-dir", str(tmp_path)]
+        )
+
+    assert result.exit_code != 0
+    assert "Failed to generate from spec" in result.output
+
+
+def test_generate_command_missing_spec(cli_runner, tmp_path):
+    """Test generate command requires an existing spec file."""
+    result = cli_runner.invoke(generate, ["--spec", str(tmp_path / "missing.yaml")])
+
+    assert result.exit_code != 0
@@ -1,13 +1,19 @@
 """Unit tests for the init command."""
 
-from pathlib import Path
+import io
+import zipfile
 from subprocess import CalledProcessError
 from unittest.mock import patch
 
 import pytest
 from click.testing import CliRunner
 
-from nagraj.cli.commands.init import get_git_config_value, init
+from nagraj.cli.commands.init import (
+    get_git_config_value,
+    init,
+    resolve_git_config_value,
+)
+from nagraj.core.git_config import GitConfigError
 
 
 @pytest.fixture
@@ -46,9 +52,56 @@ def test_get_git_config_value_failure():
         assert result is None
 
 
+def test_resolve_git_config_value_in_process():
+    """Test that git config values are resolved without a subprocess."""
+    resolve_git_config_value.cache_clear()
+    with patch("nagraj.core.git_config.read_global_git_config") as mock_read, \
+         patch("subprocess.run") as mock_run:
+        mock_read.return_value = {"user.name": "John Doe"}
+
+        assert resolve_git_config_value("user.name") == "John Doe"
+        assert resolve_git_config_value("user.name") == "John Doe"
+        assert resolve_git_config_value("user.email") is None
+
+        mock_run.assert_not_called()
+        assert mock_read.call_count == 2
+    resolve_git_config_value.cache_clear()
+
+
+def test_resolve_git_config_value_falls_back_to_git():
+    """Test that the git subprocess is used when parsing fails."""
+    resolve_git_config_value.cache_clear()
+    with patch("nagraj.core.git_config.read_global_git_config") as mock_read, \
+         patch("subprocess.run") as mock_run:
+        mock_read.side_effect = GitConfigError("bad config")
+        mock_run.return_value.stdout = "John Doe\n"
+
+        assert resolve_git_config_value("user.name") == "John Doe"
+        mock_run.assert_called_once()
+    resolve_git_config_value.cache_clear()
+
+
+def test_init_command_explicit_author_skips_git_lookup(cli_runner, temp_dir):
+    """Test that git config is not read when author values are given."""
+    with patch("nagraj.core.template.template_engine"), \
+         patch("nagraj.cli.commands.init.resolve_git_config_value") as mock_git:
+
+        result = cli_runner.invoke(
+            init,
+            [
+                "--project-root-dir", str(temp_dir),
+                "--project-author-name", "Test Author",
+                "--project-author-email", "test@example.com",
+            ],
+        )
+
+        assert result.exit_code == 0
+        mock_git.assert_not_called()
+
+
 def test_init_command_basic(cli_runner, temp_dir):
     """Test basic init command execution."""
-    with patch("nagraj.cli.commands.init.cookiecutter") as mock_cookiecutter, \
+    with patch("nagraj.core.template.template_engine") as mock_engine, \
          patch("pathlib.Path.exists") as mock_exists:
         
         # Ensure template directory exists
@@ -65,30 +118,29 @@ def test_init_command_basic(cli_runner, temp_dir):
         )
         
         assert result.exit_code == 0
-        mock_cookiecutter.assert_called_once()
-        call_kwargs = mock_cookiecutter.call_args[1]
+        mock_engine.generate_project.assert_called_once()
+        call_kwargs = mock_engine.generate_project.call_args[1]
         
-        # Verify template directory path is passed as first argument
-        template_dir = Path(mock_cookiecutter.call_args[0][0])
-        assert template_dir.name == "nagraj-full-project-template"
+        # Verify template name is passed as first argument
+        assert mock_engine.generate_project.call_args[0][0] == "nagraj-full-project-template"
         
         # Verify context variables
-        assert call_kwargs["extra_context"] == {
+        assert call_kwargs["context"] == {
             "project_name": "test_project",
             "author_name": "Test Author",
             "author_email": "test@example.com",
             "project_description": "A Python project generated using nagraj",
             "python_version": "3.12",
             "version": "0.1.0",
+            "runtime_profile": "standard",
         }
-        assert call_kwargs["no_input"] is True
-        assert call_kwargs["output_dir"] == str(temp_dir)
+        assert call_kwargs["output_dir"] == temp_dir
 
 
 def test_init_command_with_defaults(cli_runner, temp_dir):
     """Test init command with default values."""
-    with patch("nagraj.cli.commands.init.cookiecutter") as mock_cookiecutter, \
-         patch("nagraj.cli.commands.init.get_git_config_value") as mock_git, \
+    with patch("nagraj.core.template.template_engine") as mock_engine, \
+         patch("nagraj.cli.commands.init.resolve_git_config_value") as mock_git, \
          patch("pathlib.Path.exists") as mock_exists:
         
         # Ensure template directory exists
@@ -105,15 +157,58 @@ def test_init_command_with_defaults(cli_runner, temp_dir):
         )
         
         assert result.exit_code == 0
-        mock_cookiecutter.assert_called_once()
-        call_kwargs = mock_cookiecutter.call_args[1]
+        mock_engine.generate_project.assert_called_once()
+        call_kwargs = mock_engine.generate_project.call_args[1]
         
         # Verify default values
-        assert call_kwargs["extra_context"]["project_name"] == "my_app"
-        assert call_kwargs["extra_context"]["author_name"] == "Git User"
-        assert call_kwargs["extra_context"]["author_email"] == "git@example.com"
-        assert call_kwargs["no_input"] is True
-        assert call_kwargs["output_dir"] == str(temp_dir)
+        assert call_kwargs["context"]["project_name"] == "my_app"
+        assert call_kwargs["context"]["author_name"] == "Git User"
+        assert call_kwargs["context"]["author_email"] == "git@example.com"
+        assert call_kwargs["output_dir"] == temp_dir
+
+
+def test_init_command_runtime_profile(cli_runner, temp_dir):
+    """Test that the runtime profile is passed to the template."""
+    with patch("nagraj.core.template.template_engine") as mock_engine:
+        result = cli_runner.invoke(
+            init,
+            [
+                "--project-root-dir", str(temp_dir),
+                "--project-author-name", "Test Author",
+                "--project-author-email", "test@example.com",
+                "--runtime-profile", "lean",
+            ],
+        )
+
+        assert result.exit_code == 0
+        call_kwargs = mock_engine.generate_project.call_args[1]
+        assert call_kwargs["context"]["runtime_profile"] == "lean"
+
+    result = cli_runner.invoke(init, ["--runtime-profile", "fast"])
+    assert result.exit_code != 0
+    assert "Invalid value for '--runtime-profile'" in result.output
+
+
+def test_init_command_no_cache(cli_runner, temp_dir):
+    """Test init command with the template cache disabled."""
+    with patch("nagraj.core.template.TemplateEngine") as mock_engine_cls, \
+         patch("nagraj.core.template.template_engine") as mock_engine:
+
+        result = cli_runner.invoke(
+            init,
+            [
+                "--project-name", "test_project",
+                "--project-root-dir", str(temp_dir),
+                "--project-author-name", "Test Author",
+                "--project-author-email", "test@example.com",
+                "--no-cache",
+            ],
+        )
+
+        assert result.exit_code == 0
+        mock_engine_cls.assert_called_once_with(use_cache=False)
+        mock_engine_cls.return_value.generate_project.assert_called_once()
+        mock_engine.generate_project.assert_not_called()
 
 
 def test_init_command_template_not_found(cli_runner, temp_dir):
@@ -133,16 +228,16 @@ def test_init_command_template_not_found(cli_runner, temp_dir):
         assert "Template directory not found" in result.output
 
 
-def test_init_command_cookiecutter_error(cli_runner, temp_dir):
-    """Test init command when cookiecutter fails."""
-    with patch("nagraj.cli.commands.init.cookiecutter") as mock_cookiecutter, \
+def test_init_command_generation_error(cli_runner, temp_dir):
+    """Test init command when project generation fails."""
+    with patch("nagraj.core.template.template_engine") as mock_engine, \
          patch("pathlib.Path.exists") as mock_exists:
         
         # Ensure template directory exists
         mock_exists.return_value = True
         
-        # Make cookiecutter raise an exception
-        mock_cookiecutter.side_effect = Exception("Cookiecutter failed")
+        # Make the template engine raise an exception
+        mock_engine.generate_project.side_effect = Exception("Generation failed")
         
         result = cli_runner.invoke(
             init,
@@ -153,4 +248,94 @@ def test_init_command_cookiecutter_error(cli_runner, temp_dir):
         )
         
         assert result.exit_code != 0
-        assert "Failed to create project" in str(result.output) 
\ No newline at end of file
+        assert "Failed to create project" in str(result.output) 
+
+def test_init_command_output_archive_stdout(temp_dir, monkeypatch):
+    """Test init command streaming a zip archive to stdout."""
+    monkeypatch.chdir(temp_dir)
+    cli_runner = CliRunner(mix_stderr=False)
+
+    result = cli_runner.invoke(
+        init,
+        [
+            "--project-name", "test_project",
+            "--project-author-name", "Test Author",
+            "--project-author-email", "test@example.com",
+            "--output-archive", "-",
+            "--no-cache",
+        ],
+    )
+
+    assert result.exit_code == 0, result.stderr
+    with zipfile.ZipFile(io.BytesIO(result.stdout_bytes)) as archive:
+        assert "test_project/pyproject.toml" in archive.namelist()
+    assert "Successfully created project" in result.stderr
+    assert list(temp_dir.iterdir()) == []
+
+
+def test_init_command_output_archive_file(cli_runner, temp_dir):
+    """Test init command writing an archive with an inferred format."""
+    with patch("nagraj.core.template.template_engine") as mock_engine:
+        archive_path = temp_dir / "project.tar.gz"
+
+        result = cli_runner.invoke(
+            init,
+            [
+                "--project-name", "test_project",
+                "--project-author-name", "Test Author",
+                "--project-author-email", "test@example.com",
+                "--output-archive", str(archive_path),
+            ],
+        )
+
+        assert result.exit_code == 0
+        args = mock_engine.generate_archive.call_args[0]
+        assert args[0] == "nagraj-full-project-template"
+        assert args[3] == "tar.gz"
+        mock_engine.generate_project.assert_not_called()
+        assert "Project archive" in result.output
+
+
+def test_init_command_output_archive_failure(cli_runner, temp_dir):
+    """Test that a failed render leaves no partial archive behind."""
+    with patch("nagraj.core.template.template_engine") as mock_engine:
+        archive_path = temp_dir / "project.zip"
+
+        def partial_archive(template_name, output, context, archive_format):
+            output.write(b"PK")
+            raise ValueError("Invalid template")
+
+        mock_engine.generate_archive.side_effect = partial_archive
+
+        result = cli_runner.invoke(
+            init,
+            [
+                "--project-name", "test_project",
+                "--project-author-name", "Test Author",
+                "--project-author-email", "test@example.com",
+                "--output-archive", str(archive_path),
+            ],
+        )
+
+        assert result.exit_code != 0
+        assert "Invalid template" in result.output
+        assert list(temp_dir.iterdir()) == []
+
+
+def test_init_command_output_archive_unknown_format(cli_runner, temp_dir):
+    """Test init command rejects archive names without a known suffix."""
+    with patch("nagraj.core.template.template_engine") as mock_engine:
+        result = cli_runner.invoke(
+            init,
+            [
+                "--project-name", "test_project",
+                "--project-author-name", "Test Author",
+                "--project-author-email", "test@example.com",
+                "--output-archive", str(temp_dir / "project.rar"),
+            ],
+        )
+
+        assert result.exit_code != 0
+        assert "Cannot infer archive format" in result.output
+        mock_engine.generate_archive.assert_not_called()
+        assert not (temp_dir / "project.rar").exists()
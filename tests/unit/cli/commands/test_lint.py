@@ -0,0 +1,69 @@
+"""Unit tests for the lint command."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from nagraj.cli.commands.lint import lint
+from nagraj.config.settings import settings
+
+
+@pytest.fixture
+def cli_runner(tmp_path, monkeypatch):
+    """Fixture for click CLI runner with an isolated cache."""
+    monkeypatch.setattr(settings, "cache_dir", tmp_path / "cache")
+    return CliRunner()
+
+
+def write_spec(tmp_path, text):
+    """Write a spec file and return its path."""
+    path = tmp_path / "system.yaml"
+    path.write_text(text)
+    return str(path)
+
+
+def test_lint_command_valid(cli_runner, tmp_path):
+    """Test linting a spec without violations."""
+    spec = write_spec(tmp_path, "domains:\n  commerce:\n    bounded_contexts:\n")
+
+    result = cli_runner.invoke(lint, [spec])
+
+    assert result.exit_code == 0, result.output
+    assert "All names follow the naming rules" in result.output
+
+
+def test_lint_command_violations(cli_runner, tmp_path):
+    """Test that every violation is printed and fails the command."""
+    spec = write_spec(
+        tmp_path,
+        "domains:\n  orders:\n    bounded_contexts:\n      items:\n"
+        "        entities: [line--item]\n",
+    )
+
+    result = cli_runner.invoke(lint, [spec])
+
+    assert result.exit_code == 1
+    assert "domains.orders.bounded_contexts.items.entities[0]" in result.output
+    assert "Found 3 naming violation(s)" in result.output
+
+    result = cli_runner.invoke(lint, [spec, "--format", "json"])
+
+    report = json.loads(result.output)
+    assert result.exit_code == 1
+    assert report["valid"] is False
+    assert [violation["kind"] for violation in report["violations"]] == [
+        "domain",
+        "context",
+        "entity",
+    ]
+
+
+def test_lint_command_invalid_yaml(cli_runner, tmp_path):
+    """Test that an unparsable spec is reported as an error."""
+    spec = write_spec(tmp_path, "domains: [\n")
+
+    result = cli_runner.invoke(lint, [spec])
+
+    assert result.exit_code == 1
+    assert "Failed to lint spec" in result.output
@@ -0,0 +1,63 @@
+"""Unit tests for the sync command."""
+
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from nagraj.cli.commands.sync import sync
+from nagraj.core.sync import SyncResult
+
+
+@pytest.fixture
+def cli_runner():
+    """Fixture for click CLI runner."""
+    return CliRunner()
+
+
+def test_sync_command(cli_runner, tmp_path):
+    """Test sync command passes overrides and reports changes."""
+    with patch("nagraj.core.sync.sync_project") as mock_sync:
+        mock_sync.return_value = SyncResult(updated=["pyproject.toml"], unchanged=3)
+
+        result = cli_runner.invoke(
+            sync,
+            ["--project-dir", str(tmp_path), "--set", "version=0.2.0", "--dry-run"],
+        )
+
+    assert result.exit_code == 0
+    mock_sync.assert_called_once_with(
+        tmp_path, overrides={"version": "0.2.0"}, force=False, dry_run=True
+    )
+    assert "pyproject.toml" in result.output
+    assert "Would change 1 file(s), 3 file(s) unchanged" in result.output
+
+
+def test_sync_command_conflicts(cli_runner, tmp_path):
+    """Test sync command fails when files were modified locally."""
+    with patch("nagraj.core.sync.sync_project") as mock_sync:
+        mock_sync.return_value = SyncResult(conflicts=["pyproject.toml"])
+
+        result = cli_runner.invoke(sync, ["--project-dir", str(tmp_path)])
+
+    assert result.exit_code != 0
+    assert "--force" in result.output
+
+
+def test_sync_command_invalid_override(cli_runner, tmp_path):
+    """Test sync command rejects malformed overrides."""
+    result = cli_runner.invoke(sync, ["--project-dir", str(tmp_path), "--set", "oops"])
+
+    assert result.exit_code != 0
+    assert "KEY=VALUE" in result.output
+
+
+def test_sync_command_error(cli_runner, tmp_path):
+    """Test sync command when synchronization fails."""
+    with patch("nagraj.core.sync.sync_project") as mock_sync:
+        mock_sync.side_effect = FileNotFoundError("No nagraj manifest found")
+
+        result = cli_runner.invoke(sync, ["--project-dir", str(tmp_path)])
+
+    assert result.exit_code != 0
+    assert "Failed to synchronize project" in result.output
@@ -0,0 +1,69 @@
+"""Unit tests for the validate command."""
+
+import json
+import shutil
+
+import pytest
+import yaml
+from click.testing import CliRunner
+
+from nagraj.cli.commands.validate import validate
+from nagraj.core.benchmark import build_synthetic_project
+
+
+@pytest.fixture
+def cli_runner():
+    """Fixture for click CLI runner."""
+    return CliRunner()
+
+
+@pytest.fixture
+def project_dir(tmp_path):
+    """Fixture for a valid project of 10 bounded contexts."""
+    project_dir = tmp_path / "project"
+    config = build_synthetic_project(project_dir, 10)
+    (project_dir / ".nagraj.yaml").write_text(yaml.safe_dump(config.model_dump()))
+    return project_dir
+
+
+def test_validate_command_valid(cli_runner, project_dir):
+    """Test validating a complete project."""
+    result = cli_runner.invoke(validate, ["--project-dir", str(project_dir)])
+
+    assert result.exit_code == 0, result.output
+    assert "Project structure is valid" in result.output
+
+
+def test_validate_command_errors(cli_runner, project_dir):
+    """Test that structure errors fail the command."""
+    shutil.rmtree(project_dir / "src" / "domains" / "domain0" / "context1")
+
+    result = cli_runner.invoke(validate, ["--project-dir", str(project_dir)])
+
+    assert result.exit_code == 1
+    assert "domains/domain0/context1" in result.output
+    assert "Found 1 structure error(s)" in result.output
+
+
+def test_validate_command_json(cli_runner, project_dir):
+    """Test machine-readable output."""
+    shutil.rmtree(project_dir / "src" / "domains" / "domain0" / "context1")
+
+    result = cli_runner.invoke(
+        validate, ["--project-dir", str(project_dir), "--format", "json"]
+    )
+
+    assert result.exit_code == 1
+    assert json.loads(result.output) == {
+        "project_dir": str(project_dir),
+        "valid": False,
+        "errors": ["Missing required directory: domains/domain0/context1"],
+    }
+
+
+def test_validate_command_without_config(cli_runner, tmp_path):
+    """Test validating a directory without .nagraj.yaml."""
+    result = cli_runner.invoke(validate, ["--project-dir", str(tmp_path)])
+
+    assert result.exit_code == 1
+    assert "Failed to validate project" in result.output
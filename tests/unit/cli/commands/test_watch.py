@@ -0,0 +1,56 @@
+"""Unit tests for the watch command."""
+
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from nagraj.cli.commands.watch import watch
+from nagraj.core.sync import SyncResult
+from nagraj.core.watch import WatchResult
+
+
+@pytest.fixture
+def cli_runner():
+    """Fixture for click CLI runner."""
+    return CliRunner()
+
+
+def test_watch_command(cli_runner, tmp_path):
+    """Test that the watch reports every batch of changes until interrupted."""
+
+    def fake_watch(session, watcher, on_change, debounce):
+        assert debounce == 0.5
+        on_change(
+            WatchResult(
+                config_changed=True,
+                scaffolded=["app/billing"],
+                sync=SyncResult(updated=["pyproject.toml"]),
+            )
+        )
+        on_change(WatchResult(error="invalid YAML"))
+        raise KeyboardInterrupt
+
+    with (
+        patch("nagraj.core.watch.WatchSession") as mock_session,
+        patch("nagraj.core.watch.run_watch", side_effect=fake_watch),
+    ):
+        mock_session.return_value.template_dir = None
+        result = cli_runner.invoke(
+            watch, ["--project-dir", str(tmp_path), "--debounce", "0.5", "--poll"]
+        )
+
+    assert result.exit_code == 0, result.output
+    assert "(polling)" in result.output
+    assert "app/billing" in result.output
+    assert "pyproject.toml" in result.output
+    assert "Changed 2 path(s)" in result.output
+    assert "invalid YAML" in result.output
+
+
+def test_watch_command_without_manifest(cli_runner, tmp_path):
+    """Test watching a directory that was not generated by nagraj."""
+    result = cli_runner.invoke(watch, ["--project-dir", str(tmp_path)])
+
+    assert result.exit_code == 1
+    assert "Failed to watch project" in result.output
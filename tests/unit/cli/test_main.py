@@ -1,5 +1,7 @@
 """Unit tests for the main CLI."""
 
+import json
+
 import pytest
 from click.testing import CliRunner
 
@@ -40,4 +42,20 @@ def test_cli_unknown_command(cli_runner):
     """Test CLI with unknown command."""
     result = cli_runner.invoke(cli, ["unknown"])
     assert result.exit_code != 0
-    assert "No such command" in result.output 
\ No newline at end of file
+    assert "No such command" in result.output
+
+
+def test_cli_profile(cli_runner, tmp_path):
+    """Test that --profile prints the slowest spans and dumps the profile."""
+    output = tmp_path / "profile.speedscope.json"
+
+    result = cli_runner.invoke(
+        cli,
+        ["--profile-top", "3", "--profile-output", str(output), "cache", "--help"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Slowest 3 of nagraj cache" in result.output
+    data = json.loads(output.read_text())
+    assert data["profiles"][0]["name"] == "main"
+    assert data["shared"]["frames"][0]["name"] == "nagraj cache"
@@ -0,0 +1,57 @@
+"""Startup-time regression tests for the CLI."""
+
+import subprocess
+import sys
+import time
+
+import pytest
+
+# Maximum time the CLI may add on top of a bare interpreter start, in seconds
+STARTUP_BUDGET = 0.1
+
+HEAVY_MODULES = [
+    "cookiecutter",
+    "jinja2",
+    "loguru",
+    "pydantic",
+    "pydantic_settings",
+    "rich",
+    "yaml",
+]
+
+
+def fastest_run(*args: str, runs: int = 5) -> float:
+    """Return the fastest wall time of running the interpreter with args."""
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], check=True, capture_output=True)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@pytest.mark.parametrize("flag", ["--help", "--version"])
+def test_fast_paths_skip_heavy_imports(flag):
+    """Test that --help and --version do not import heavy dependencies."""
+    script = (
+        "import sys\n"
+        "from nagraj.cli.main import cli\n"
+        "try:\n"
+        f"    cli([{flag!r}])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "loaded = [m for m in sys.modules if m.split('.')[0] in "
+        f"{HEAVY_MODULES!r}]\n"
+        "sys.stderr.write(','.join(sorted(loaded)))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    )
+    assert result.stderr == ""
+
+
+def test_help_startup_budget():
+    """Test that `nagraj --help` stays within the startup budget."""
+    baseline = fastest_run("-c", "pass")
+    elapsed = fastest_run("-m", "nagraj", "--help")
+    assert elapsed - baseline < STARTUP_BUDGET
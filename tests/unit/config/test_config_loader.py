@@ -0,0 +1,101 @@
+"""Unit tests for cached YAML configuration loading."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from nagraj.config.loader import ParseCache, SafeLoader, dump_yaml, load_yaml
+from nagraj.config.project import ProjectConfigFile, load_project_spec
+from nagraj.config.schema import DomainType
+from nagraj.config.settings import settings
+
+SPEC = """\
+name: shop
+domains:
+  commerce:
+    type: core
+    bounded_contexts:
+      order: {}
+"""
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Fixture for an isolated cache directory."""
+    monkeypatch.setattr(settings, "cache_dir", tmp_path / "cache")
+    return tmp_path / "cache"
+
+
+@pytest.fixture
+def spec_path(tmp_path):
+    """Fixture for a spec file."""
+    path = tmp_path / "spec.yaml"
+    path.write_text(SPEC)
+    return path
+
+
+def count_parses():
+    """Patch the loader to count how often YAML is parsed."""
+    return patch("yaml.load", side_effect=yaml.load)
+
+
+def test_unchanged_file_is_not_parsed_again(cache_dir, spec_path):
+    """Test that a second load of an unchanged file skips YAML parsing."""
+    with count_parses() as mock_load:
+        first = load_project_spec(spec_path)
+        second = load_project_spec(spec_path)
+
+    assert mock_load.call_count == 1
+    assert mock_load.call_args.kwargs["Loader"] is SafeLoader
+    assert second.domains["commerce"].type == DomainType.CORE
+    assert second.domains == first.domains
+    assert len(list(cache_dir.rglob("*.yaml.pickle"))) == 1
+
+
+def test_changed_file_is_parsed_again(cache_dir, spec_path):
+    """Test that a change of modification time or size invalidates the cache."""
+    assert load_yaml(spec_path)["name"] == "shop"
+
+    spec_path.write_text(SPEC.replace("shop", "shop2"))
+    assert load_yaml(spec_path)["name"] == "shop2"
+
+    # Same size, only the modification time tells the contents apart
+    spec_path.write_text(SPEC.replace("shop", "mall"))
+    stat = spec_path.stat()
+    os.utime(spec_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_yaml(spec_path)["name"] == "mall"
+    assert len(list(cache_dir.rglob("*.yaml.pickle"))) == 1
+
+
+def test_corrupt_entry_is_ignored(tmp_path, spec_path):
+    """Test that an unreadable cache entry is replaced."""
+    cache = ParseCache(tmp_path / "cache")
+    cache.load(spec_path)
+    (entry,) = (tmp_path / "cache").iterdir()
+    entry.write_bytes(b"not a pickle")
+
+    assert cache.load(spec_path)["name"] == "shop"
+    assert entry.read_bytes() != b"not a pickle"
+
+    cache.clear()
+    assert list((tmp_path / "cache").iterdir()) == []
+
+
+def test_edited_config_file_is_parsed_from_text(cache_dir, tmp_path):
+    """Test that in-memory edits of .nagraj.yaml bypass the parse cache."""
+    (tmp_path / ".nagraj.yaml").write_text('project:\n  name: "shop"\ndomains:\n')
+    config_file = ProjectConfigFile.find(tmp_path)
+    assert config_file.to_config().domains == {}
+
+    config_file.add_domain("commerce", ["order"])
+    config = config_file.to_config()
+
+    assert list(config.domains["commerce"].bounded_contexts) == ["order"]
+    assert ProjectConfigFile.find(tmp_path).to_config().domains == {}
+
+
+def test_dump_yaml_represents_domain_type():
+    """Test that the fast dumper writes domain types as plain strings."""
+    assert dump_yaml({"type": DomainType.CORE}) == "type: core\n"
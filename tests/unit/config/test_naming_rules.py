@@ -0,0 +1,127 @@
+"""Unit tests for the naming rules and the spec linter."""
+
+import time
+
+import pytest
+
+from nagraj.config.lint import LintError, lint_spec
+from nagraj.config.project import load_project_spec
+from nagraj.config.schema import (
+    DomainConfig,
+    validate_entity_name,
+    validate_event_name,
+)
+from nagraj.config.settings import settings
+
+SPEC = """\
+domains:
+  commerce:
+    bounded_contexts:
+      orders:
+        entities: [order-item, line--item]
+        events:
+          order-created: {}
+          order_shipped: {}
+  billings: {}
+"""
+
+
+@pytest.mark.parametrize(
+    ("name", "error"),
+    [
+        ("order-item", ""),
+        ("address", ""),
+        ("", "Entity name cannot be empty"),
+        ("order item", "Entity name can only contain letters"),
+        ("order__item", "Entity name cannot contain consecutive"),
+        ("-order", "Entity name cannot start or end"),
+        ("order-items", "Entity name parts should be singular"),
+    ],
+)
+def test_validate_entity_name(name, error):
+    """Test the messages of the entity name rules."""
+    is_valid, message = validate_entity_name(name)
+
+    assert is_valid == (not error)
+    assert message.startswith(error)
+
+
+@pytest.mark.parametrize(
+    ("name", "error"),
+    [
+        ("order-created", ""),
+        ("mail-sent", ""),
+        ("order created", "Event name cannot contain spaces"),
+        ("order--created", "Event name cannot contain consecutive dashes"),
+        ("order-created-", "Event name cannot start or end with a dash"),
+        ("order_created", "Event name can only contain letters"),
+        ("order-create", "Event name must be in past tense"),
+    ],
+)
+def test_validate_event_name(name, error):
+    """Test the messages of the event name rules."""
+    is_valid, message = validate_event_name(name)
+
+    assert is_valid == (not error)
+    assert message.startswith(error)
+
+
+def test_invalid_domain_config():
+    """Test that an invalid domain name is still rejected on construction."""
+    with pytest.raises(ValueError, match="Domain name parts should be singular"):
+        DomainConfig(name="orders")
+
+
+def test_lint_spec_reports_every_violation(tmp_path, monkeypatch):
+    """Test that all violations of a spec are reported with their location."""
+    monkeypatch.setattr(settings, "cache_dir", tmp_path / "cache")
+    path = tmp_path / "system.yaml"
+    path.write_text(SPEC)
+
+    with pytest.raises(LintError) as exc_info:
+        load_project_spec(path)
+
+    assert [str(violation) for violation in exc_info.value.violations] == [
+        "domains.commerce.bounded_contexts.orders: "
+        "Context name parts should be singular",
+        "domains.commerce.bounded_contexts.orders.entities[1]: "
+        "Entity name cannot contain consecutive dashes or underscores",
+        "domains.commerce.bounded_contexts.orders.events.order_shipped: "
+        "Event name can only contain letters, numbers, and dashes",
+        "domains.billings: Domain name parts should be singular",
+    ]
+    assert "Found 4 naming violation(s)" in str(exc_info.value)
+
+
+def test_lint_spec_kinds():
+    """Test limiting the linter to some kinds of names."""
+    data = {"domains": {"orders": {"bounded_contexts": {"items": {}}}}}
+
+    violations = lint_spec(data, kinds=("context",))
+
+    assert [violation.name for violation in violations] == ["items"]
+
+
+def test_lint_large_spec():
+    """Test that a spec of 5,000 names is checked in well under a second."""
+    data = {
+        "domains": {
+            f"domain{index}": {
+                "bounded_contexts": {
+                    f"context{index}": {
+                        "entities": ["order-item", "customer"],
+                        "events": ["order-created", "mail-send"],
+                    }
+                }
+            }
+            for index in range(1000)
+        }
+    }
+
+    start = time.perf_counter()
+    violations = lint_spec(data)
+    elapsed = time.perf_counter() - start
+
+    assert len(violations) == 1000
+    assert {violation.kind for violation in violations} == {"event"}
+    assert elapsed < 0.5
@@ -0,0 +1,132 @@
+"""Unit tests for in-place editing of .nagraj.yaml."""
+
+from datetime import UTC, datetime
+
+import pytest
+import yaml
+
+from nagraj.config.project import ProjectConfigFile
+
+CONFIG = """\
+# Project Configuration
+version: "1.0"
+created_at: "2025-01-01 00:00:00 UTC"
+updated_at: "2025-01-01 00:00:00 UTC"
+
+project:
+  name: "shop"
+
+# Domain Configuration
+domains:
+  commerce:
+    bounded_contexts:
+      order:
+        aggregates: []
+    interfaces:
+      rest_api:
+        type: "fastapi"
+
+# Testing Configuration
+testing:
+  unit_tests:
+    tool: "pytest"
+"""
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    """Fixture for a .nagraj.yaml in a temporary project."""
+    (tmp_path / ".nagraj.yaml").write_text(CONFIG)
+    return ProjectConfigFile.find(tmp_path)
+
+
+def test_find_missing(tmp_path):
+    """Test that a project without .nagraj.yaml is rejected."""
+    with pytest.raises(FileNotFoundError):
+        ProjectConfigFile.find(tmp_path)
+
+
+def test_to_config(config_file):
+    """Test building a project configuration from the file."""
+    config = config_file.to_config()
+
+    assert config.name == "shop"
+    assert list(config.domains) == ["commerce"]
+    assert list(config.domains["commerce"].bounded_contexts) == ["order"]
+    assert config.updated_at == datetime(2025, 1, 1, tzinfo=UTC)
+
+
+def test_add_bounded_context_keeps_layout(config_file):
+    """Test that a context is appended without touching the rest of the file."""
+    config_file.add_bounded_context("commerce", "billing")
+
+    data = yaml.safe_load(config_file.text)
+    assert list(data["domains"]["commerce"]["bounded_contexts"]) == ["order", "billing"]
+    assert data["domains"]["commerce"]["bounded_contexts"]["billing"]["services"] == []
+    assert data["domains"]["commerce"]["interfaces"]["rest_api"]["type"] == "fastapi"
+    assert data["testing"]["unit_tests"]["tool"] == "pytest"
+    assert (
+        config_file.text.replace(
+            "      billing:\n"
+            "        aggregates: []\n"
+            "        entities: []\n"
+            "        value_objects: []\n"
+            "        repositories: []\n"
+            "        services: []\n",
+            "",
+        )
+        == CONFIG
+    )
+
+
+def test_add_domain_then_contexts(config_file):
+    """Test that an empty domain's bounded contexts can be filled in."""
+    config_file.add_domain("shipping")
+    config_file.add_bounded_context("shipping", "tracking")
+    config_file.add_bounded_context("shipping", "routing")
+
+    data = yaml.safe_load(config_file.text)
+    assert list(data["domains"]) == ["commerce", "shipping"]
+    assert list(data["domains"]["shipping"]["bounded_contexts"]) == [
+        "tracking",
+        "routing",
+    ]
+    assert "# Testing Configuration" in config_file.text
+
+
+def test_add_domain_without_domains_key(tmp_path):
+    """Test adding the first domain to a file without a domains section."""
+    (tmp_path / ".nagraj.yaml").write_text('version: "1.0"\ndomains:\n')
+    config_file = ProjectConfigFile.find(tmp_path)
+
+    config_file.add_domain("commerce")
+
+    assert yaml.safe_load(config_file.text)["domains"] == {
+        "commerce": {"bounded_contexts": {}}
+    }
+
+
+def test_add_bounded_context_unknown_domain(config_file):
+    """Test that adding a context to an unknown domain fails."""
+    with pytest.raises(ValueError, match="does not exist"):
+        config_file.add_bounded_context("shipping", "tracking")
+
+
+def test_set_updated_at_and_save(config_file):
+    """Test that the timestamp is replaced and the file written back."""
+    config_file.set_updated_at(datetime(2026, 2, 3, 4, 5, 6, tzinfo=UTC))
+    config_file.save()
+
+    text = config_file.path.read_text()
+    assert 'updated_at: "2026-02-03 04:05:06 UTC"' in text
+    assert 'created_at: "2025-01-01 00:00:00 UTC"' in text
+
+
+def test_add_domain_with_contexts(config_file):
+    """Test adding a domain together with its bounded contexts."""
+    config_file.add_domain("shipping", ["tracking", "routing"])
+
+    data = yaml.safe_load(config_file.text)
+    contexts = data["domains"]["shipping"]["bounded_contexts"]
+    assert list(contexts) == ["tracking", "routing"]
+    assert contexts["routing"]["aggregates"] == []
@@ -0,0 +1,157 @@
+"""Unit tests for rendering projects into archives."""
+
+import io
+import os
+import stat
+import tarfile
+import zipfile
+
+import pytest
+
+from nagraj.config.settings import settings
+from nagraj.core.archive import (
+    ArchiveMember,
+    archive_format_for,
+    write_archive,
+)
+from nagraj.core.manifest import MANIFEST_FILE, ProjectManifest
+from nagraj.core.template import TemplateEngine
+
+TEMPLATE_NAME = "nagraj-full-project-template"
+
+CONTEXT = {
+    "project_name": "test_project",
+    "author_name": "Test Author",
+    "author_email": "test@example.com",
+}
+
+MEMBERS = [
+    ArchiveMember("app/", None, 0o755),
+    ArchiveMember("app/run.sh", b"#!/bin/sh\n", 0o755),
+    ArchiveMember("app/README.md", b"hello\n", 0o644),
+]
+
+
+class UnseekableStream(io.RawIOBase):
+    """Write-only stream that behaves like a pipe."""
+
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.buffer.extend(data)
+        return len(data)
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    """Fixture for a template engine with an isolated template cache."""
+    monkeypatch.setattr(settings, "cache_dir", tmp_path / "cache")
+    return TemplateEngine()
+
+
+@pytest.mark.parametrize(
+    "filename, expected",
+    [("app.zip", "zip"), ("app.tar.gz", "tar.gz"), ("app.tgz", "tar.gz")],
+)
+def test_archive_format_for(filename, expected):
+    """Test that archive formats are inferred from file names."""
+    assert archive_format_for(filename) == expected
+
+
+def test_archive_format_for_unknown():
+    """Test that unknown suffixes are rejected."""
+    with pytest.raises(ValueError, match="Cannot infer archive format"):
+        archive_format_for("app.rar")
+
+
+def test_write_zip_to_unseekable_stream():
+    """Test that zips can be streamed to a pipe and keep file modes."""
+    stream = UnseekableStream()
+
+    write_archive(stream, "zip", MEMBERS)
+
+    with zipfile.ZipFile(io.BytesIO(bytes(stream.buffer))) as archive:
+        assert archive.namelist() == ["app/", "app/run.sh", "app/README.md"]
+        assert archive.read("app/run.sh") == b"#!/bin/sh\n"
+        mode = archive.getinfo("app/run.sh").external_attr >> 16
+        assert stat.S_IMODE(mode) == 0o755
+
+
+def test_write_tar_to_unseekable_stream():
+    """Test that tar.gz archives can be streamed to a pipe."""
+    stream = UnseekableStream()
+
+    write_archive(stream, "tar.gz", MEMBERS, mtime=0)
+
+    with tarfile.open(fileobj=io.BytesIO(bytes(stream.buffer))) as archive:
+        assert archive.getnames() == ["app", "app/run.sh", "app/README.md"]
+        assert archive.getmember("app").isdir()
+        assert archive.getmember("app/run.sh").mode == 0o755
+        assert archive.extractfile("app/README.md").read() == b"hello\n"
+
+
+def test_write_archive_unsupported_format():
+    """Test that unsupported formats are rejected."""
+    with pytest.raises(ValueError, match="Unsupported archive format"):
+        write_archive(io.BytesIO(), "rar", MEMBERS)
+
+
+@pytest.mark.parametrize("archive_format", ["zip", "tar.gz"])
+def test_generate_archive_matches_generate_project(engine, tmp_path, archive_format):
+    """Test that an archive holds exactly what generate_project writes."""
+    project_dir = engine.generate_project(TEMPLATE_NAME, tmp_path / "disk", CONTEXT)
+    output = io.BytesIO()
+
+    plan = engine.generate_archive(TEMPLATE_NAME, output, CONTEXT, archive_format)
+
+    output.seek(0)
+    if archive_format == "zip":
+        with zipfile.ZipFile(output) as archive:
+            archive.extractall(tmp_path / "archive")
+            for info in archive.infolist():
+                if not info.is_dir():
+                    path = tmp_path / "archive" / info.filename
+                    os.chmod(path, info.external_attr >> 16)
+    else:
+        with tarfile.open(fileobj=output) as archive:
+            archive.extractall(tmp_path / "archive", filter="fully_trusted")
+
+    extracted = tmp_path / "archive" / plan.name
+    disk_files = {
+        p.relative_to(project_dir): p for p in project_dir.rglob("*") if p.is_file()
+    }
+    archive_files = {
+        p.relative_to(extracted): p for p in extracted.rglob("*") if p.is_file()
+    }
+    assert archive_files.keys() == disk_files.keys()
+    for path, disk_path in disk_files.items():
+        if path.name in (".nagraj.yaml", MANIFEST_FILE):
+            continue  # Timestamps differ between renders
+        assert archive_files[path].read_bytes() == disk_path.read_bytes(), path
+        assert archive_files[path].stat().st_mode == disk_path.stat().st_mode, path
+
+    manifest = ProjectManifest.load(extracted)
+    assert manifest.template == TEMPLATE_NAME
+    assert "pyproject.toml" in manifest.files
+
+
+def test_generate_archive_writes_nothing_to_disk(engine, tmp_path, monkeypatch):
+    """Test that archive generation does not create the project directory."""
+    monkeypatch.chdir(tmp_path)
+
+    engine.generate_archive(TEMPLATE_NAME, io.BytesIO(), CONTEXT)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["cache"]
+
+
+def test_generate_archive_rejects_format_before_rendering(engine):
+    """Test that an unsupported format fails before any output is written."""
+    output = io.BytesIO()
+
+    with pytest.raises(ValueError, match="Unsupported archive format"):
+        engine.generate_archive(TEMPLATE_NAME, output, CONTEXT, "rar")
+    assert output.getvalue() == b""
@@ -0,0 +1,79 @@
+"""Unit tests for the generation benchmarks."""
+
+import json
+
+import pytest
+
+from nagraj.core.benchmark import (
+    REPORT_FORMAT,
+    build_synthetic_project,
+    compare_reports,
+    run_benchmarks,
+)
+
+
+def report(**medians):
+    """Build a report holding the given metric medians."""
+    return {
+        "format": REPORT_FORMAT,
+        "metrics": {name: {"median": median} for name, median in medians.items()},
+    }
+
+
+def test_synthetic_project_is_valid(tmp_path):
+    """Test that the synthetic project passes structure validation."""
+    config = build_synthetic_project(tmp_path / "project", 25)
+
+    assert len(config.domains) == 3
+    assert sum(len(d.bounded_contexts) for d in config.domains.values()) == 25
+    assert config.validate_structure(str(tmp_path / "project")) == []
+
+
+def test_run_benchmarks_selected_metrics():
+    """Test that a run only times the selected metrics."""
+    names = []
+
+    result = run_benchmarks(
+        rounds=2, sizes=(10,), select=["validate_structure"], progress=names.append
+    )
+
+    assert names == ["validate_structure.10"]
+    metric = result["metrics"]["validate_structure.10"]
+    assert metric["rounds"] == 2
+    assert 0 < metric["min"] <= metric["median"] <= metric["max"]
+    assert json.loads(json.dumps(result)) == result
+
+
+def test_run_benchmarks_render_and_yaml():
+    """Test the in-process rendering and YAML metrics."""
+    result = run_benchmarks(rounds=1, sizes=(), select=["render_template", "config"])
+
+    assert set(result["metrics"]) == {
+        "render_template.nagraj-full-project-template",
+        "render_template.nagraj-domain-template",
+        "render_template.nagraj-bounded-context-template",
+        "config.yaml_round_trip",
+    }
+
+
+def test_compare_reports_flags_regressions():
+    """Test that only slowdowns past the threshold regress."""
+    comparisons = compare_reports(
+        report(fast=1.0, slow=1.0, gone=1.0),
+        report(fast=0.5, slow=1.5, new=1.0),
+        threshold=0.25,
+    )
+
+    by_name = {comparison.name: comparison for comparison in comparisons}
+    assert [c.name for c in comparisons] == ["fast", "gone", "new", "slow"]
+    assert by_name["fast"].change == pytest.approx(-0.5)
+    assert not by_name["fast"].regressed
+    assert by_name["slow"].regressed
+    assert by_name["gone"].change is None and not by_name["gone"].regressed
+    assert by_name["new"].baseline is None and not by_name["new"].regressed
+
+
+def test_compare_reports_rejects_unknown_format():
+    """Test that reports of another format are rejected."""
+    with pytest.raises(ValueError, match="Unsupported benchmark report format"):
+        compare_reports({"format": 0, "metrics": {}}, report())
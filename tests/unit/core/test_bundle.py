@@ -0,0 +1,220 @@
+"""Unit tests for the packed template bundle."""
+
+import os
+import stat
+import subprocess
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+from jinja2 import Environment
+
+import nagraj
+from nagraj.config.settings import settings
+from nagraj.core import bundle as bundle_module
+from nagraj.core.bundle import (
+    BUNDLE_FILE,
+    IGNORED_DIRS,
+    TemplateBundle,
+    load_bundle,
+    pack_templates,
+)
+from nagraj.core.manifest import MANIFEST_FILE
+from nagraj.core.template import TemplateEngine
+
+TEMPLATE_NAME = "nagraj-full-project-template"
+
+CONTEXT = {
+    "project_name": "test_project",
+    "author_name": "Test Author",
+    "author_email": "test@example.com",
+}
+
+
+@pytest.fixture(scope="module")
+def bundle_path(tmp_path_factory):
+    """Fixture packing the shipped templates once per module."""
+    output = tmp_path_factory.mktemp("bundle") / BUNDLE_FILE
+    return pack_templates(settings.template_path, output)
+
+
+@pytest.fixture
+def bundle(bundle_path):
+    """Fixture for the packed template bundle."""
+    return TemplateBundle.from_path(bundle_path)
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Fixture isolating the persistent template cache."""
+    monkeypatch.setattr(settings, "cache_dir", tmp_path / "cache")
+    return tmp_path / "cache"
+
+
+def test_bundle_lists_templates(bundle):
+    """Test that every template directory is packed."""
+    expected = sorted(
+        p.name
+        for p in settings.template_path.iterdir()
+        if p.is_dir() and p.name not in IGNORED_DIRS
+    )
+    assert bundle.templates == expected
+    assert b'"project_name"' in bundle.read(f"{TEMPLATE_NAME}/cookiecutter.json")
+
+    with pytest.raises(FileNotFoundError):
+        bundle.read(f"{TEMPLATE_NAME}/missing.txt")
+
+
+def test_bundle_skips_ignored_directories(tmp_path):
+    """Test that byte-compiled caches are not packed."""
+    template = tmp_path / "templates" / "demo"
+    (template / "{{cookiecutter.name}}" / "__pycache__").mkdir(parents=True)
+    (template / "cookiecutter.json").write_text('{"name": "demo"}')
+    (template / "{{cookiecutter.name}}" / "app.py").write_text("x = 1\n")
+    (template / "{{cookiecutter.name}}" / "__pycache__" / "app.pyc").write_bytes(b"")
+
+    bundle = TemplateBundle.from_path(
+        pack_templates(tmp_path / "templates", tmp_path / BUNDLE_FILE)
+    )
+
+    assert bundle.list_dir("demo/{{cookiecutter.name}}") == [("app.py", False)]
+
+
+def test_load_bundle_ignores_stale_bundle(tmp_path, monkeypatch):
+    """Test that a bundle not matching the template directory is not used."""
+    package = tmp_path / "nagraj"
+    template = package / "templates" / "demo"
+    (template / "{{cookiecutter.name}}").mkdir(parents=True)
+    (template / "cookiecutter.json").write_text('{"name": "demo"}')
+    app = template / "{{cookiecutter.name}}" / "app.py"
+    app.write_text("x = 1\n")
+    pack_templates(package / "templates", package / BUNDLE_FILE)
+    monkeypatch.setattr(bundle_module.resources, "files", lambda name: package)
+    load_bundle.cache_clear()
+    try:
+        assert load_bundle() is not None
+
+        app.write_text("x = 2\n")
+        load_bundle.cache_clear()
+        assert load_bundle() is None
+
+        pack_templates(package / "templates", package / BUNDLE_FILE)
+        monkeypatch.setattr(bundle_module, "__version__", "0.0.0")
+        load_bundle.cache_clear()
+        assert load_bundle() is None
+    finally:
+        load_bundle.cache_clear()
+
+
+def test_load_bundle_without_template_directory(bundle_path, tmp_path, monkeypatch):
+    """Test that an installed bundle is used without comparing digests."""
+    package = tmp_path / "nagraj"
+    package.mkdir()
+    (package / BUNDLE_FILE).write_bytes(bundle_path.read_bytes())
+    monkeypatch.setattr(bundle_module.resources, "files", lambda name: package)
+
+    def fail(self, template_path):
+        raise AssertionError("digests compared without a template directory")
+
+    monkeypatch.setattr(TemplateBundle, "is_current", fail)
+    load_bundle.cache_clear()
+    try:
+        assert load_bundle() is not None
+    finally:
+        load_bundle.cache_clear()
+
+
+def test_generate_project_from_bundle_matches_directory(bundle, tmp_path):
+    """Test that the bundle renders the same files as the template directory."""
+    packed = TemplateEngine(bundle=bundle).generate_project(
+        TEMPLATE_NAME, tmp_path / "packed", CONTEXT
+    )
+    native = TemplateEngine().generate_project(
+        TEMPLATE_NAME, tmp_path / "native", CONTEXT
+    )
+
+    def files(root):
+        return sorted(
+            p.relative_to(root)
+            for p in root.rglob("*")
+            if p.is_file() and not IGNORED_DIRS & set(p.parts)
+        )
+
+    assert files(packed) == files(native)
+    for relative in files(native):
+        mode = stat.S_IMODE(os.stat(native / relative).st_mode)
+        assert stat.S_IMODE(os.stat(packed / relative).st_mode) == mode, relative
+        if relative.name in (".nagraj.yaml", MANIFEST_FILE):
+            # Contain generation timestamps
+            continue
+        assert (packed / relative).read_bytes() == (
+            native / relative
+        ).read_bytes(), relative
+
+
+def test_generate_project_uses_precompiled_bytecode(
+    bundle, tmp_path, cache_dir, monkeypatch
+):
+    """Test that packed templates are rendered without compiling them."""
+    engine = TemplateEngine(bundle=bundle)
+    compiled = []
+    compile_template = Environment.compile
+
+    def record_compile(env, source, name=None, *args, **kwargs):
+        compiled.append(name)
+        return compile_template(env, source, name, *args, **kwargs)
+
+    monkeypatch.setattr(Environment, "compile", record_compile)
+
+    engine.generate_project(TEMPLATE_NAME, tmp_path, CONTEXT)
+
+    # Only rendered file and directory names are compiled
+    assert all(name is None for name in compiled)
+    assert not cache_dir.exists()
+
+
+def test_engine_without_bundle_uses_template_directory(monkeypatch):
+    """Test that an explicit template path takes precedence over the bundle."""
+    monkeypatch.setattr(settings, "template_path", settings.template_path)
+
+    engine = TemplateEngine()
+
+    assert engine.bundle is None
+    assert engine.has_template(TEMPLATE_NAME)
+    assert not engine.has_template("missing-template")
+
+
+def test_bundle_loads_from_zip_import(bundle_path, tmp_path):
+    """Test rendering from a zipped nagraj package without template files."""
+    package_dir = Path(nagraj.__file__).parent
+    zipped = tmp_path / "nagraj.zip"
+    with zipfile.ZipFile(zipped, "w") as archive:
+        for path in package_dir.rglob("*.py"):
+            relative = path.relative_to(package_dir.parent)
+            if "templates" not in relative.parts:
+                archive.write(path, relative.as_posix())
+        archive.write(bundle_path, f"nagraj/{BUNDLE_FILE}")
+
+    script = (
+        "import io, zipfile\n"
+        "from nagraj.core.template import TemplateEngine\n"
+        "engine = TemplateEngine(use_cache=False)\n"
+        "assert engine.bundle is not None\n"
+        "output = io.BytesIO()\n"
+        f"engine.generate_archive({TEMPLATE_NAME!r}, output, {CONTEXT!r})\n"
+        "names = zipfile.ZipFile(output).namelist()\n"
+        "assert 'test_project/pyproject.toml' in names, names\n"
+        "print(len(names))\n"
+    )
+    env = dict(os.environ, PYTHONPATH=str(zipped), HOME=str(tmp_path))
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        cwd=tmp_path,
+        env=env,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert int(result.stdout) > 10
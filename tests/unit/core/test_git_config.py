@@ -0,0 +1,160 @@
+"""Unit tests for the git config reader."""
+
+import pytest
+
+from nagraj.core.git_config import (
+    GitConfigError,
+    normalize_key,
+    parse_git_config,
+    read_global_git_config,
+)
+
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    """Fixture for an isolated home directory."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.delenv("XDG_CONFIG_HOME", raising=False)
+    monkeypatch.delenv("GIT_CONFIG_GLOBAL", raising=False)
+    read_global_git_config.cache_clear()
+    yield tmp_path
+    read_global_git_config.cache_clear()
+
+
+def write(path, content):
+    """Write a config file, creating parent directories."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    return path
+
+
+def test_parse_basic_values(tmp_path):
+    """Test parsing sections, subsections and values."""
+    config = write(
+        tmp_path / "config",
+        "# comment\n"
+        "[user]\n"
+        "\tname = John Doe\n"
+        "\temail = john@example.com ; trailing comment\n"
+        '[remote "Origin"]\n'
+        "\turl = git@example.com:repo.git\n"
+        "[core]\n"
+        "\tbare\n",
+    )
+
+    values = parse_git_config(config)
+
+    assert values == {
+        "user.name": "John Doe",
+        "user.email": "john@example.com",
+        "remote.Origin.url": "git@example.com:repo.git",
+        "core.bare": "true",
+    }
+
+
+def test_parse_quoting_escapes_and_continuations(tmp_path):
+    """Test quoted values, escape sequences and line continuations."""
+    config = write(
+        tmp_path / "config",
+        "[User]\n"
+        '\tName = "  Jane # Doe  "\n'
+        '\talias = say \\"hi\\"\\tnow\n'
+        "\tbio = first \\\n"
+        "second\n",
+    )
+
+    values = parse_git_config(config)
+
+    assert values["user.name"] == "  Jane # Doe  "
+    assert values["user.alias"] == 'say "hi"\tnow'
+    assert values["user.bio"] == "first second"
+
+
+def test_parse_include_relative_path(tmp_path):
+    """Test that include paths are resolved relative to the including file."""
+    write(tmp_path / "extra" / "identity", "[user]\n\temail = work@example.com\n")
+    config = write(
+        tmp_path / "config",
+        "[user]\n"
+        "\temail = home@example.com\n"
+        "[include]\n"
+        "\tpath = extra/identity\n",
+    )
+
+    assert parse_git_config(config)["user.email"] == "work@example.com"
+
+
+def test_parse_include_if_is_ignored(tmp_path):
+    """Test that conditional includes are not applied."""
+    write(tmp_path / "work", "[user]\n\temail = work@example.com\n")
+    config = write(
+        tmp_path / "config",
+        "[user]\n"
+        "\temail = home@example.com\n"
+        '[includeIf "gitdir:~/work/"]\n'
+        f"\tpath = {tmp_path / 'work'}\n",
+    )
+
+    assert parse_git_config(config) == {"user.email": "home@example.com"}
+
+
+def test_parse_include_cycle(tmp_path):
+    """Test that include cycles are rejected."""
+    config = write(tmp_path / "config", "[include]\n\tpath = config\n")
+
+    with pytest.raises(GitConfigError, match="include depth"):
+        parse_git_config(config)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "name = value\n",
+        "[user\n",
+        "[user]\n\t1name = value\n",
+        '[user]\n\tname = "unterminated\n',
+        "[user]\n\tname = bad \\q escape\n",
+    ],
+)
+def test_parse_invalid_syntax(tmp_path, content):
+    """Test that invalid syntax raises GitConfigError."""
+    config = write(tmp_path / "config", content)
+
+    with pytest.raises(GitConfigError):
+        parse_git_config(config)
+
+
+def test_read_global_precedence(home):
+    """Test that ~/.gitconfig overrides the XDG config file."""
+    write(
+        home / ".config" / "git" / "config",
+        "[user]\n\tname = XDG User\n\temail = xdg@example.com\n",
+    )
+    write(home / ".gitconfig", "[user]\n\tname = Home User\n")
+
+    values = read_global_git_config()
+
+    assert values["user.name"] == "Home User"
+    assert values["user.email"] == "xdg@example.com"
+
+
+def test_read_global_config_override(home, monkeypatch):
+    """Test that GIT_CONFIG_GLOBAL replaces the default files."""
+    write(home / ".gitconfig", "[user]\n\tname = Home User\n")
+    override = write(home / "custom", "[user]\n\tname = Custom User\n")
+    monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(override))
+
+    assert read_global_git_config() == {"user.name": "Custom User"}
+
+
+def test_read_global_missing_files(home):
+    """Test that missing config files yield no values."""
+    assert read_global_git_config() == {}
+
+
+def test_normalize_key():
+    """Test key normalization."""
+    assert normalize_key("User.Name") == "user.name"
+    assert normalize_key("Remote.Origin.URL") == "remote.Origin.url"
+    with pytest.raises(GitConfigError):
+        normalize_key("user")
@@ -0,0 +1,135 @@
+"""Unit tests for generating mappers between aggregates and ORM models."""
+
+import pytest
+
+from nagraj.config.settings import settings
+from nagraj.core.mappers import MAPPERS_INIT, generate_mappers
+from nagraj.core.template import TemplateEngine
+
+TEMPLATE_NAME = "nagraj-full-project-template"
+
+CONTEXT = {
+    "project_name": "test_project",
+    "author_name": "Test Author",
+    "author_email": "test@example.com",
+}
+
+AUTH_DIR = "test_project/common/bounded_contexts/auth"
+USER_MAPPER = f"{AUTH_DIR}/infrastructure/mappers/user_mapper.py"
+CONTEXT_DIR = "test_project/example_domain_one/bounded_contexts/example_context_one"
+
+ORDER_AGGREGATE = """\
+from test_project.common.base.aggregate import BaseAggregate
+
+from ..value_objects.money import Money
+
+
+class OrderAggregate(BaseAggregate):
+    total: Money
+    discount: Money | None = None
+    note: str = ""
+"""
+
+ORDER_ORM = """\
+from typing import Optional
+
+from test_project.common.base import BaseORM
+
+
+class OrderORM(BaseORM, table=True):
+    total_cents: int
+    discount_cents: Optional[int] = None
+"""
+
+MONEY = """\
+class Money:
+    def __init__(self, cents: int) -> None:
+        self._cents = cents
+
+    @classmethod
+    def from_cents(cls, cents: int) -> "Money":
+        return cls(cents)
+
+    @property
+    def cents(self) -> int:
+        return self._cents
+"""
+
+
+@pytest.fixture
+def project_dir(tmp_path, monkeypatch):
+    """Fixture for a freshly generated project."""
+    monkeypatch.setattr(settings, "cache_dir", tmp_path / "cache")
+    engine = TemplateEngine()
+    return engine.generate_project(TEMPLATE_NAME, tmp_path / "out", CONTEXT)
+
+
+def add_order(project_dir, aggregate=ORDER_AGGREGATE, orm=ORDER_ORM):
+    """Add an order aggregate with an ORM model to a bounded context."""
+    context_dir = project_dir / CONTEXT_DIR
+    (context_dir / "domain" / "value_objects").mkdir(exist_ok=True)
+    (context_dir / "domain" / "value_objects" / "money.py").write_text(MONEY)
+    (context_dir / "domain" / "aggregates" / "order.py").write_text(aggregate)
+    (context_dir / "infrastructure" / "orms" / "order_orm.py").write_text(orm)
+
+
+def test_template_mappers_are_up_to_date(project_dir):
+    """Test that the mappers shipped with the template match the generator."""
+    mappers = generate_mappers(project_dir, check=True)
+
+    assert [(m.path.as_posix(), m.changed) for m in mappers] == [(USER_MAPPER, False)]
+
+
+def test_user_mapper_copies_every_field(project_dir):
+    """Test that the user mapper converts value objects and keeps last_login."""
+    source = (project_dir / USER_MAPPER).read_text()
+
+    assert "email=aggregate.email.value," in source
+    assert "password_hash=aggregate.password.hashed_value," in source
+    assert "email=Email(value=orm.email)," in source
+    assert "password=Password.from_hash(orm.password_hash)," in source
+    assert "last_login=orm.last_login," in source
+    assert "aggregate._version = orm.version" in source
+
+
+def test_generate_mapper_for_new_aggregate(project_dir):
+    """Test generating a mapper with optional value objects and defaults."""
+    add_order(project_dir)
+
+    mappers = generate_mappers(project_dir)
+
+    order = next(m for m in mappers if m.aggregate == "OrderAggregate")
+    assert order.changed
+    mappers_dir = project_dir / CONTEXT_DIR / "infrastructure" / "mappers"
+    assert (mappers_dir / "__init__.py").read_text() == MAPPERS_INIT
+    source = (mappers_dir / "order_mapper.py").read_text()
+    assert "from ...domain.aggregates.order import OrderAggregate\n" in source
+    assert "from ...domain.value_objects.money import Money\n" in source
+    assert "from ..orms.order_orm import OrderORM\n" in source
+    assert "total_cents=aggregate.total.cents," in source
+    assert (
+        "discount_cents=None if aggregate.discount is None "
+        "else aggregate.discount.cents," in source
+    )
+    assert "total=Money.from_cents(orm.total_cents)," in source
+    assert "note=" not in source
+    compile(source, "order_mapper.py", "exec")
+
+    # Up to date mappers are not rewritten
+    assert not any(m.changed for m in generate_mappers(project_dir))
+
+
+def test_generate_mapper_missing_column(project_dir):
+    """Test that a required field without a column is rejected."""
+    add_order(project_dir, aggregate=ORDER_AGGREGATE + "    placed_by: str\n")
+
+    with pytest.raises(ValueError, match="Field placed_by of OrderAggregate"):
+        generate_mappers(project_dir)
+
+
+def test_generate_mapper_unstorable_value_object(project_dir):
+    """Test that a value object without a conversion for its column is rejected."""
+    add_order(project_dir, orm=ORDER_ORM.replace("total_cents: int", "total_x: str"))
+
+    with pytest.raises(ValueError, match="Cannot store Money in column"):
+        generate_mappers(project_dir)
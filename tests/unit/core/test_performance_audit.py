@@ -0,0 +1,175 @@
+"""Unit tests for the static performance audit."""
+
+from unittest.mock import patch
+
+import pytest
+
+from nagraj.config.settings import settings
+from nagraj.core import doctor
+from nagraj.core.doctor import analyze_source, diagnose_project
+from nagraj.core.template import TemplateEngine
+
+HASHER = """\
+from argon2 import PasswordHasher
+
+
+class Password:
+    _ph = PasswordHasher()
+
+    def __init__(self, value):
+        self.hashed = self._ph.hash(value)
+
+
+def make_user(value):
+    return Password(value)
+"""
+
+HANDLERS = """\
+import asyncio
+from pathlib import Path
+
+
+async def handle(path: Path, value):
+    with open(path) as f:
+        f.read()
+    text = path.read_text()
+    user = make_user(value)
+    user = await asyncio.to_thread(make_user, value)
+    await store.save(user)
+"""
+
+DEPENDENCIES = """\
+from functools import lru_cache
+
+from fastapi import Depends, HTTPException
+
+
+def get_service():
+    return Service(Repository())
+
+
+@lru_cache
+def get_cached_service():
+    return Service(Repository())
+
+
+def get_settings():
+    raise HTTPException(status_code=500)
+
+
+def route(
+    service=Depends(get_service),
+    cached=Depends(get_cached_service),
+    settings=Depends(get_settings),
+):
+    pass
+"""
+
+REPOSITORY = """\
+async def save(session, row):
+    existing = (await session.exec(select(Row).where(Row.id == row.id))).first()
+    session.add(existing or row)
+    await session.commit()
+"""
+
+
+@pytest.fixture
+def project_dir(tmp_path, monkeypatch):
+    """Fixture for a project of a few modules with an isolated cache."""
+    monkeypatch.setattr(settings, "cache_dir", tmp_path / "cache")
+    project_dir = tmp_path / "project"
+    package = project_dir / "app"
+    package.mkdir(parents=True)
+    (package / "password.py").write_text(HASHER)
+    (package / "handlers.py").write_text(HANDLERS)
+    (package / "dependencies.py").write_text(DEPENDENCIES)
+    (package / "repository.py").write_text(REPOSITORY)
+    (package / "tests").mkdir()
+    (package / "tests" / "test_handlers.py").write_text(HANDLERS)
+    return project_dir
+
+
+def rules(report):
+    """Return the path, line and rule of every finding."""
+    return [(f.path, f.line, f.rule) for f in report.findings]
+
+
+def test_diagnose_project(project_dir):
+    """Test that every pattern is found across modules, and nothing else."""
+    report = diagnose_project(project_dir)
+
+    assert report.files == 4
+    assert rules(report) == [
+        ("app/dependencies.py", 6, "per-request-dependency"),
+        ("app/handlers.py", 6, "blocking-io-in-async"),
+        ("app/handlers.py", 8, "blocking-io-in-async"),
+        ("app/handlers.py", 9, "cpu-bound-in-async"),
+        ("app/repository.py", 2, "select-before-write"),
+    ]
+    assert [f.severity for f in report.errors] == ["error"] * 3
+    assert str(report.findings[0]) == (
+        "app/dependencies.py:6:1: Dependency get_service constructs Service, "
+        "Repository on every request; construct once, e.g. with "
+        "functools.lru_cache or at startup"
+    )
+
+
+def test_diagnose_project_uses_cache(project_dir):
+    """Test that unchanged files are not parsed again."""
+    first = diagnose_project(project_dir)
+    (project_dir / "app" / "repository.py").write_text("async def save():\n    pass\n")
+
+    with patch.object(doctor, "analyze_source", wraps=analyze_source) as analyze:
+        report = diagnose_project(project_dir)
+
+    assert report.cached == 3
+    assert [call.args[1] for call in analyze.call_args_list] == ["app/repository.py"]
+    assert rules(report) == rules(first)[:-1]
+
+
+def test_diagnose_project_in_parallel(project_dir, monkeypatch):
+    """Test that analyzing in worker processes gives the same findings."""
+    expected = rules(diagnose_project(project_dir, use_cache=False))
+    monkeypatch.setattr(doctor, "PARALLEL_THRESHOLD", 1)
+
+    report = diagnose_project(project_dir, max_workers=2, use_cache=False)
+
+    assert report.cached == 0
+    assert rules(report) == expected
+
+
+def test_syntax_error_is_reported():
+    """Test that a file that cannot be parsed is reported."""
+    facts = analyze_source(b"def broken(:\n", "broken.py")
+
+    assert [(f.line, f.rule) for f in facts.findings] == [(1, "syntax-error")]
+
+
+def test_missing_project_dir(tmp_path):
+    """Test auditing a directory that does not exist."""
+    with pytest.raises(FileNotFoundError, match="Project directory not found"):
+        diagnose_project(tmp_path / "missing", use_cache=False)
+
+
+def test_template_patterns_are_found(tmp_path, monkeypatch):
+    """Test the audit of a project generated from the full template."""
+    monkeypatch.setattr(settings, "cache_dir", tmp_path / "cache")
+    context = {
+        "project_name": "test_project",
+        "author_name": "Test Author",
+        "author_email": "test@example.com",
+    }
+    project_dir = TemplateEngine().generate_project(
+        "nagraj-full-project-template", tmp_path / "out", context
+    )
+
+    report = diagnose_project(project_dir)
+
+    found = {(f.path.rsplit("/", 1)[-1], f.rule) for f in report.findings}
+    assert {
+        ("auth.py", "per-request-dependency"),
+        ("auth_event_handler.py", "blocking-io-in-async"),
+        ("file_event_store.py", "blocking-io-in-async"),
+        ("command_handlers.py", "cpu-bound-in-async"),
+    } <= found
+    assert ("user_repository.py", "select-before-write") not in found
@@ -0,0 +1,118 @@
+"""Unit tests for command profiling."""
+
+import json
+import threading
+
+import pytest
+
+from nagraj.core.profiling import (
+    Profiler,
+    profile_span,
+    start_profiling,
+    stop_profiling,
+)
+
+
+@pytest.fixture
+def profiler():
+    """Fixture for a profiler holding a small timing tree."""
+    profiler = Profiler("nagraj test")
+    with profiler.span("command", "command"):
+        with profiler.span("plan", "plan"):
+            pass
+        with profiler.span("render", "render"):
+            with profiler.span("load", "load"):
+                pass
+
+        def worker():
+            with profiler.span("write", "write"):
+                pass
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+    return profiler
+
+
+def test_spans_nest_per_thread(profiler):
+    """Test that spans nest within their thread only."""
+    command, write = profiler.roots
+
+    assert [child.name for child in command.children] == ["plan", "render"]
+    assert command.children[1].children[0].name == "load"
+    assert (command.thread, write.thread) == (0, 1)
+    assert [span.name for span in profiler.iter_spans()] == [
+        "command",
+        "plan",
+        "render",
+        "load",
+        "write",
+    ]
+    assert command.self_time <= command.duration
+
+
+def test_top_orders_by_self_time(profiler):
+    """Test that the slowest spans are returned first."""
+    top = profiler.top(3)
+
+    assert len(top) == 3
+    assert top[0].self_time >= top[1].self_time >= top[2].self_time
+
+
+def test_chrome_trace(profiler, tmp_path):
+    """Test the Chrome trace export."""
+    path = tmp_path / "trace.json"
+    profiler.dump(path, "chrome")
+
+    events = json.loads(path.read_text())["traceEvents"]
+    complete = [event for event in events if event["ph"] == "X"]
+    assert [event["name"] for event in complete] == [
+        "command",
+        "plan",
+        "render",
+        "load",
+        "write",
+    ]
+    assert {event["tid"] for event in complete} == {0, 1}
+    assert all(event["dur"] >= 0 for event in complete)
+
+
+def test_speedscope(profiler, tmp_path):
+    """Test that the speedscope export opens and closes frames in order."""
+    path = tmp_path / "profile.speedscope.json"
+    profiler.dump(path, "speedscope")
+
+    data = json.loads(path.read_text())
+    frames = [frame["name"] for frame in data["shared"]["frames"]]
+    main, worker = data["profiles"]
+    stack = []
+    for event in main["events"]:
+        if event["type"] == "O":
+            stack.append(event["frame"])
+        else:
+            assert stack.pop() == event["frame"]
+    assert stack == []
+    assert [frames[e["frame"]] for e in worker["events"]] == ["write", "write"]
+
+
+def test_dump_rejects_unknown_format(profiler, tmp_path):
+    """Test that an unknown export format is rejected."""
+    with pytest.raises(ValueError, match="Unsupported profile format"):
+        profiler.dump(tmp_path / "profile.txt", "pprof")
+
+
+def test_profile_span_is_noop_when_inactive():
+    """Test that spans are only recorded while profiling."""
+    with profile_span("ignored"):
+        pass
+
+    profiler = start_profiling()
+    try:
+        with profile_span("recorded", "test"):
+            pass
+    finally:
+        assert stop_profiling() is profiler
+
+    with profile_span("ignored"):
+        pass
+    assert [span.name for span in profiler.iter_spans()] == ["recorded"]
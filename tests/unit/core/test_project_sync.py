@@ -0,0 +1,228 @@
+"""Unit tests for incremental project synchronization."""
+
+from unittest.mock import patch
+
+import pytest
+
+from nagraj.config.settings import settings
+from nagraj.core.manifest import ProjectManifest, hash_content
+from nagraj.core.sync import sync_project
+from nagraj.core.template import ALL_KEYS, RecordingContext, TemplateEngine
+
+TEMPLATE_NAME = "nagraj-full-project-template"
+
+CONTEXT = {
+    "project_name": "test_project",
+    "author_name": "Test Author",
+    "author_email": "test@example.com",
+}
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    """Fixture for a template engine with an isolated template cache."""
+    monkeypatch.setattr(settings, "cache_dir", tmp_path / "cache")
+    return TemplateEngine()
+
+
+@pytest.fixture
+def project_dir(engine, tmp_path):
+    """Fixture for a freshly generated project."""
+    return engine.generate_project(TEMPLATE_NAME, tmp_path / "out", CONTEXT)
+
+
+def snapshot(project_dir):
+    """Return the mtime of every file in a project."""
+    return {
+        p.relative_to(project_dir).as_posix(): p.stat().st_mtime_ns
+        for p in project_dir.rglob("*")
+        if p.is_file()
+    }
+
+
+def test_sync_without_changes_touches_nothing(engine, project_dir):
+    """Test that an unchanged project is left completely untouched."""
+    before = snapshot(project_dir)
+
+    result = sync_project(project_dir, engine=engine)
+
+    assert not result.changed
+    assert not result.conflicts
+    assert snapshot(project_dir) == before
+
+
+def test_sync_override_rewrites_only_affected_files(engine, project_dir):
+    """Test that changing a variable rewrites only files that use it."""
+    before = snapshot(project_dir)
+
+    result = sync_project(project_dir, {"version": "0.2.0"}, engine=engine)
+
+    assert sorted(result.updated) == [".nagraj.yaml", "pyproject.toml"]
+    assert 'version = "0.2.0"' in (project_dir / "pyproject.toml").read_text()
+    after = snapshot(project_dir)
+    changed = {path for path in before if before[path] != after[path]}
+    assert changed == {".nagraj.yaml", ".nagraj.manifest.json", "pyproject.toml"}
+    assert ProjectManifest.load(project_dir).context["version"] == "0.2.0"
+
+
+def test_manifest_records_variables_of_each_file(engine, project_dir):
+    """Test that the manifest records the variables every file reads."""
+    manifest = ProjectManifest.load(project_dir)
+
+    assert manifest.template_digest is not None
+    assert manifest.is_current(manifest.template_digest)
+    assert "version" in manifest.keys["pyproject.toml"]
+    assert "version" not in manifest.keys["test_project/main.py"]
+    assert set(manifest.keys) == set(manifest.files)
+
+
+def test_sync_override_renders_only_files_reading_it(engine, project_dir):
+    """Test that changing a variable renders only the files that read it."""
+    with patch.object(engine, "render_file", wraps=engine.render_file) as render:
+        sync_project(project_dir, {"version": "0.2.0"}, engine=engine)
+
+    rendered = {call.args[1] for call in render.call_args_list}
+    assert rendered == {".nagraj.yaml", "pyproject.toml"}
+
+
+def test_sync_switches_runtime_profile(engine, project_dir):
+    """Test that the runtime profile of a project can be changed."""
+    result = sync_project(project_dir, {"runtime_profile": "lean"}, engine=engine)
+
+    base = "test_project/common/base"
+    assert {
+        f"{base}/aggregate.py",
+        f"{base}/domain_event.py",
+        f"{base}/entity.py",
+        f"{base}/value_object.py",
+    } <= set(result.updated)
+    assert "slots=True" in (project_dir / base / "value_object.py").read_text()
+
+
+def test_sync_project_name_derives_slug(engine, project_dir):
+    """Test that renaming a project renames its package as well."""
+    result = sync_project(project_dir, {"project_name": "Renamed-App"}, engine=engine)
+
+    assert ProjectManifest.load(project_dir).context["project_slug"] == "renamed_app"
+    assert "renamed_app/main.py" in result.created
+    assert "test_project/main.py" in result.removed
+    assert not (project_dir / "test_project" / "main.py").exists()
+    assert "test_project" not in (project_dir / "renamed_app" / "main.py").read_text()
+
+
+def test_sync_project_name_keeps_explicit_slug(engine, project_dir):
+    """Test that a slug set together with the name is used as given."""
+    sync_project(
+        project_dir,
+        {"project_name": "Renamed-App", "project_slug": "custom_app"},
+        engine=engine,
+    )
+
+    assert ProjectManifest.load(project_dir).context["project_slug"] == "custom_app"
+    assert (project_dir / "custom_app" / "main.py").is_file()
+
+
+def test_sync_renders_everything_after_template_change(engine, project_dir):
+    """Test that a manifest of another template version is not trusted."""
+    manifest = ProjectManifest.load(project_dir)
+    manifest.template_digest = "outdated"
+    manifest.save(project_dir)
+
+    with patch.object(engine, "render_file", wraps=engine.render_file) as render:
+        sync_project(project_dir, {"version": "0.2.0"}, engine=engine)
+
+    assert render.call_count == len(manifest.files)
+    assert ProjectManifest.load(project_dir).template_digest != "outdated"
+
+
+def test_recording_context():
+    """Test that reads of single variables and of the whole context are recorded."""
+    reads = set()
+    context = RecordingContext({"name": "demo", "version": "0.1.0"}, reads)
+
+    assert context["name"] == "demo"
+    assert context.get("missing") is None
+    assert reads == {"name", "missing"}
+
+    list(context.items())
+
+    assert ALL_KEYS in reads
+
+
+def test_sync_reports_locally_modified_files(engine, project_dir):
+    """Test that local edits are not overwritten without force."""
+    pyproject = project_dir / "pyproject.toml"
+    pyproject.write_text("# edited\n")
+
+    result = sync_project(project_dir, {"version": "0.2.0"}, engine=engine)
+
+    assert result.conflicts == ["pyproject.toml"]
+    assert pyproject.read_text() == "# edited\n"
+
+    result = sync_project(project_dir, {"version": "0.2.0"}, force=True, engine=engine)
+
+    assert result.updated == ["pyproject.toml"]
+    assert 'version = "0.2.0"' in pyproject.read_text()
+
+
+def test_sync_force_keeps_modified_project_config(engine, project_dir):
+    """Test that force never overwrites a locally modified .nagraj.yaml."""
+    config = project_dir / ".nagraj.yaml"
+    config.write_text(config.read_text() + "# edited\n")
+
+    result = sync_project(project_dir, {"version": "0.2.0"}, force=True, engine=engine)
+
+    assert result.conflicts == [".nagraj.yaml"]
+    assert config.read_text().endswith("# edited\n")
+
+
+def test_sync_recreates_and_removes_files(engine, project_dir):
+    """Test that missing outputs are created and stale outputs removed."""
+    (project_dir / "test_project" / "main.py").unlink()
+    stale = project_dir / "stale.txt"
+    stale.write_bytes(b"old")
+    manifest = ProjectManifest.load(project_dir)
+    manifest.files["stale.txt"] = hash_content(b"old")
+    manifest.files["test_project/main.py"] = hash_content(b"outdated")
+    manifest.save(project_dir)
+
+    result = sync_project(project_dir, engine=engine)
+
+    assert result.created == ["test_project/main.py"]
+    assert result.removed == ["stale.txt"]
+    assert (project_dir / "test_project" / "main.py").is_file()
+    assert not stale.exists()
+    assert "stale.txt" not in ProjectManifest.load(project_dir).files
+
+
+def test_sync_interrupted_write_keeps_files(engine, project_dir):
+    """Test that a failed write leaves files and manifest as they were."""
+    pyproject = project_dir / "pyproject.toml"
+    before = pyproject.read_bytes()
+    manifest = ProjectManifest.load(project_dir)
+
+    with patch("nagraj.core.writer.os.replace", side_effect=OSError("disk full")):
+        with pytest.raises(OSError, match="disk full"):
+            sync_project(project_dir, {"version": "0.2.0"}, engine=engine)
+
+    assert pyproject.read_bytes() == before
+    assert ProjectManifest.load(project_dir) == manifest
+    assert not list(project_dir.glob(".*.tmp"))
+
+
+def test_sync_dry_run(engine, project_dir):
+    """Test that a dry run reports changes without writing."""
+    before = snapshot(project_dir)
+
+    result = sync_project(
+        project_dir, {"version": "0.2.0"}, dry_run=True, engine=engine
+    )
+
+    assert sorted(result.updated) == [".nagraj.yaml", "pyproject.toml"]
+    assert snapshot(project_dir) == before
+
+
+def test_sync_without_manifest(engine, tmp_path):
+    """Test syncing a directory that was not generated by nagraj."""
+    with pytest.raises(FileNotFoundError, match="No nagraj manifest"):
+        sync_project(tmp_path, engine=engine)
@@ -0,0 +1,120 @@
+"""Unit tests for project structure validation."""
+
+import os
+import shutil
+
+import pytest
+import yaml
+
+from nagraj.config.schema import BoundedContextConfig
+from nagraj.core.benchmark import build_synthetic_project
+from nagraj.core.validate import validate_project, watch_project
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Fixture for a valid project of 20 bounded contexts."""
+    project_dir = tmp_path / "project"
+    config = build_synthetic_project(project_dir, 20)
+    (project_dir / ".nagraj.yaml").write_text(yaml.safe_dump(config.model_dump()))
+    return project_dir, config
+
+
+def test_validate_structure_valid(project):
+    """Test that a complete project has no errors."""
+    project_dir, config = project
+
+    assert config.validate_structure(str(project_dir)) == []
+
+
+def test_validate_structure_reports_missing_paths(project):
+    """Test that every missing path is reported in order."""
+    project_dir, config = project
+    domains = project_dir / "src" / "domains"
+    (project_dir / "src" / "shared" / "base" / "base_entity.py").unlink()
+    shutil.rmtree(domains / "domain1")
+    shutil.rmtree(domains / "domain0" / "context3")
+    shutil.rmtree(domains / "domain0" / "context4" / "interfaces")
+    config.domains["domain0"].bounded_contexts["context5"].has_api = False
+    shutil.rmtree(domains / "domain0" / "context5" / "interfaces")
+    config.domains["domain0"].add_bounded_context(BoundedContextConfig(name="ghost"))
+
+    assert config.validate_structure(str(project_dir)) == [
+        "Missing required file: base_entity.py",
+        "Missing required directory: domains/domain0/context3",
+        "Missing required directory: domains/domain0/context4/interfaces/fastapi/routes",
+        "Missing required directory: domains/domain0/context4/interfaces/fastapi/controllers",
+        "Missing required directory: domains/domain0/context4/interfaces/fastapi/schemas",
+        "Missing required directory: domains/domain0/ghost",
+        "Missing required directory: domains/domain1",
+    ]
+
+
+def test_validate_structure_follows_symlinks(project, tmp_path):
+    """Test that symlinked directories count as directories."""
+    project_dir, config = project
+    context_dir = project_dir / "src" / "domains" / "domain0" / "context0"
+    shutil.move(context_dir, tmp_path / "elsewhere")
+    os.symlink(tmp_path / "elsewhere", context_dir)
+
+    assert config.validate_structure(str(project_dir)) == []
+
+
+def test_validate_structure_missing_root(tmp_path, project):
+    """Test validating a directory that does not exist."""
+    _, config = project
+
+    assert config.validate_structure(str(tmp_path / "missing")) == [
+        f"Missing required directory: {tmp_path / 'missing'}"
+    ]
+
+
+def test_validate_project(project):
+    """Test validating a project against its .nagraj.yaml."""
+    project_dir, _ = project
+    shutil.rmtree(project_dir / "src" / "domains" / "domain0" / "context0")
+
+    report = validate_project(project_dir)
+
+    assert not report.valid
+    assert report.to_dict() == {
+        "project_dir": str(project_dir),
+        "valid": False,
+        "errors": ["Missing required directory: domains/domain0/context0"],
+    }
+
+
+def test_validate_project_without_config(tmp_path):
+    """Test validating a directory that is not a nagraj project."""
+    with pytest.raises(FileNotFoundError):
+        validate_project(tmp_path)
+
+
+def test_watch_project_reports_changes(project):
+    """Test that the watch only reports results that changed."""
+    project_dir, _ = project
+    context_dir = project_dir / "src" / "domains" / "domain0" / "context0"
+    reports = []
+    steps = iter(
+        [
+            lambda: None,
+            lambda: shutil.rmtree(context_dir),
+            lambda: None,
+            lambda: (project_dir / ".nagraj.yaml").unlink(),
+        ]
+    )
+
+    def should_stop():
+        step = next(steps, None)
+        if step is None:
+            return True
+        step()
+        return False
+
+    watch_project(project_dir, reports.append, interval=0, should_stop=should_stop)
+
+    assert [report.errors for report in reports] == [
+        [],
+        ["Missing required directory: domains/domain0/context0"],
+        [f"No .nagraj.yaml found in {project_dir}"],
+    ]
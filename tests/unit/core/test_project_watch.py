@@ -0,0 +1,176 @@
+"""Unit tests for keeping a project up to date while its inputs change."""
+
+import shutil
+from unittest.mock import patch
+
+import pytest
+
+from nagraj.config.settings import settings
+from nagraj.core.manifest import ProjectManifest
+from nagraj.core.template import TemplateEngine
+from nagraj.core.watch import WatchSession, run_watch
+from nagraj.core.watcher import PollingWatcher
+
+TEMPLATE_NAME = "nagraj-full-project-template"
+
+CONTEXT = {
+    "project_name": "test_project",
+    "author_name": "Test Author",
+    "author_email": "test@example.com",
+}
+
+
+@pytest.fixture
+def template_path(tmp_path, monkeypatch):
+    """Fixture for an editable copy of the template directory."""
+    template_path = tmp_path / "templates"
+    shutil.copytree(
+        settings.template_path,
+        template_path,
+        ignore=shutil.ignore_patterns("__pycache__"),
+    )
+    monkeypatch.setattr(settings, "template_path", template_path)
+    monkeypatch.setattr(settings, "cache_dir", tmp_path / "cache")
+    return template_path
+
+
+@pytest.fixture
+def engine(template_path):
+    """Fixture for a template engine rendering from the template directory."""
+    return TemplateEngine()
+
+
+@pytest.fixture
+def project_dir(engine, tmp_path):
+    """Fixture for a freshly generated project."""
+    return engine.generate_project(TEMPLATE_NAME, tmp_path / "out", CONTEXT)
+
+
+@pytest.fixture
+def session(engine, project_dir):
+    """Fixture for a watch session of the project."""
+    return WatchSession(project_dir, engine=engine)
+
+
+def edit(path, old, new):
+    """Replace text in a file."""
+    text = path.read_text()
+    assert old in text
+    path.write_text(text.replace(old, new, 1))
+
+
+def test_unrelated_changes_are_ignored(session, project_dir):
+    """Test that outputs written into the project do not trigger a render."""
+    assert session.apply([project_dir / "pyproject.toml"]) is None
+
+
+def test_project_version_rerenders_affected_files(session, project_dir):
+    """Test that editing the project section re-renders files using it."""
+    config_path = project_dir / ".nagraj.yaml"
+    edit(config_path, 'version: "0.1.0"', 'version: "0.2.0"')
+
+    with patch.object(
+        session.engine, "render_file", wraps=session.engine.render_file
+    ) as render:
+        result = session.apply([config_path])
+
+    assert result.error is None
+    assert [call.args[1] for call in render.call_args_list] == ["pyproject.toml"]
+    assert result.sync.updated == ["pyproject.toml"]
+    assert not result.sync.conflicts
+    assert 'version = "0.2.0"' in (project_dir / "pyproject.toml").read_text()
+    assert ProjectManifest.load(project_dir).context["version"] == "0.2.0"
+
+    # Unchanged values do not render anything again
+    assert session.apply([config_path]).sync.unchanged == 0
+
+
+def test_new_domain_is_scaffolded(session, project_dir):
+    """Test that domains and contexts added to .nagraj.yaml are generated."""
+    config_path = project_dir / ".nagraj.yaml"
+    edit(
+        config_path,
+        "domains:\n",
+        "domains:\n  billing:\n    bounded_contexts:\n      invoice: {}\n",
+    )
+
+    result = session.apply([config_path])
+
+    assert result.error is None
+    assert result.scaffolded == [
+        "test_project/billing",
+        "test_project/billing/bounded_contexts/invoice",
+    ]
+    assert (project_dir / "test_project" / "billing" / "base").is_dir()
+    assert session.apply([config_path]).scaffolded == []
+
+
+def test_invalid_config_is_reported(session, project_dir):
+    """Test that a broken .nagraj.yaml is reported without stopping."""
+    config_path = project_dir / ".nagraj.yaml"
+    config_path.write_text("domains: [\n")
+
+    result = session.apply([config_path])
+
+    assert result.error
+    assert not result.sync.changed
+
+
+def test_template_change_rerenders_its_output(session, template_path, project_dir):
+    """Test that only outputs of an edited template are re-rendered."""
+    template = (
+        template_path / TEMPLATE_NAME / "{{cookiecutter.project_name}}" / "README.md"
+    )
+    with template.open("a") as f:
+        f.write("\nWatched.\n")
+
+    with patch.object(
+        session.engine, "render_file", wraps=session.engine.render_file
+    ) as mock_render:
+        result = session.apply([template])
+
+    assert result.templates == ["{{cookiecutter.project_name}}/README.md"]
+    assert result.sync.updated == ["README.md"]
+    assert [call.args[1] for call in mock_render.call_args_list] == ["README.md"]
+    assert (project_dir / "README.md").read_text().endswith("Watched.\n")
+
+
+def test_included_template_change_rerenders_project(
+    session, template_path, project_dir
+):
+    """Test that editing a template outside the project directory re-renders."""
+    template = (
+        template_path / TEMPLATE_NAME / "templates/runtime_profiles/standard/entity.py"
+    )
+    with template.open("a") as f:
+        f.write("# Watched\n")
+
+    result = session.apply([template])
+
+    assert result.templates == ["templates/runtime_profiles/standard/entity.py"]
+    assert result.sync.updated == ["test_project/common/base/entity.py"]
+    entity = project_dir / "test_project" / "common" / "base" / "entity.py"
+    assert entity.read_text().endswith("# Watched\n")
+
+
+def test_run_watch_polls_for_changes(session, project_dir):
+    """Test the watch loop with the polling watcher."""
+    config_path = project_dir / ".nagraj.yaml"
+    results = []
+    polls = iter(range(100))
+
+    def should_stop():
+        index = next(polls)
+        if index == 0:
+            edit(config_path, 'version: "0.1.0"', 'version: "0.3.0"')
+        return bool(results) or index > 20
+
+    run_watch(
+        session,
+        PollingWatcher(interval=0.05),
+        results.append,
+        debounce=0.05,
+        should_stop=should_stop,
+    )
+
+    assert [result.sync.updated for result in results] == [["pyproject.toml"]]
@@ -0,0 +1,143 @@
+"""Unit tests for adding domains and bounded contexts to a project."""
+
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from nagraj.config.project import ProjectConfigFile
+from nagraj.config.settings import settings
+from nagraj.core.manifest import ProjectManifest, hash_content
+from nagraj.core.scaffold import add_bounded_context, add_domain
+from nagraj.core.sync import sync_project
+from nagraj.core.template import TemplateEngine
+
+CONTEXT = {
+    "project_name": "test_project",
+    "author_name": "Test Author",
+    "author_email": "test@example.com",
+}
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    """Fixture for a template engine with an isolated template cache."""
+    monkeypatch.setattr(settings, "cache_dir", tmp_path / "cache")
+    return TemplateEngine()
+
+
+@pytest.fixture
+def project_dir(engine, tmp_path):
+    """Fixture for a freshly generated project."""
+    return engine.generate_project(
+        "nagraj-full-project-template", tmp_path / "out", CONTEXT
+    )
+
+
+def test_add_domain_with_contexts(engine, project_dir):
+    """Test that a domain and its contexts are rendered and configured."""
+    created = add_domain(project_dir, "shipping", ["tracking"], engine=engine)
+
+    domain_dir = project_dir / "test_project" / "shipping"
+    context_dir = domain_dir / "bounded_contexts" / "tracking"
+    assert created == [domain_dir, context_dir]
+    assert (domain_dir / "base" / "__init__.py").is_file()
+    assert (domain_dir / "context_maps" / "__init__.py").is_file()
+    assert (context_dir / "domain" / "aggregates" / "__init__.py").is_file()
+    env_py = (context_dir / "infrastructure" / "migrations" / "env.py").read_text()
+    assert "from test_project.common.core.config.settings import" in env_py
+    assert "{{" not in env_py
+
+    config = yaml.safe_load((project_dir / ".nagraj.yaml").read_text())
+    assert "tracking" in config["domains"]["shipping"]["bounded_contexts"]
+    assert "example_domain_one" in config["domains"]
+
+
+def test_add_bounded_context(engine, project_dir):
+    """Test adding a context to an existing domain."""
+    context_dir = add_bounded_context(
+        project_dir, "example_domain_one", "billing", engine=engine
+    )
+
+    assert context_dir == (
+        project_dir
+        / "test_project"
+        / "example_domain_one"
+        / "bounded_contexts"
+        / "billing"
+    )
+    assert (context_dir / "application" / "commands" / "__init__.py").is_file()
+    config = yaml.safe_load((project_dir / ".nagraj.yaml").read_text())
+    assert list(config["domains"]["example_domain_one"]["bounded_contexts"]) == [
+        "example_context_one",
+        "example_context_two",
+        "billing",
+    ]
+
+
+def test_add_existing_domain(engine, project_dir):
+    """Test that an already configured domain is rejected."""
+    with pytest.raises(ValueError, match="already exists"):
+        add_domain(project_dir, "example_domain_one", engine=engine)
+
+
+def test_add_existing_bounded_context(engine, project_dir):
+    """Test that an already configured context is rejected untouched."""
+    before = (project_dir / ".nagraj.yaml").read_text()
+
+    with pytest.raises(ValueError, match="already exists"):
+        add_bounded_context(
+            project_dir, "example_domain_one", "example_context_one", engine=engine
+        )
+
+    assert (project_dir / ".nagraj.yaml").read_text() == before
+
+
+def test_add_bounded_context_unknown_domain(engine, project_dir):
+    """Test that a context cannot be added to an unknown domain."""
+    with pytest.raises(ValueError, match="does not exist"):
+        add_bounded_context(project_dir, "shipping", "tracking", engine=engine)
+
+
+def test_add_domain_invalid_name(engine, project_dir):
+    """Test that names which are not valid packages are rejected."""
+    with pytest.raises(ValueError, match="Invalid domain name"):
+        add_domain(project_dir, "order-management", engine=engine)
+    assert not (project_dir / "test_project" / "order-management").exists()
+
+
+def test_add_domain_records_config_hash(engine, project_dir):
+    """Test that the patched config is recorded in the manifest."""
+    add_domain(project_dir, "billing", ["invoice"], engine=engine)
+
+    config = (project_dir / ".nagraj.yaml").read_bytes()
+    manifest = ProjectManifest.load(project_dir)
+    assert manifest.files[".nagraj.yaml"] == hash_content(config)
+
+
+def test_added_domains_survive_sync(engine, project_dir):
+    """Test that syncing after adding domains keeps them configured."""
+    add_domain(project_dir, "billing", ["invoice"], engine=engine)
+    add_bounded_context(project_dir, "example_domain_one", "audit", engine=engine)
+
+    result = sync_project(project_dir, {"version": "0.3.0"}, engine=engine)
+
+    assert not result.conflicts
+    assert ".nagraj.yaml" in result.updated
+    config = yaml.safe_load((project_dir / ".nagraj.yaml").read_text())
+    assert config["project"]["version"] == "0.3.0"
+    assert list(config["domains"]["billing"]["bounded_contexts"]) == ["invoice"]
+    assert "audit" in config["domains"]["example_domain_one"]["bounded_contexts"]
+    assert not sync_project(project_dir, engine=engine).changed
+
+
+def test_add_domain_removes_directory_on_error(engine, project_dir):
+    """Test that a failed config update leaves no domain directory behind."""
+    before = (project_dir / ".nagraj.yaml").read_text()
+
+    with patch.object(ProjectConfigFile, "save", side_effect=OSError("disk full")):
+        with pytest.raises(OSError, match="disk full"):
+            add_domain(project_dir, "billing", ["invoice"], engine=engine)
+
+    assert not (project_dir / "test_project" / "billing").exists()
+    assert (project_dir / ".nagraj.yaml").read_text() == before
@@ -0,0 +1,235 @@
+"""Unit tests for spec-driven generation of domains and bounded contexts."""
+
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from nagraj.config.project import load_project_spec
+from nagraj.config.settings import settings
+from nagraj.core import generate
+from nagraj.core.generate import (
+    DependencyCycleError,
+    dependency_levels,
+    generate_from_spec,
+)
+from nagraj.core.template import TemplateEngine
+
+CONTEXT = {
+    "project_name": "test_project",
+    "author_name": "Test Author",
+    "author_email": "test@example.com",
+}
+
+SPEC = """\
+name: test_project
+domains:
+  commerce:
+    bounded_contexts:
+      order:
+        dependencies: [catalog, billing.invoice]
+      catalog: {}
+  billing:
+    bounded_contexts:
+      invoice:
+        dependencies: [commerce.catalog]
+  example_domain_one:
+    bounded_contexts:
+      example_context_one: {}
+      report:
+        dependencies: [example_context_one]
+"""
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    """Fixture for a template engine with an isolated template cache."""
+    monkeypatch.setattr(settings, "cache_dir", tmp_path / "cache")
+    return TemplateEngine()
+
+
+@pytest.fixture
+def project_dir(engine, tmp_path):
+    """Fixture for a freshly generated project."""
+    return engine.generate_project(
+        "nagraj-full-project-template", tmp_path / "out", CONTEXT
+    )
+
+
+def write_spec(tmp_path, text):
+    """Write a spec file and return its path."""
+    path = tmp_path / "system.yaml"
+    path.write_text(text)
+    return path
+
+
+def test_dependency_levels(tmp_path):
+    """Test that contexts are grouped by their depth in the graph."""
+    config = load_project_spec(write_spec(tmp_path, SPEC))
+
+    levels = dependency_levels(config)
+
+    assert levels == [
+        ["commerce.catalog", "example_domain_one.example_context_one"],
+        ["billing.invoice", "example_domain_one.report"],
+        ["commerce.order"],
+    ]
+
+
+def test_load_project_spec_lists(tmp_path):
+    """Test that domains and contexts may be given as lists."""
+    spec = """\
+domains:
+  - name: commerce
+    bounded_contexts:
+      - catalog
+      - name: order
+        dependencies: [catalog]
+  - billing
+"""
+    config = load_project_spec(write_spec(tmp_path, spec))
+
+    assert list(config.domains) == ["commerce", "billing"]
+    assert list(config.domains["commerce"].bounded_contexts) == ["catalog", "order"]
+    assert dependency_levels(config) == [["commerce.catalog"], ["commerce.order"]]
+
+
+def test_load_project_spec_invalid_collection(tmp_path):
+    """Test that collections which are neither lists nor mappings are rejected."""
+    spec = """\
+domains:
+  - name: commerce
+    bounded_contexts: catalog
+"""
+    with pytest.raises(ValueError, match="must be a mapping or a list"):
+        load_project_spec(write_spec(tmp_path, spec))
+
+
+def test_dependency_levels_rejects_cycles(tmp_path):
+    """Test that cyclic dependencies are reported."""
+    spec = """\
+domains:
+  commerce:
+    bounded_contexts:
+      order: {dependencies: [payment]}
+      payment: {dependencies: [shipment]}
+      shipment: {dependencies: [order]}
+      catalog: {}
+"""
+    config = load_project_spec(write_spec(tmp_path, spec))
+
+    with pytest.raises(DependencyCycleError, match="commerce.order -> "):
+        dependency_levels(config)
+
+
+def test_dependency_levels_unknown_dependency(tmp_path):
+    """Test that dependencies on undefined contexts are rejected."""
+    spec = """\
+domains:
+  commerce:
+    bounded_contexts:
+      order: {dependencies: [user]}
+"""
+    config = load_project_spec(write_spec(tmp_path, spec))
+
+    with pytest.raises(ValueError, match="unknown context user"):
+        dependency_levels(config)
+    assert dependency_levels(config, known={"commerce.user"}) == [["commerce.order"]]
+
+
+def test_generate_from_spec(engine, project_dir, tmp_path):
+    """Test generating a spec in-process into an existing project."""
+    result = generate_from_spec(
+        write_spec(tmp_path, SPEC), project_dir, max_workers=1, engine=engine
+    )
+
+    assert result.domains == ["commerce", "billing"]
+    assert result.skipped == ["example_domain_one.example_context_one"]
+    # report only depends on an existing context, so it is in the first level
+    assert result.levels == [
+        ["commerce.catalog", "example_domain_one.report"],
+        ["billing.invoice"],
+        ["commerce.order"],
+    ]
+    package = project_dir / "test_project"
+    for node in result.contexts:
+        domain_name, context_name = node.split(".")
+        context_dir = package / domain_name / "bounded_contexts" / context_name
+        assert (context_dir / "domain" / "entities" / "__init__.py").is_file()
+    assert (package / "commerce" / "context_maps" / "__init__.py").is_file()
+
+    config = yaml.safe_load((project_dir / ".nagraj.yaml").read_text())
+    assert list(config["domains"]["commerce"]["bounded_contexts"]) == [
+        "order",
+        "catalog",
+    ]
+    assert list(config["domains"]["example_domain_one"]["bounded_contexts"]) == [
+        "example_context_one",
+        "example_context_two",
+        "report",
+    ]
+
+
+def test_generate_from_spec_process_pool(project_dir, tmp_path):
+    """Test generating a spec across worker processes."""
+    result = generate_from_spec(write_spec(tmp_path, SPEC), project_dir, max_workers=2)
+
+    assert len(result.contexts) == 4
+    context_dir = project_dir / "test_project" / "commerce" / "bounded_contexts"
+    assert (context_dir / "order" / "application" / "__init__.py").is_file()
+
+
+def test_generate_from_spec_is_repeatable(engine, project_dir, tmp_path):
+    """Test that a second run skips everything and changes nothing."""
+    spec = write_spec(tmp_path, SPEC)
+    generate_from_spec(spec, project_dir, max_workers=1, engine=engine)
+    before = (project_dir / ".nagraj.yaml").read_text()
+
+    result = generate_from_spec(spec, project_dir, max_workers=1, engine=engine)
+
+    assert result.contexts == []
+    assert len(result.skipped) == 5
+    assert (project_dir / ".nagraj.yaml").read_text() == before
+
+
+def test_generate_from_spec_cycle_writes_nothing(engine, project_dir, tmp_path):
+    """Test that a cyclic spec is rejected before rendering anything."""
+    spec = """\
+domains:
+  commerce:
+    bounded_contexts:
+      order: {dependencies: [order]}
+"""
+
+    with pytest.raises(DependencyCycleError):
+        generate_from_spec(
+            write_spec(tmp_path, spec), project_dir, max_workers=1, engine=engine
+        )
+    assert not (project_dir / "test_project" / "commerce").exists()
+
+
+def test_generate_from_spec_resumes_after_failure(engine, project_dir, tmp_path):
+    """Test that completed levels are recorded when a later level fails."""
+    spec = write_spec(tmp_path, SPEC)
+    render_job = generate._render_job
+
+    def failing_render(engine, job):
+        target = render_job(engine, job)
+        if job[1].get("context_name") == "invoice":
+            raise RuntimeError("render failed")
+        return target
+
+    with patch.object(generate, "_render_job", side_effect=failing_render):
+        with pytest.raises(RuntimeError, match="render failed"):
+            generate_from_spec(spec, project_dir, max_workers=1, engine=engine)
+
+    package = project_dir / "test_project"
+    assert not (package / "billing" / "bounded_contexts" / "invoice").exists()
+    config = yaml.safe_load((project_dir / ".nagraj.yaml").read_text())
+    assert list(config["domains"]["commerce"]["bounded_contexts"]) == ["catalog"]
+    assert config["domains"]["billing"]["bounded_contexts"] == {}
+
+    result = generate_from_spec(spec, project_dir, max_workers=1, engine=engine)
+
+    assert result.domains == []
+    assert result.levels == [["billing.invoice"], ["commerce.order"]]
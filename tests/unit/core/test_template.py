@@ -0,0 +1,150 @@
+"""Unit tests for the template engine."""
+
+from pathlib import Path
+
+import pytest
+from cookiecutter.main import cookiecutter
+
+from nagraj.config.settings import settings
+from nagraj.core.manifest import MANIFEST_FILE, ProjectManifest
+from nagraj.core.template import TemplateEngine
+
+TEMPLATE_NAME = "nagraj-full-project-template"
+
+CONTEXT = {
+    "project_name": "test_project",
+    "author_name": "Test Author",
+    "author_email": "test@example.com",
+    "project_description": "A test project",
+    "python_version": "3.12",
+    "version": "0.1.0",
+}
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    """Fixture for a template engine with an isolated template cache."""
+    monkeypatch.setattr(settings, "cache_dir", tmp_path / "cache")
+    return TemplateEngine()
+
+
+def test_generate_project_renders_tree(engine, tmp_path):
+    """Test that file names and contents are rendered."""
+    project_dir = engine.generate_project(TEMPLATE_NAME, tmp_path, CONTEXT)
+
+    assert project_dir == (tmp_path / "test_project").resolve()
+    assert (project_dir / "test_project" / "main.py").is_file()
+    pyproject = (project_dir / "pyproject.toml").read_text()
+    assert "Test Author" in pyproject
+    assert "cookiecutter" not in pyproject
+    assert not list(project_dir.rglob("*{{*"))
+
+
+def test_generate_project_matches_cookiecutter(engine, tmp_path):
+    """Test that the generated tree matches Cookiecutter output."""
+    native = engine.generate_project(TEMPLATE_NAME, tmp_path / "native", CONTEXT)
+    reference = Path(
+        cookiecutter(
+            str(settings.template_path / TEMPLATE_NAME),
+            output_dir=str(tmp_path / "reference"),
+            no_input=True,
+            extra_context=CONTEXT,
+        )
+    )
+
+    native_files = sorted(
+        p.relative_to(native)
+        for p in native.rglob("*")
+        if p.is_file() and p.name != MANIFEST_FILE
+    )
+    reference_files = sorted(
+        p.relative_to(reference) for p in reference.rglob("*") if p.is_file()
+    )
+    assert native_files == reference_files
+
+    for relative in native_files:
+        if relative.name == ".nagraj.yaml":
+            # Contains generation timestamps
+            continue
+        assert (native / relative).read_bytes() == (
+            reference / relative
+        ).read_bytes(), relative
+
+
+def test_generate_project_writes_manifest(engine, tmp_path):
+    """Test that a manifest of the rendered output is written."""
+    project_dir = engine.generate_project(TEMPLATE_NAME, tmp_path, CONTEXT)
+
+    manifest = ProjectManifest.load(project_dir)
+    files = {
+        p.relative_to(project_dir).as_posix()
+        for p in project_dir.rglob("*")
+        if p.is_file() and p.name != MANIFEST_FILE
+    }
+    assert manifest.template == TEMPLATE_NAME
+    assert manifest.context["project_slug"] == "test_project"
+    assert set(manifest.files) == files
+
+
+def test_generate_project_runtime_profile(engine, tmp_path):
+    """Test that the runtime profile selects the base class implementations."""
+    standard = engine.generate_project(TEMPLATE_NAME, tmp_path / "standard", CONTEXT)
+    lean = engine.generate_project(
+        TEMPLATE_NAME, tmp_path / "lean", {**CONTEXT, "runtime_profile": "lean"}
+    )
+
+    base = Path("test_project") / "common" / "base"
+    assert "validate_assignment=True" in (standard / base / "entity.py").read_text()
+    assert "validate_assignment" not in (lean / base / "entity.py").read_text()
+    assert "slots=True" in (lean / base / "value_object.py").read_text()
+    for name in ("aggregate.py", "domain_event.py"):
+        assert (standard / base / name).read_text() != (lean / base / name).read_text()
+    assert ProjectManifest.load(lean).context["runtime_profile"] == "lean"
+
+    bench = Path("scripts") / "bench_runtime_profiles.py"
+    assert 'PROFILE = "standard"' in (standard / bench).read_text()
+    assert 'PROFILE = "lean"' in (lean / bench).read_text()
+
+
+def test_render_project_in_memory(engine, tmp_path):
+    """Test rendering a project without writing to disk."""
+    plan, files = engine.render_project(TEMPLATE_NAME, CONTEXT)
+
+    assert plan.name == "test_project"
+    assert "test_project/main.py" in files
+    assert b"Test Author" in files["pyproject.toml"]
+    assert not (tmp_path / "test_project").exists()
+
+
+def test_generate_project_populates_cache(engine, tmp_path):
+    """Test that a second generation reuses compiled templates."""
+    engine.generate_project(TEMPLATE_NAME, tmp_path / "first", CONTEXT)
+    entries = sorted((tmp_path / "cache").iterdir())
+    assert entries
+
+    engine = TemplateEngine()
+    engine.generate_project(TEMPLATE_NAME, tmp_path / "second", CONTEXT)
+    assert sorted((tmp_path / "cache").iterdir()) == entries
+
+
+def test_generate_project_without_cache(tmp_path, monkeypatch):
+    """Test that disabling the cache writes nothing to the cache directory."""
+    monkeypatch.setattr(settings, "cache_dir", tmp_path / "cache")
+
+    TemplateEngine(use_cache=False).generate_project(TEMPLATE_NAME, tmp_path, CONTEXT)
+
+    assert not (tmp_path / "cache").exists()
+
+
+def test_generate_project_existing_directory(engine, tmp_path):
+    """Test that an existing project directory is not overwritten."""
+    (tmp_path / "test_project").mkdir()
+
+    with pytest.raises(FileExistsError):
+        engine.generate_project(TEMPLATE_NAME, tmp_path, CONTEXT)
+
+
+def test_generate_project_missing_template(engine, tmp_path):
+    """Test generation with an unknown template name."""
+    with pytest.raises(FileNotFoundError, match="Template directory not found"):
+        engine.generate_project("missing-template", tmp_path, CONTEXT)
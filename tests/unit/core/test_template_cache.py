@@ -0,0 +1,88 @@
+"""Unit tests for the template bytecode cache."""
+
+from unittest.mock import patch
+
+import pytest
+from jinja2 import DictLoader, Environment
+
+from nagraj.core.cache import CACHE_SUFFIX, TemplateBytecodeCache
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    """Fixture for the cache directory."""
+    return tmp_path / "cache"
+
+
+def make_env(cache, templates):
+    """Create an environment backed by the given cache."""
+    return Environment(loader=DictLoader(templates), bytecode_cache=cache)
+
+
+def test_compiled_template_is_reused(cache_dir):
+    """Test that a cached template is not compiled again."""
+    cache = TemplateBytecodeCache(cache_dir, max_size=1024 * 1024)
+    templates = {"hello.txt": "Hello {{ name }}!"}
+
+    assert make_env(cache, templates).get_template("hello.txt").render(name="a")
+    assert len(list(cache_dir.glob(f"*{CACHE_SUFFIX}"))) == 1
+
+    env = make_env(cache, templates)
+    with patch.object(env, "compile", side_effect=AssertionError) as mock_compile:
+        assert env.get_template("hello.txt").render(name="b") == "Hello b!"
+        mock_compile.assert_not_called()
+
+
+def test_changed_source_gets_new_entry(cache_dir):
+    """Test that editing a template does not reuse stale bytecode."""
+    cache = TemplateBytecodeCache(cache_dir, max_size=1024 * 1024)
+
+    make_env(cache, {"t": "one"}).get_template("t")
+    result = make_env(cache, {"t": "two"}).get_template("t").render()
+
+    assert result == "two"
+    assert len(list(cache_dir.glob(f"*{CACHE_SUFFIX}"))) == 2
+
+
+def test_environment_options_are_part_of_key(cache_dir):
+    """Test that environments with different options do not share entries."""
+    cache = TemplateBytecodeCache(cache_dir, max_size=1024 * 1024)
+    templates = {"t": "{% if true %}\nx\n{% endif %}\n"}
+
+    plain = make_env(cache, templates).get_template("t").render()
+    trimmed = Environment(
+        loader=DictLoader(templates), bytecode_cache=cache, trim_blocks=True
+    ).get_template("t").render()
+
+    assert plain == "\nx\n"
+    assert trimmed == "x\n"
+
+
+def test_size_bounded_eviction(cache_dir):
+    """Test that the oldest entries are evicted when over budget."""
+    cache = TemplateBytecodeCache(cache_dir, max_size=1024 * 1024)
+    make_env(cache, {"t": "x"}).get_template("t")
+    entry_size = next(cache_dir.glob(f"*{CACHE_SUFFIX}")).stat().st_size
+
+    cache = TemplateBytecodeCache(cache_dir, max_size=entry_size * 4)
+    for i in range(10):
+        make_env(cache, {"t": f"x{i}"}).get_template("t")
+
+    total = sum(p.stat().st_size for p in cache_dir.glob(f"*{CACHE_SUFFIX}"))
+    assert total <= entry_size * 4
+
+
+def test_clear(cache_dir):
+    """Test clearing the cache."""
+    cache = TemplateBytecodeCache(cache_dir, max_size=1024 * 1024)
+    make_env(cache, {"a": "a", "b": "b"}).get_template("a")
+
+    cache.clear()
+
+    assert not list(cache_dir.glob(f"*{CACHE_SUFFIX}"))
+
+
+def test_clear_missing_directory(cache_dir):
+    """Test clearing a cache that was never written."""
+    TemplateBytecodeCache(cache_dir, max_size=1024).clear()
+    assert not cache_dir.exists()
@@ -0,0 +1,48 @@
+"""Unit tests for file change notifications."""
+
+import sys
+
+import pytest
+
+from nagraj.core.watcher import InotifyWatcher, PollingWatcher, create_watcher
+
+WATCHERS = [pytest.param(lambda: PollingWatcher(interval=0.01), id="polling")]
+if sys.platform.startswith("linux"):
+    WATCHERS.append(pytest.param(InotifyWatcher, id="inotify"))
+
+
+@pytest.mark.parametrize("factory", WATCHERS)
+def test_watcher_reports_changes(tmp_path, factory):
+    """Test that writes, new files and nested directories are reported."""
+    (tmp_path / "tree" / "sub").mkdir(parents=True)
+    (tmp_path / "flat.txt").write_text("a")
+
+    with factory() as watcher:
+        watcher.watch(tmp_path)
+        watcher.watch(tmp_path / "tree", recursive=True)
+        assert watcher.changes(timeout=0.05) == set()
+
+        (tmp_path / "flat.txt").write_text("b")
+        (tmp_path / "tree" / "sub" / "new.txt").write_text("c")
+        changed = watcher.wait(debounce=0.05, timeout=2)
+
+        assert tmp_path / "flat.txt" in changed
+        assert tmp_path / "tree" / "sub" / "new.txt" in changed
+
+        (tmp_path / "tree" / "added").mkdir()
+        (tmp_path / "tree" / "__pycache__").mkdir()
+        watcher.wait(debounce=0.05, timeout=2)
+        (tmp_path / "tree" / "added" / "deep.txt").write_text("d")
+        (tmp_path / "tree" / "__pycache__" / "x.pyc").write_text("e")
+
+        assert tmp_path / "tree" / "added" / "deep.txt" in watcher.wait(
+            debounce=0.05, timeout=2
+        )
+
+
+def test_create_watcher_polling():
+    """Test that polling can be forced."""
+    watcher = create_watcher(polling=True, interval=0.5)
+
+    assert isinstance(watcher, PollingWatcher)
+    assert watcher.interval == 0.5
@@ -0,0 +1,120 @@
+"""Unit tests for the staged project writer."""
+
+import os
+import stat
+from unittest.mock import patch
+
+import pytest
+
+from nagraj.config.settings import settings
+from nagraj.core.manifest import MANIFEST_FILE
+from nagraj.core.template import TemplateEngine
+from nagraj.core.writer import FSYNC_POLICIES, ProjectWriter, write_file_atomic
+
+TEMPLATE_NAME = "nagraj-full-project-template"
+
+CONTEXT = {
+    "project_name": "test_project",
+    "author_name": "Test Author",
+    "author_email": "test@example.com",
+}
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    """Fixture for a template engine with an isolated template cache."""
+    monkeypatch.setattr(settings, "cache_dir", tmp_path / "cache")
+    return TemplateEngine()
+
+
+def write_tree(writer):
+    """Stage a small tree of one package and an executable script."""
+    writer.mkdir("pkg")
+    writer.write_file("pkg/__init__.py", b"")
+    writer.write_file("run.sh", b"#!/bin/sh\n", 0o755)
+
+
+@pytest.mark.parametrize("fsync", FSYNC_POLICIES)
+def test_writer_renames_staged_tree(tmp_path, fsync):
+    """Test that the tree only appears once it is complete."""
+    target = tmp_path / "out" / "project"
+
+    with ProjectWriter(target, fsync) as writer:
+        write_tree(writer)
+        assert not target.exists()
+        assert writer.staging_dir.parent == target.parent
+
+    assert sorted(p.name for p in target.rglob("*")) == [
+        "__init__.py",
+        "pkg",
+        "run.sh",
+    ]
+    assert stat.S_IMODE(os.stat(target / "run.sh").st_mode) == 0o755
+    assert os.listdir(tmp_path / "out") == ["project"]
+
+
+def test_writer_discards_tree_on_error(tmp_path):
+    """Test that an interrupted write leaves nothing behind."""
+    with pytest.raises(RuntimeError):
+        with ProjectWriter(tmp_path / "project") as writer:
+            write_tree(writer)
+            raise RuntimeError("interrupted")
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_writer_refuses_existing_target(tmp_path):
+    """Test that an existing directory is never replaced."""
+    target = tmp_path / "project"
+
+    with pytest.raises(FileExistsError):
+        with ProjectWriter(target) as writer:
+            write_tree(writer)
+            target.mkdir()
+
+    assert os.listdir(tmp_path) == ["project"]
+    assert os.listdir(target) == []
+
+
+def test_writer_fsync_policies(tmp_path):
+    """Test how often each policy flushes to disk."""
+    counts = {}
+    for fsync in FSYNC_POLICIES:
+        with patch("os.fsync") as mock_fsync:
+            with ProjectWriter(tmp_path / fsync, fsync) as writer:
+                write_tree(writer)
+        counts[fsync] = mock_fsync.call_count
+
+    # Two files, two directories and the parent directory after the rename
+    assert counts == {"none": 0, "end": 5, "per-file": 5}
+
+
+def test_writer_rejects_unknown_policy(tmp_path):
+    """Test that an unknown fsync policy is rejected."""
+    with pytest.raises(ValueError, match="Unsupported fsync policy"):
+        ProjectWriter(tmp_path / "project", "always")
+
+
+def test_write_file_atomic_keeps_mode(tmp_path):
+    """Test that a file is replaced with its permission bits kept."""
+    path = tmp_path / "run.sh"
+    path.write_text("old\n")
+    path.chmod(0o755)
+
+    write_file_atomic(path, b"new\n", fsync=True)
+
+    assert path.read_text() == "new\n"
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o755
+    assert os.listdir(tmp_path) == ["run.sh"]
+
+
+def test_generate_project_is_atomic(engine, tmp_path):
+    """Test that a failed generation leaves no partial project."""
+    with patch.object(engine, "render_file", side_effect=RuntimeError("boom")):
+        with pytest.raises(RuntimeError):
+            engine.generate_project(TEMPLATE_NAME, tmp_path, CONTEXT)
+
+    assert [p for p in os.listdir(tmp_path) if p != "cache"] == []
+
+    project_dir = engine.generate_project(TEMPLATE_NAME, tmp_path, CONTEXT, fsync="end")
+    assert (project_dir / MANIFEST_FILE).is_file()